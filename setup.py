@@ -33,7 +33,6 @@ setup(name='robotframework-oxygen',
       license='MIT',
       install_requires=[
            'robotframework>=3.0.4',
-           'junitparser==2.0',
            'PyYAML>=3.13',
            'pydantic>=2.4.2'
       ],
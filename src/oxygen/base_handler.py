@@ -1,11 +1,40 @@
 import re
 
+from concurrent.futures import Future
+from functools import lru_cache
 from inspect import signature, Parameter
 
-from .errors import MismatchArgumentException
+from .cache import ConversionCache
+from .errors import InvalidConfigurationException, MismatchArgumentException
+from .oxygen_handler_result import read_oxygen_suite
 from .robot_interface import (RobotInterface, get_keywords_from,
                               set_special_keyword)
-from .utils import validate_with_deprecation_warning
+from .utils import (DEFAULT_VALIDATION_SAMPLE_SIZE, VALIDATION_MODES,
+                    validate_as_read, validate_with_deprecation_warning)
+
+
+@lru_cache(maxsize=4096)
+def normalize_keyword_name(keyword_name):
+    '''
+    keyword_name: The raw keyword name (suite.subsuite.test.My Keyword)
+    '''
+    short_name = str(keyword_name).split('.')[-1].strip()
+    underscored = re.sub(r' +', '_', short_name)
+    return underscored.lower()
+
+
+def inject_suite_reports(suite, reports):
+    '''Add result suites to `suite` in place of the tests they replace, in
+    one pass over the tests of `suite`
+
+    reports: List of `(test, result_suite)` pairs
+    '''
+    replaced = set()
+    for test, result_suite in reports:
+        suite.suites.append(result_suite)
+        replaced.add(id(test))
+    suite.tests = [t for t in suite.tests if id(t) not in replaced]
+
 
 class BaseHandler(object):
     DEFAULT_CLI = {tuple(['result_file']): {}}
@@ -18,6 +47,8 @@ class BaseHandler(object):
         '''
         self._interface = RobotInterface()
         self._config = config
+        self._cache = ConversionCache()
+        self._parsed_results = {}
 
         tags = self._config.get('tags', [])
         if not isinstance(tags, list):
@@ -26,6 +57,20 @@ class BaseHandler(object):
         self.keyword = self._normalize_keyword_name(self._config['keyword'])
         self.run_time_data = None
 
+        self.validation = self._config.get('validation', 'full')
+        self.validation_sample_size = self._config.get(
+            'validation_sample_size', DEFAULT_VALIDATION_SAMPLE_SIZE)
+        if self.validation not in VALIDATION_MODES:
+            raise InvalidConfigurationException(
+                f'Invalid validation "{self.validation}", expected one of: '
+                f'{", ".join(VALIDATION_MODES)}')
+        if (not isinstance(self.validation_sample_size, int)
+                or self.validation_sample_size < 1):
+            raise InvalidConfigurationException(
+                'Invalid validation_sample_size '
+                f'"{self.validation_sample_size}", expected a positive '
+                'integer')
+
     def cli(self):
         '''
         augment in subclasses
@@ -54,30 +99,74 @@ class BaseHandler(object):
             keyword_name = self._normalize_keyword_name(keyword.name)
             if not (keyword_name == self.keyword):
                 continue
+            self._replace_test(test, data, test_keywords, curr)
 
-            self.run_time_data = data[test.longname]
-            # ALL keywords, setup or not, preceding the trigger will be treated
-            # as setup keywords later. Same goes for keywords succeeding the
-            # trigger; they will become teardown keywords.
-            setup_keywords = test_keywords[:curr]
-            teardown_keywords = test_keywords[(curr+1):]
-
-            self._report_oxygen_run(keyword, setup_keywords, teardown_keywords)
+    def _replace_test(self, test, data, test_keywords, curr, batch=None):
+        '''Replace `test` with the results of its trigger keyword
 
-
-    def _report_oxygen_run(self, keyword, setup_keywords, teardown_keywords):
+        test_keywords: The keywords directly under `test`
+        curr: Index of the trigger keyword in `test_keywords`
+        batch: Optional list the test and its results are added to, for
+               `inject_suite_reports` to replace all tests of the suite at
+               once, instead of replacing the test right away
+        '''
+        self.run_time_data = data[test.longname]
+        # ALL keywords, setup or not, preceding the trigger will be treated
+        # as setup keywords later. Same goes for keywords succeeding the
+        # trigger; they will become teardown keywords.
+        setup_keywords = test_keywords[:curr]
+        teardown_keywords = test_keywords[(curr+1):]
+
+        self._report_oxygen_run(test_keywords[curr],
+                                setup_keywords,
+                                teardown_keywords,
+                                batch=batch)
+
+    def parse_test_results(self, test, data, submit=None):
+        '''Parse results of a test that used the keyword of this handler
+        right after it has run, so that they are ready when the test is
+        replaced in the output
+
+        test: A Robot test, running or result
+        data: Run time data of tests by their long names
+        submit: Optional callable that schedules parsing the given run time
+                data, for example in a pool, and returns a Future of the
+                results
+        '''
+        for keyword in get_keywords_from(test):
+            if self._normalize_keyword_name(keyword.name) == self.keyword:
+                self._start_parsing(test, data, submit)
+                return
+
+    def _start_parsing(self, test, data, submit=None):
+        '''Failures are kept in place of the results and raised when the
+        test is replaced'''
+        run_time_data = data[test.longname]
+        try:
+            if submit is None:
+                results = self._read_run_time_data(run_time_data)
+            else:
+                results = submit(run_time_data)
+        except Exception as e:
+            results = Future()
+            results.set_exception(e)
+        self._parsed_results[test.longname] = results
+
+    def _report_oxygen_run(self, keyword, setup_keywords, teardown_keywords,
+                           batch=None):
         '''
         keyword: The trigger keyword for this handler
         setup_keywords: The keywords preceding the trigger
         teardown_keywords: The keywords succeeding the trigger
+        batch: See `_replace_test`
         '''
         # Wrap setup- and teardown keywords as a single keyword
         setup_keyword = None
         teardown_keyword = None
 
         if setup_keywords:
-            setup_start = setup_keywords[0].starttime
-            setup_end = setup_keywords[-1].endtime
+            setup_start, setup_end = self._interface.result.get_time_span(
+                *setup_keywords)
             setup_keyword = self._interface.result.create_wrapper_keyword(
                 'Oxygen Setup',
                 setup_start,
@@ -86,8 +175,8 @@ class BaseHandler(object):
                 *setup_keywords)
 
         if teardown_keywords:
-            teardown_start = teardown_keywords[0].starttime
-            teardown_end = teardown_keywords[-1].endtime
+            teardown_start, teardown_end = \
+                self._interface.result.get_time_span(*teardown_keywords)
             teardown_keyword = self._interface.result.create_wrapper_keyword(
                 'Oxygen Teardown',
                 teardown_start,
@@ -95,36 +184,68 @@ class BaseHandler(object):
                 False,
                 *teardown_keywords)
 
-        self._build_results(keyword, setup_keyword, teardown_keyword)
+        self._build_results(keyword, setup_keyword, teardown_keyword,
+                            batch=batch)
 
-    def _build_results(self, keyword, setup_keyword, teardown_keyword):
+    def _build_results(self, keyword, setup_keyword, teardown_keyword,
+                       batch=None):
         '''
         keyword: The trigger keyword
         setup_keyword: The special oxygen setup wrapper
         teardown_keyword: The special oxygen teardown wrapper
+        batch: See `_replace_test`
+        '''
+        test = keyword.parent
+        test_results = self._parsed_results.pop(test.longname, None)
+        if isinstance(test_results, Future):
+            test_results = test_results.result()
+        if test_results is None:
+            test_results = self._parse_run_time_data(self.run_time_data)
+
+        _, result_suite = self._interface.result.build_suite(
+            100000, test_results)
+
+        if not result_suite:
+            return
+
+        self._set_suite_tags(result_suite, *(self._tags + list(test.tags)))
+
+        if setup_keyword:
+            set_special_keyword(result_suite, 'setup', setup_keyword)
+
+        if teardown_keyword:
+            set_special_keyword(result_suite, 'teardown', teardown_keyword)
+
+        self._inject_suite_report(test, result_suite, batch)
+
+    def _parse_run_time_data(self, run_time_data):
+        '''Parse results with the data the keyword of this handler returned
+
+        Return: Results that are validated, and cached, as they are read, or
+                cached ones if the cache has them
         '''
         accepted_params = signature(self.parse_results).parameters
         accepted_params_max = len(accepted_params)
         accepted_params_min = len([
             n for n, v in accepted_params.items()
             if v.default == Parameter.empty])
-        is_multiple_inputs = isinstance(self.run_time_data, tuple)
+        is_multiple_inputs = isinstance(run_time_data, tuple)
 
         # there are multiple inputs and in the range of accepted min and max
         if is_multiple_inputs and (accepted_params_min <= len(
-                self.run_time_data) <= accepted_params_max):
-            test_results = self.parse_results(*self.run_time_data)
+                run_time_data) <= accepted_params_max):
+            parse_args = run_time_data
 
         # there is single input and one required, also can be more non-required
         elif not is_multiple_inputs and accepted_params_min == 1:
-            test_results = self.parse_results(self.run_time_data)
+            parse_args = (run_time_data,)
 
         # else if there are multiple inputs and not in the range of accepted
         elif is_multiple_inputs:
             raise MismatchArgumentException(
                 f'parse_results expects at least {accepted_params_min} and'
                 f' at most {accepted_params_max} arguments '
-                f'but got {len(self.run_time_data)}')
+                f'but got {len(run_time_data)}')
 
         # at this point there could be only multiple required and single input
         else:
@@ -132,48 +253,55 @@ class BaseHandler(object):
                 f'parse_results expects at least {accepted_params_min} '
                 'arguments but got 1')
 
-        self._validate(test_results)
-
-        _, result_suite = self._interface.result.build_suite(
-            100000, test_results)
-
-        if not result_suite:
-            return
-
-        test = keyword.parent
-        self._set_suite_tags(result_suite, *(self._tags + list(test.tags)))
+        # results are validated when read; cached results were valid
+        return self._cache.parse(self.parse_results,
+                                 self._validate_as_read,
+                                 *parse_args,
+                                 validation=self.validation,
+                                 sample_size=self.validation_sample_size)
 
-        if setup_keyword:
-            set_special_keyword(result_suite, 'setup', setup_keyword)
+    def _read_run_time_data(self, run_time_data):
+        '''Parse results and read them in full, so that lazily produced
+        results are not left to be parsed when they are built
 
-        if teardown_keyword:
-            set_special_keyword(result_suite, 'teardown', teardown_keyword)
+        Return: Validated results with child suites and test cases in lists
+        '''
+        return read_oxygen_suite(self._parse_run_time_data(run_time_data))
 
-        self._inject_suite_report(test, result_suite)
+    def _validate_as_read(self, oxygen_result_dict, cache_entry=None):
+        return validate_as_read(oxygen_result_dict,
+                                self,
+                                self.validation,
+                                self.validation_sample_size,
+                                cache_entry)
 
     def _validate(self, oxygen_result_dict):
-        validate_with_deprecation_warning(oxygen_result_dict, self)
+        return validate_with_deprecation_warning(oxygen_result_dict,
+                                                 self,
+                                                 self.validation,
+                                                 self.validation_sample_size)
 
-    def _inject_suite_report(self, test, result_suite):
+    def _inject_suite_report(self, test, result_suite, batch=None):
         '''Add the given suite to the parent suite of the test case.
 
         This also filters out the test case from the parent suite test cases.
+        With `batch`, both are left for the collector to do with
+        `inject_suite_reports` for all tests of the suite at once.
 
         test: Any Robot object part of the current test execution
         result_suite: Robot suite to report on
+        batch: Optional list the test and the suite are added to instead
         '''
-        suite = test.parent
-        new_tests = [t for t in suite.tests if t is not test]
-        suite.suites.append(result_suite)
-        suite.tests = new_tests
+        if batch is not None:
+            batch.append((test, result_suite))
+            return
+        inject_suite_reports(test.parent, [(test, result_suite)])
 
     def _normalize_keyword_name(self, keyword_name):
         '''
         keyword_name: The raw keyword name (suite.subsuite.test.My Keyword)
         '''
-        short_name = str(keyword_name).split('.')[-1].strip()
-        underscored = re.sub(r' +', '_', short_name)
-        return underscored.lower()
+        return normalize_keyword_name(keyword_name)
 
     def _set_suite_tags(self, suite, *tags):
         suite.set_tags(tags)
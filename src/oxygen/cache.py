@@ -0,0 +1,268 @@
+import json
+import os
+import zlib
+
+from hashlib import blake2b
+from inspect import signature
+from pathlib import Path
+from tempfile import mkstemp
+from time import time
+
+from .version import VERSION
+
+
+class ConversionCache(object):
+    '''ConversionCache keeps validated handler results on disk so that
+    converting an unchanged result file again does not parse it again.
+
+    Entries are keyed by the handler class, its configuration, the content of
+    the result files and the other arguments given to the handler, how the
+    results were validated, and Oxygen version. They are stored as
+    zlib-compressed JSON, written as the results are read (see
+    `CacheEntry`), and the least recently used entries are evicted when the
+    cache grows over `max_size` bytes.
+
+    Defaults can be changed with environment variables:
+    ``OXYGEN_CACHE_DIR``, ``OXYGEN_CACHE_SIZE`` (in megabytes) and
+    ``OXYGEN_NO_CACHE``.
+    '''
+
+    SUFFIX = '.json.z'
+    DEFAULT_MAX_SIZE = 256 * 2**20
+    ABANDONED_AGE = 24 * 60 * 60  # seconds
+    FORMAT = 2  # entries are lines of `[pointer, item]`, see CacheEntry
+
+    def __init__(self, directory=None, max_size=None, enabled=None):
+        self.directory = Path(directory or self._default_directory())
+        if max_size is None:
+            max_size = (float(os.environ['OXYGEN_CACHE_SIZE']) * 2**20
+                        if os.environ.get('OXYGEN_CACHE_SIZE')
+                        else self.DEFAULT_MAX_SIZE)
+        self.max_size = int(max_size)
+        if enabled is None:
+            enabled = not os.environ.get('OXYGEN_NO_CACHE')
+        self.enabled = enabled
+
+    def _default_directory(self):
+        if os.environ.get('OXYGEN_CACHE_DIR'):
+            return os.environ['OXYGEN_CACHE_DIR']
+        cache_home = (os.environ.get('XDG_CACHE_HOME')
+                      or Path.home() / '.cache')
+        return Path(cache_home) / 'oxygen'
+
+    def parse(self, parse_results, read, *args, validation='full',
+              sample_size=None, **kwargs):
+        '''Return `parse_results(*args, **kwargs)` from the cache or, on a
+        miss, by calling it.
+
+        parse_results: A handler's `parse_results` method
+        read: Callable given fresh results and the `CacheEntry` to write
+              them into, or None if they cannot be cached. It returns the
+              results to use and commits the entry once the results have
+              been read and found valid; only valid results are cached.
+        validation: The validation mode `read` validates the results with;
+                    results validated only partly are not returned when
+                    they are to be validated fully
+        sample_size: How many test cases `sample` validation validates
+        '''
+        key = self.key(parse_results, *args, validation=validation,
+                       sample_size=sample_size, **kwargs)
+        if key is not None:
+            results = self.get(key)
+            if results is not None:
+                return results
+        results = parse_results(*args, **kwargs)
+        return read(results, None if key is None else CacheEntry(self, key))
+
+    def key(self, parse_results, *args, validation='full', sample_size=None,
+            **kwargs):
+        '''Return: The cache key for the call or None if it is not cacheable
+
+        Calls are cacheable only for handler methods, and only when at least
+        one argument is a result file and every argument can be serialized
+        to JSON.
+        '''
+        handler = getattr(parse_results, '__self__', None)
+        if not self.enabled or handler is None:
+            return None
+        try:
+            bound = signature(parse_results).bind(*args, **kwargs)
+        except TypeError:
+            return None
+        arguments = {}
+        has_result_file = False
+        for name, value in bound.arguments.items():
+            path = self._existing_path(value)
+            if path is None:
+                arguments[name] = value
+            elif path.is_file():
+                arguments[name] = {'content': self._hash_file(path)}
+                has_result_file = True
+            else:  # directories change without their path changing
+                return None
+        if not has_result_file:
+            return None
+        try:
+            identity = json.dumps(
+                [VERSION,
+                 self.FORMAT,
+                 f'{type(handler).__module__}.{type(handler).__qualname__}',
+                 getattr(handler, '_config', None),
+                 arguments,
+                 [validation,
+                  sample_size if validation == 'sample' else None]],
+                sort_keys=True)
+        except TypeError:
+            return None
+        return blake2b(identity.encode('utf-8'), digest_size=20).hexdigest()
+
+    def _existing_path(self, value):
+        if not isinstance(value, (str, Path)):
+            return None
+        try:
+            path = Path(value)
+            return path if path.exists() else None
+        except (OSError, ValueError):  # not a path at all
+            return None
+
+    def _hash_file(self, path):
+        digest = blake2b()
+        with open(path, 'rb') as result_file:
+            for chunk in iter(lambda: result_file.read(2**20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.directory / f'{key}{self.SUFFIX}'
+
+    def get(self, key):
+        '''Return: Cached results for `key` or None'''
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as entry:
+                results = CacheEntry.assemble(
+                    json.loads(line) for line in
+                    zlib.decompress(entry.read()).splitlines())
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, IndexError, KeyError,
+                zlib.error):
+            self._remove(path)
+            return None
+        return results
+
+    def put(self, key, results):
+        entry = CacheEntry(self, key)
+        entry.add('', results)
+        entry.commit()
+
+    def evict(self):
+        '''Remove least recently used entries until the cache fits into
+        `max_size`, and entries that were never finished'''
+        entries = []
+        for path in self.directory.glob(f'*{self.SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+        abandoned = time() - self.ABANDONED_AGE
+        for path in self.directory.glob('*.tmp'):
+            try:
+                if path.stat().st_mtime < abandoned:
+                    self._remove(path)
+            except OSError:
+                continue
+
+    def clear(self):
+        for path in self.directory.glob(f'*{self.SUFFIX}'):
+            self._remove(path)
+
+    def _remove(self, path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class CacheEntry(object):
+    '''CacheEntry writes results into the cache as they are read, so that
+    lazily produced results never need to be in memory all at once.
+
+    Every suite without its child suites and test cases, and every test
+    case, is added with a JSON pointer to where it is in the results, and
+    written out as a line of JSON. A suite is added before what is in it.
+    The entry appears in the cache only when committed.
+    '''
+
+    def __init__(self, cache, key):
+        self._cache = cache
+        self._key = key
+        self._file = None
+        self._tmp_path = None
+        self._compressor = None
+        self._failed = False
+
+    def add(self, pointer, item):
+        if self._failed:
+            return
+        try:
+            line = json.dumps([pointer, item], separators=(',', ':'))
+        except (TypeError, ValueError):  # not JSON, cannot be cached
+            self.discard()
+            return
+        try:
+            if self._file is None:
+                self._cache.directory.mkdir(parents=True, exist_ok=True)
+                fd, self._tmp_path = mkstemp(dir=self._cache.directory,
+                                             suffix='.tmp')
+                self._file = os.fdopen(fd, 'wb')
+                self._compressor = zlib.compressobj(1)
+            self._file.write(self._compressor.compress(
+                line.encode() + b'\n'))
+        except OSError:
+            self.discard()  # cache is best effort; conversion succeeds anyway
+
+    def commit(self):
+        if self._failed or self._file is None:
+            return
+        try:
+            self._file.write(self._compressor.flush())
+            self._file.close()
+            os.replace(self._tmp_path, self._cache._path(self._key))
+        except OSError:
+            self.discard()
+            return
+        self._file = None
+        self._cache.evict()
+
+    def discard(self):
+        self._failed = True
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._cache._remove(Path(self._tmp_path))
+
+    @staticmethod
+    def assemble(records):
+        '''Return: Results put together from `[pointer, item]` records'''
+        results = None
+        for pointer, item in records:
+            if not pointer:
+                results = item
+                continue
+            parts = pointer.split('/')[1:]
+            suite = results
+            for key, index in zip(parts[:-2:2], parts[1:-2:2]):
+                suite = suite[key][int(index)]
+            suite.setdefault(parts[-2], []).append(item)
+        if results is None:
+            raise ValueError('Cache entry without results')
+        return results
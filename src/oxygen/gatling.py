@@ -1,12 +1,26 @@
+import mmap
+import os
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 from robot.api import logger
+from yaml import safe_load, YAMLError
 
 from .base_handler import BaseHandler
 from .errors import GatlingHandlerException, SubprocessException
+from .gatling_binary import BinaryLogReader, is_binary_log
+from .response_times import ResponseTimeAssertion, ResponseTimeStatistics
 from .utils import run_command_line, validate_path
 
 class GatlingHandler(BaseHandler):
 
-    def run_gatling(self, result_file, command, check_return_code=False, **env):
+    AGGREGATE_BY = ('scenario', 'group')
+    CHUNK_SIZE = 16 * 2**20
+    MIN_PARALLEL_SIZE = 4 * 2**20
+
+    def run_gatling(self, result_file, command, check_return_code=False,
+                    assertions=None, **env):
         '''Run Gatling performance testing tool specified with ``command``.
 
         ``result_file`` is path to the file ``oxygen`` uses to parse the results.
@@ -24,6 +38,11 @@ class GatlingHandler(BaseHandler):
         debug why the test tool is failing for other reasons than failing test
         execution.
 
+        ``assertions`` are checked instead of the ``assertions`` in the
+        configuration. They are a list of assertions like in the
+        configuration, or the same as a YAML or JSON string, for example
+        ``[{p95: 500}, {request: Search, error_rate: 1}]``.
+
         ``env`` is used to pass environment variables that are set in the subshell
         the ``command`` is run in.
         '''
@@ -33,12 +52,45 @@ class GatlingHandler(BaseHandler):
             raise GatlingHandlerException(e)
         logger.info(output)
         logger.info('Result file: {}'.format(result_file))
+        if assertions is not None:
+            return result_file, False, None, assertions
         return result_file
 
-    def parse_results(self, result_file):
-        return self._transform_tests(validate_path(result_file).resolve())
+    def cli(self):
+        cli_interface = self.DEFAULT_CLI.copy()
+        cli_interface[('--aggregate',)] = {
+            'help': 'Report statistics of requests with the same name as '
+                    'one test case instead of every request as its own',
+            'action': 'store_true'
+        }
+        cli_interface[('--aggregate-by',)] = {
+            'help': 'Tell apart requests with the same name also by '
+                    'scenario or group when aggregating. Can be given '
+                    'twice',
+            'action': 'append',
+            'choices': self.AGGREGATE_BY
+        }
+        cli_interface[('--assertions',)] = {
+            'help': 'Check these assertions, given in YAML or JSON, '
+                    'instead of the configured ones'
+        }
+        return cli_interface
+
+    def parse_results(self, result_file, aggregate=False, aggregate_by=None,
+                      assertions=None):
+        result_file = validate_path(result_file).resolve()
+        assertions = self._assertions(
+            self._config.get('assertions') if assertions is None
+            else assertions)
+        if aggregate or self._config.get('aggregate', False):
+            return self._aggregate_tests(
+                result_file,
+                self._aggregate_by(aggregate_by
+                                   or self._config.get('aggregate_by')),
+                assertions)
+        return self._transform_tests(result_file, assertions)
 
-    def _transform_tests(self, result_file):
+    def _transform_tests(self, result_file, assertions=()):
         '''Given the result_file path, open the test results and get a suite
         dict.
 
@@ -46,43 +98,520 @@ class GatlingHandler(BaseHandler):
         Here be dragons.
 
         result_file: The path to the Gatling results
+        assertions: `ResponseTimeAssertion`s checked after all requests
+
+        Return: The suite dict, with test cases read from `result_file`
+                lazily
         '''
-        test_cases = []
-        with open(result_file) as results:
-            result_contents = results.readlines()
-        for line in result_contents:
-            columns = line.strip().split('\t')
-            if len(columns) < 8:
-                continue
-            step_name = columns[4]
-            status = columns[7]
-            if status not in ['OK', 'KO']:
-                continue
-            message = ''
-            if len(columns) > 8:
-                message = columns[8]
+        test_suite = {
+            'name': 'Gatling Scenario',
+            'tags': self._tags,
+            'tests': self._transform_test_cases(result_file, assertions),
+        }
 
-            keyword = {
-                    'name': ' | '.join(columns),
-                    'pass': True,
-                    'messages': [],
-                }
+        run_start = self._run_start(result_file)
+        if run_start is not None:
+            test_suite['start'] = run_start
+
+        return test_suite
+
+    def _aggregate_by(self, aggregate_by):
+        if not aggregate_by:
+            return ()
+        if isinstance(aggregate_by, str):
+            aggregate_by = [aggregate_by]
+        unknown = [key for key in aggregate_by if key not in self.AGGREGATE_BY]
+        if unknown:
+            raise GatlingHandlerException(
+                f'Cannot aggregate by {", ".join(map(str, unknown))}; '
+                f'expected {" or ".join(self.AGGREGATE_BY)}')
+        return tuple(key for key in self.AGGREGATE_BY if key in aggregate_by)
+
+    def _assertions(self, items):
+        '''Return: `ResponseTimeAssertion`s of `items`, a list of assertion
+        mappings or the same as a YAML or JSON string'''
+        if isinstance(items, str):
+            try:
+                items = safe_load(items)
+            except YAMLError as e:
+                raise GatlingHandlerException(f'Invalid assertions: {e}')
+            if items is not None and not isinstance(items, list):
+                items = [items]
+        assertions = []
+        for item in items or ():
+            if not isinstance(item, dict):
+                raise GatlingHandlerException(
+                    f'Assertion must be a mapping, not "{item}"')
+            request = item.get('request')
+            window = item.get('window')
+            metrics = {metric: limit for metric, limit in item.items()
+                       if metric not in ('request', 'window')}
+            if not metrics or (window is not None
+                               and 'throughput' not in metrics):
+                raise GatlingHandlerException(
+                    f'Assertion {item} must have a metric, and a window '
+                    'only with throughput')
+            try:
+                assertions.extend(
+                    ResponseTimeAssertion(
+                        metric, limit, request,
+                        window if metric == 'throughput' else None)
+                    for metric, limit in metrics.items())
+            except ValueError as e:
+                raise GatlingHandlerException(f'Invalid assertion: {e}')
+        return assertions
 
-            if status == 'KO':
-                keyword['pass'] = False
-                keyword['messages'].append(message)
+    def _assertion_collectors(self, assertions):
+        '''Return: Empty `ResponseTimeStatistics` for every request name and
+        throughput window checked by `assertions`'''
+        return {(assertion.request, assertion.window):
+                ResponseTimeStatistics(assertion.window)
+                for assertion in assertions}
 
+    def _collect(self, collectors, name, request):
+        for (request_name, _), statistics in collectors.items():
+            if request_name is None or request_name == name:
+                statistics.add(*request)
+
+    def _assertion_test_cases(self, assertions, collectors):
+        for assertion in assertions:
+            statistics = collectors[(assertion.request, assertion.window)]
+            passed, message = assertion.check(statistics)
+            keyword = {
+                'name': 'Check SLA',
+                'pass': passed,
+                'messages': [message],
+            }
             test_case = {
-                'name': step_name,
+                'name': f'SLA: {assertion.name}',
                 'keywords': [keyword]
             }
+            if statistics.count:
+                keyword['start'] = statistics.start
+                keyword['elapsed'] = statistics.end - statistics.start
+                test_case['start'] = statistics.start
+            yield test_case
+
+    def _aggregate_tests(self, result_file, aggregate_by, assertions=()):
+        '''Given the result_file path, read it once and get a suite dict with
+        one test case per request name, group and error message.
+
+        Response times are collected with `ResponseTimeStatistics`, so memory
+        use grows with the number of distinct names, not requests. With
+        `jobs` configured, large files are read in parts in parallel.
 
-            test_cases.append(test_case)
+        result_file: The path to the Gatling results
+        aggregate_by: Which of `AGGREGATE_BY` tell apart requests with the
+                      same name
+        assertions: `ResponseTimeAssertion`s checked after all requests
+
+        Return: The suite dict, with statistics of all requests as its
+                metadata
+        '''
+        aggregation = self._aggregate(result_file, aggregate_by,
+                                      list(self._assertion_collectors(
+                                          assertions)))
 
         test_suite = {
             'name': 'Gatling Scenario',
             'tags': self._tags,
-            'tests': test_cases,
+            'metadata': aggregation.total.metadata(),
+            'tests': [self._aggregated_test_case(name, stats)
+                      for name, stats in aggregation.statistics.items()]
+                     + [self._aggregated_error(message, count, timestamp)
+                        for message, (count, timestamp)
+                        in aggregation.errors.items()]
+                     + list(self._assertion_test_cases(
+                         assertions, aggregation.collectors)),
         }
-
+        run_start = aggregation.run_start
+        if run_start is None:
+            run_start = aggregation.total.start
+        if run_start is not None:
+            test_suite['start'] = run_start
         return test_suite
+
+    def _jobs(self):
+        jobs = self._config.get('jobs', 1)
+        if isinstance(jobs, bool) or not isinstance(jobs, int) or jobs < 1:
+            raise GatlingHandlerException(
+                f'jobs must be a positive integer, not "{jobs}"')
+        return jobs
+
+    def _aggregate(self, result_file, aggregate_by, collector_keys):
+        '''Return: `GatlingAggregation` of all records in `result_file`,
+        read in `_chunks` by a pool of `jobs` processes if there are several
+        '''
+        jobs = self._jobs()
+        chunks = self._chunks(result_file, jobs) if jobs > 1 else []
+        if len(chunks) < 2:
+            return self._aggregate_records(self._read_records(result_file),
+                                           aggregate_by, collector_keys)
+        aggregation = GatlingAggregation(collector_keys)
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        try:
+            # merged in file order, so that the results do not depend on
+            # which part was read first
+            pending = deque()
+            for start, end in chunks:
+                pending.append(pool.submit(_aggregate_in_worker,
+                                           self._config,
+                                           str(result_file),
+                                           start,
+                                           end,
+                                           aggregate_by,
+                                           collector_keys))
+                if len(pending) >= 2 * jobs:
+                    aggregation.merge(pending.popleft().result())
+            while pending:
+                aggregation.merge(pending.popleft().result())
+        finally:
+            pool.shutdown(cancel_futures=True)
+        return aggregation
+
+    def _chunks(self, result_file, jobs):
+        '''Return: `result_file` split into byte ranges of whole lines, at
+        most `CHUNK_SIZE` bytes each unless a line is longer, or no ranges
+        if the file is smaller than `MIN_PARALLEL_SIZE` or binary, which has
+        no lines'''
+        size = os.path.getsize(result_file)
+        if size < self.MIN_PARALLEL_SIZE or is_binary_log(result_file):
+            return []
+        chunk_size = min(self.CHUNK_SIZE, -(-size // jobs))
+        boundaries = [0]
+        with open(result_file, 'rb') as results:
+            for offset in range(chunk_size, size, chunk_size):
+                if offset <= boundaries[-1]:  # inside a very long line
+                    continue
+                results.seek(offset - 1)
+                results.readline()
+                boundary = results.tell()
+                if boundary >= size:
+                    break
+                boundaries.append(boundary)
+        boundaries.append(size)
+        return list(zip(boundaries, boundaries[1:]))
+
+    def _aggregate_range(self, result_file, start, end, aggregate_by,
+                         collector_keys):
+        with open(result_file, 'rb') as results:
+            results.seek(start)
+            lines = results.read(end - start).decode('utf-8', 'replace')
+        records = (line.strip().split('\t') for line in lines.split('\n'))
+        # every KO message of a part is counted, because which ones are
+        # counted in the end depends on the parts before it
+        return self._aggregate_records(records, aggregate_by, collector_keys,
+                                       max_messages=None)
+
+    def _aggregate_records(self, records, aggregate_by, collector_keys,
+                           max_messages=ResponseTimeStatistics.MAX_MESSAGES):
+        aggregation = GatlingAggregation(collector_keys, max_messages)
+        for columns in records:
+            record_type = columns[0]
+            if record_type == 'RUN':
+                if aggregation.run_start is None:
+                    aggregation.run_start = self._parse_run_start(columns)
+            elif record_type == 'ERROR':
+                self._aggregate_error(aggregation, columns)
+            elif record_type == 'GROUP':
+                self._aggregate_group(aggregation, columns, aggregate_by)
+            elif record_type != 'USER':
+                self._aggregate_request(aggregation, columns, aggregate_by)
+        return aggregation
+
+    def _aggregate_request(self, aggregation, columns, aggregate_by):
+        '''Add a REQUEST record to the statistics of its name, to the
+        total and to collectors of assertions checking it'''
+        parsed = self._parse_request(columns)
+        if parsed is None:
+            return
+        group, name, request = parsed
+        keys = {'scenario': self._scenario(columns), 'group': group}
+        key = ' / '.join([keys[key] for key in aggregate_by if keys[key]]
+                         + [name])
+        aggregation.statistics_of(key).add(*request)
+        aggregation.total.add(*request)
+        self._collect(aggregation.collectors, name, request)
+
+    def _aggregate_group(self, aggregation, columns, aggregate_by):
+        fields = self._group_fields(columns)
+        if fields is None:
+            return
+        hierarchy, start, end, status = fields
+        start, end = self._parse_time(start), self._parse_time(end)
+        if start is None or end is None:
+            return
+        scenario = self._scenario(columns)
+        name = f'Group {hierarchy}'
+        if 'scenario' in aggregate_by and scenario:
+            name = f'{scenario} / {name}'
+        aggregation.statistics_of(name).add(start, end, status == 'OK')
+
+    def _aggregate_error(self, aggregation, columns):
+        # ERROR, message, timestamp
+        message = columns[1] if len(columns) > 1 else ''
+        timestamp = self._parse_time(columns[2] if len(columns) > 2 else '')
+        aggregation.add_error(message, 1, timestamp)
+
+    def _aggregated_test_case(self, name, statistics):
+        return {
+            'name': name,
+            'start': statistics.start,
+            'keywords': [{
+                'name': 'Response times',
+                'pass': statistics.ko_count == 0,
+                'start': statistics.start,
+                'elapsed': statistics.end - statistics.start,
+                'messages': statistics.summary(),
+            }]
+        }
+
+    def _aggregated_error(self, message, count, timestamp):
+        keyword = {
+            'name': 'Errors',
+            'pass': False,
+            'messages': [f'Errors: {count}', message],
+        }
+        test_case = {
+            'name': f'ERROR: {message}',
+            'keywords': [keyword]
+        }
+        if timestamp is not None:
+            keyword['start'] = timestamp
+            keyword['elapsed'] = 0
+            test_case['start'] = timestamp
+        return test_case
+
+    def _read_lines(self, result_file):
+        '''Yield lines of `result_file` one at a time, through `mmap` if
+        the handler is configured with `mmap: true`'''
+        if self._config.get('mmap', False) and os.path.getsize(result_file):
+            with open(result_file, 'rb') as results, \
+                    mmap.mmap(results.fileno(), 0,
+                              access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b''):
+                    yield line.decode('utf-8', 'replace')
+            return
+        with open(result_file, encoding='utf-8', errors='replace') as results:
+            yield from results
+
+    def _read_records(self, result_file):
+        '''Yield columns of records in `result_file` one at a time, from a
+        text or binary simulation.log'''
+        if is_binary_log(result_file):
+            with open(result_file, 'rb') as results:
+                yield from BinaryLogReader(results).records()
+            return
+        for line in self._read_lines(result_file):
+            yield line.strip().split('\t')
+
+    def _transform_test_cases(self, result_file, assertions=()):
+        collectors = self._assertion_collectors(assertions)
+        for columns in self._read_records(result_file):
+            test_case = self._transform_record(columns)
+            if test_case is not None:
+                yield test_case
+            if collectors and columns[0] not in ('RUN', 'USER', 'GROUP',
+                                                 'ERROR'):
+                parsed = self._parse_request(columns)
+                if parsed is not None:
+                    self._collect(collectors, parsed[1], parsed[2])
+        yield from self._assertion_test_cases(assertions, collectors)
+
+    def _run_start(self, result_file):
+        '''Return: When the run started in milliseconds since the epoch,
+        from the RUN record that normally is on the first line, or the start
+        of the earliest request if there is none'''
+        earliest = None
+        for columns in self._read_records(result_file):
+            if columns[0] == 'RUN':
+                run_start = self._parse_run_start(columns)
+                if run_start is not None:
+                    return run_start
+                continue
+            fields = self._request_fields(columns)
+            if fields is None:
+                continue
+            start = self._parse_time(fields[2])
+            if start is not None and self._parse_time(fields[3]) is not None:
+                earliest = start if earliest is None else min(earliest, start)
+        return earliest
+
+    def _parse_run_start(self, columns):
+        # Gatling 2 has user defined and default simulation ids before the
+        # start time, later versions only one simulation id
+        for column in columns[4:5] + columns[3:4]:
+            run_start = self._parse_time(column)
+            if run_start is not None:
+                return run_start
+        return None
+
+    def _transform_record(self, columns):
+        '''Return: Test case dict for a REQUEST, GROUP or ERROR record, or
+        None for other records'''
+        record_type = columns[0]
+        if record_type in ('RUN', 'USER'):
+            return None
+        if record_type == 'GROUP':
+            return self._transform_group(columns)
+        if record_type == 'ERROR':
+            return self._transform_error(columns)
+        return self._transform_request(columns)
+
+    def _request_fields(self, columns):
+        '''Return: Group, name, start, end, status and message of a REQUEST
+        record, or None if `columns` is not one'''
+        # Gatling before 3.4 has scenario and user id after the record type
+        if len(columns) >= 8 and columns[7] in ('OK', 'KO'):
+            return columns[3:8] + [columns[8] if len(columns) > 8 else '']
+        if (columns[0] == 'REQUEST' and len(columns) >= 6
+                and columns[5] in ('OK', 'KO')):
+            return columns[1:6] + [columns[6] if len(columns) > 6 else '']
+        return None
+
+    def _parse_request(self, columns):
+        '''Return: Group and name of a REQUEST record, and its start, end,
+        whether it was OK and message as `ResponseTimeStatistics.add` takes
+        them, or None if `columns` is not a complete request'''
+        fields = self._request_fields(columns)
+        if fields is None:
+            return None
+        group, name, start, end, status, message = fields
+        start, end = self._parse_time(start), self._parse_time(end)
+        if start is None or end is None:
+            return None
+        return group, name, (start, end, status == 'OK', message)
+
+    def _scenario(self, columns):
+        '''Return: Scenario of a REQUEST or GROUP record from Gatling before
+        3.4, or an empty string for later versions, which do not log it'''
+        if len(columns) >= 8 and columns[7] in ('OK', 'KO'):
+            return columns[1]
+        return ''
+
+    def _transform_request(self, columns):
+        '''Return: Test case dict for a REQUEST record or None for others'''
+        fields = self._request_fields(columns)
+        if fields is None:
+            return None
+        _, step_name, start, end, status, message = fields
+        return self._test_case(step_name, columns, start, end, status,
+                               message)
+
+    def _transform_group(self, columns):
+        '''Return: Test case dict for a GROUP record, or None if it is
+        incomplete'''
+        fields = self._group_fields(columns)
+        if fields is None:
+            return None
+        hierarchy, start, end, status = fields
+        return self._test_case(f'Group {hierarchy}', columns, start, end,
+                               status, '')
+
+    def _group_fields(self, columns):
+        '''Return: Hierarchy, start, end and status of a GROUP record, or
+        None if it is incomplete'''
+        # GROUP, (scenario, user id,) hierarchy, start, end, cumulated
+        # response time, status
+        if len(columns) >= 8 and columns[7] in ('OK', 'KO'):
+            hierarchy, start, end, _, status = columns[3:8]
+        elif len(columns) >= 6 and columns[5] in ('OK', 'KO'):
+            hierarchy, start, end, _, status = columns[1:6]
+        else:
+            return None
+        return hierarchy, start, end, status
+
+    def _transform_error(self, columns):
+        '''Return: Failing test case dict for an ERROR record'''
+        # ERROR, message, timestamp
+        message = columns[1] if len(columns) > 1 else ''
+        timestamp = columns[2] if len(columns) > 2 else ''
+        return self._test_case(f'ERROR: {message}', columns, timestamp,
+                               timestamp, 'KO', message)
+
+    def _test_case(self, name, columns, start, end, status, message):
+        keyword = {
+                'name': ' | '.join(columns),
+                'pass': True,
+                'messages': [],
+            }
+
+        if status == 'KO':
+            keyword['pass'] = False
+            keyword['messages'].append(message)
+
+        test_case = {
+            'name': name,
+            'keywords': [keyword]
+        }
+
+        start = self._parse_time(start)
+        end = self._parse_time(end)
+        if start is not None and end is not None:
+            keyword['start'] = start
+            keyword['elapsed'] = max(end - start, 0)
+            test_case['start'] = start
+
+        return test_case
+
+    def _parse_time(self, column):
+        '''Return: Milliseconds since the epoch in `column` or None'''
+        try:
+            return int(column)
+        except ValueError:
+            return None
+
+
+class GatlingAggregation(object):
+    '''GatlingAggregation holds statistics of the records in one part of a
+    simulation.log: per request name, group and error message, of all
+    requests, and for assertions. Parts read in parallel are merged in file
+    order, so names keep the order they first appear in.
+
+    max_messages: How many distinct KO messages `ResponseTimeStatistics`
+                  count, None for all of them, like parts read in parallel do
+    '''
+
+    def __init__(self, collector_keys,
+                 max_messages=ResponseTimeStatistics.MAX_MESSAGES):
+        self.max_messages = max_messages
+        self.statistics = {}
+        self.errors = {}
+        self.total = ResponseTimeStatistics(max_messages=max_messages)
+        self.collectors = {key: ResponseTimeStatistics(key[1], max_messages)
+                           for key in collector_keys}
+        self.run_start = None
+
+    def statistics_of(self, name):
+        statistics = self.statistics.get(name)
+        if statistics is None:
+            statistics = self.statistics[name] = ResponseTimeStatistics(
+                max_messages=self.max_messages)
+        return statistics
+
+    def add_error(self, message, count, timestamp):
+        previous_count, first = self.errors.get(message, (0, None))
+        if first is None or (timestamp is not None and timestamp < first):
+            first = timestamp
+        self.errors[message] = (previous_count + count, first)
+
+    def merge(self, other):
+        '''Add statistics of the part of the log after this one'''
+        for name, statistics in other.statistics.items():
+            self.statistics_of(name).merge(statistics)
+        for message, (count, timestamp) in other.errors.items():
+            self.add_error(message, count, timestamp)
+        self.total.merge(other.total)
+        for key, statistics in other.collectors.items():
+            self.collectors[key].merge(statistics)
+        if self.run_start is None:
+            self.run_start = other.run_start
+
+
+def _aggregate_in_worker(config, result_file, start, end, aggregate_by,
+                         collector_keys):
+    '''Aggregate the records between bytes `start` and `end` of
+    `result_file` in a worker process of a handler with `jobs`'''
+    return GatlingHandler(config)._aggregate_range(result_file, start, end,
+                                                   aggregate_by,
+                                                   collector_keys)
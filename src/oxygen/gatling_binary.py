@@ -0,0 +1,188 @@
+'''Decoder for the binary simulation.log of newer Gatling versions.
+
+The log is a stream of records written with Java's `DataOutputStream`, so
+numbers are big-endian. Every record starts with a one byte record type:
+
+- RUN (0): Gatling version, simulation class name, start time (long,
+  milliseconds since the epoch), run description, scenario names (int count
+  and strings) and assertions (int count and byte arrays). It is always the
+  first record.
+- REQUEST (1): groups, name (cached string), start and end timestamps,
+  whether OK (boolean) and message (cached string)
+- USER (2): scenario (int index into scenario names of RUN), whether the
+  user started (boolean) and timestamp
+- GROUP (3): groups, start and end timestamps, cumulated response time (int)
+  and whether OK (boolean)
+- ERROR (4): message (cached string) and timestamp
+
+Timestamps are ints of milliseconds since the start of the run. Groups are
+an int count and cached strings. A string is an int byte length and, unless
+it is empty, its bytes and a coder byte: 0 for Latin-1, 1 for UTF-16. A
+cached string is an int index: a non-negative index is followed by a new
+string that later records refer to with the negated index.
+
+Records are turned into the columns of the tab separated simulation.log of
+Gatling 3.4 and later, so that both are parsed the same way.
+
+The format is not documented by Gatling and may change between its
+versions, so reading it is experimental.
+'''
+import struct
+
+from .errors import GatlingHandlerException
+
+# record headers like `RecordHeader` of Gatling's LogFileDataWriter
+RUN, REQUEST, USER, GROUP, ERROR = range(5)
+
+_INT = struct.Struct('>i')
+_LONG = struct.Struct('>q')
+_CODERS = {0: 'latin-1', 1: 'utf-16-le'}
+
+
+def is_binary_log(result_file):
+    '''Return: Whether `result_file` is a binary simulation.log, which starts
+    with a RUN record, unlike text logs that never start with a NUL byte'''
+    with open(result_file, 'rb') as log:
+        return log.read(1) == bytes([RUN])
+
+
+class _Truncated(Exception):
+    pass
+
+
+class BinaryLogReader(object):
+    '''BinaryLogReader reads records of a binary simulation.log from a
+    binary stream one at a time.
+
+    A log that ends in the middle of a record, because Gatling is still
+    writing it or was stopped, ends at the last complete record.
+    '''
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._position = 0
+        self._strings = {}
+        self._scenarios = []
+        self._run_start = 0
+
+    def records(self):
+        '''Yield: Columns of every record like in a text simulation.log'''
+        readers = {RUN: self._read_run,
+                   USER: self._read_user,
+                   REQUEST: self._read_request,
+                   GROUP: self._read_group,
+                   ERROR: self._read_error}
+        while True:
+            start = self._position
+            header = self._stream.read(1)
+            if not header:
+                return
+            self._position += 1
+            reader = readers.get(header[0])
+            if reader is None:
+                raise GatlingHandlerException(
+                    f'Unknown record type {header[0]} at byte {start} of '
+                    'binary simulation.log')
+            try:
+                yield reader()
+            except _Truncated:
+                return
+
+    def _read_run(self):
+        version = self._read_string()
+        simulation = self._read_string()
+        self._run_start = self._read_long()
+        description = self._read_string()
+        self._scenarios = [self._read_string()
+                           for _ in range(self._read_count())]
+        for _ in range(self._read_count()):  # assertions
+            self._read(self._read_count())
+        return ['RUN', simulation, '', str(self._run_start), description,
+                version]
+
+    def _read_user(self):
+        scenario = self._read_int()
+        started = self._read_boolean()
+        timestamp = self._read_timestamp()
+        if 0 <= scenario < len(self._scenarios):
+            scenario = self._scenarios[scenario]
+        return ['USER', str(scenario), 'START' if started else 'END',
+                timestamp, timestamp]
+
+    def _read_request(self):
+        groups = self._read_groups()
+        name = self._read_cached_string()
+        start = self._read_timestamp()
+        end = self._read_timestamp()
+        status = 'OK' if self._read_boolean() else 'KO'
+        message = self._read_cached_string()
+        columns = ['REQUEST', groups, name, start, end, status, message]
+        # like text logs, whose lines are stripped of an empty message
+        return columns if message else columns[:-1]
+
+    def _read_group(self):
+        groups = self._read_groups()
+        start = self._read_timestamp()
+        end = self._read_timestamp()
+        cumulated = self._read_int()
+        status = 'OK' if self._read_boolean() else 'KO'
+        return ['GROUP', groups, start, end, str(cumulated), status]
+
+    def _read_error(self):
+        message = self._read_cached_string()
+        return ['ERROR', message, self._read_timestamp()]
+
+    def _read(self, size):
+        data = self._stream.read(size)
+        if len(data) < size:
+            raise _Truncated()
+        self._position += size
+        return data
+
+    def _read_int(self):
+        return _INT.unpack(self._read(4))[0]
+
+    def _read_long(self):
+        return _LONG.unpack(self._read(8))[0]
+
+    def _read_boolean(self):
+        return self._read(1) != b'\x00'
+
+    def _read_count(self):
+        count = self._read_int()
+        if count < 0:
+            raise GatlingHandlerException(
+                f'Negative length {count} before byte {self._position} of '
+                'binary simulation.log')
+        return count
+
+    def _read_timestamp(self):
+        return str(self._run_start + self._read_int())
+
+    def _read_string(self):
+        size = self._read_count()
+        if not size:
+            return ''
+        data = self._read(size)
+        coder = self._read(1)[0]
+        if coder not in _CODERS:
+            raise GatlingHandlerException(
+                f'Unknown string coder {coder} before byte {self._position} '
+                'of binary simulation.log')
+        return data.decode(_CODERS[coder], 'replace')
+
+    def _read_cached_string(self):
+        index = self._read_int()
+        if index >= 0:
+            string = self._strings[index] = self._read_string()
+            return string
+        try:
+            return self._strings[-index]
+        except KeyError:
+            raise GatlingHandlerException(
+                f'Unknown cached string {-index} before byte '
+                f'{self._position} of binary simulation.log')
+
+    def _read_groups(self):
+        return ','.join(self._read_cached_string()
+                        for _ in range(self._read_count()))
@@ -1,10 +1,52 @@
+'''Streaming conversion of JUnit XML reports.
+
+A report is read in two passes. `JUnitOutline` first scans it for what has
+to be known before any results are read:
+
+- the root element, so that an invalid report fails before results of
+  this or any other report are read
+- timestamps of the top level suites, for the start of the execution
+  suite, which is read before its suites
+- how many child suites every suite has. Results are read depth first,
+  child suites before test cases, and without the counts, all test cases
+  after the last child suite of a suite, that is all test cases of a suite
+  without child suites, would have to be kept in memory until the suite
+  ends
+- what is captured of suites, whose <system-out> and <system-err> usually
+  come after their test cases
+
+`JUnitReader` then converts suites and test cases as the report is read.
+When a report is read in full anyway, as in the worker processes of
+`jobs`, nothing needs the outline unless suites are captured, so it is not
+scanned.
+
+Both passes use `XMLParser` targets instead of `iterparse`. The scan only
+needs start and end tags, and a target that does not build elements
+takes a fraction of the time and no memory. In the second pass,
+`JUnitEvents` builds the elements and yields the same events as
+`iterparse`, but never keeps the text of <properties>, <system-out> and
+<system-err> in them. That text can be as large as the rest of the report
+and would otherwise be read whole into the element before it could be
+cleared. Elements are cleared as soon as they have been converted, like
+with `iterparse`.
+'''
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from html import escape
+from locale import atof
+from pathlib import Path
+from xml.etree import ElementTree as ETree
+
 from robot.api import logger
-from junitparser import Error, Failure, JUnitXml
-from junitparser.junitparser import TestSuite as JUnitXmlTestSuite
 
 from .base_handler import BaseHandler
-from .errors import JUnitHandlerException, SubprocessException
-from .utils import run_command_line, validate_path
+from .errors import (JUnitHandlerException, ResultFileNotFoundException,
+                     SubprocessException)
+from .junit_capture import CAPTURED_ELEMENTS, JUnitCapture
+from .oxygen_handler_result import read_oxygen_suite
+from .utils import expand_result_files, run_command_line, validate_path
 
 
 class JUnitHandler(BaseHandler):
@@ -12,6 +54,11 @@ class JUnitHandler(BaseHandler):
     def run_junit(self, result_file, command, check_return_code=False, **env):
         '''Run JUnit unit testing tool specified with ``command``.
 
+        ``result_file`` can also be a directory or a glob pattern, like
+        ``target/surefire-reports/*.xml``, when the tool writes a report per
+        test class or worker. The XML files in the directory, or matching the
+        pattern, are combined into one suite in the order of their names.
+
         See documentation for other arguments in \`Run Gatling\`.
         '''
         logger.debug(f'Command: {command}')
@@ -23,101 +70,244 @@ class JUnitHandler(BaseHandler):
         logger.info('Result file: {}'.format(result_file))
         return result_file
 
-    def parse_results(self, result_file):
-        result_file = validate_path(result_file)
-        xml = JUnitXml.fromfile(result_file)
-        return self._transform_tests(xml)
+    def cli(self):
+        cli_interface = self.DEFAULT_CLI.copy()
+        cli_interface[('--merge',)] = {
+            'action': 'store_true',
+            'dest': 'merge',
+            'help': ('convert all given result files, directories and glob '
+                     'patterns into a single JUnit Execution suite')
+        }
+        return cli_interface
+
+    def parse_results(self, result_file, jobs=None):
+        '''
+        result_file: A JUnit report, a directory or glob pattern of reports,
+                     or a list of them, which are combined into one suite
+        jobs: How many processes read several reports, instead of `jobs` in
+              the configuration
+        '''
+        if not _is_many(result_file):
+            return self._transform_tests(validate_path(result_file))
+        result_files = list(dict.fromkeys(
+            expand_result_files(result_file, directory_pattern='*.xml')))
+        if not result_files:
+            raise ResultFileNotFoundException(
+                f'No JUnit reports found in "{result_file}"')
+        return self._transform_reports([validate_path(path)
+                                        for path in result_files],
+                                       self._jobs(jobs))
+
+    def _transform_tests(self, result_file):
+        '''Convert the given JUnit report into a test suite dict
 
-    def _transform_tests(self, node):
-        '''Convert the given xml object into a test suite dict
+        The report is first scanned for what has to be known before the
+        results are read, and then read with `JUnitReader` as the results
+        are, so that neither the whole document nor all of the results need
+        to be in memory at once.
 
-        node: An xml object from JUnitXml.fromfile()
+        result_file: Path to a JUnit XML report
 
-        Return: The test suite dict
+        Return: The test suite dict, with child suites and test cases
+                converted lazily
         '''
+        capture = self._capture()
+        outline = self._scan(result_file, capture)
+        reader = JUnitReader(self, result_file, outline, capture)
+        return self._execution_suite(reader.top_suites(), [outline])
+
+    def _transform_reports(self, result_files, jobs):
+        '''Convert the given JUnit reports into one test suite dict, with
+        the top level suites of every report in the given order
+
+        All reports are scanned first, so that invalid ones fail before any
+        results are read. With several `jobs`, the reports are read in that
+        many processes, each in full.
+
+        result_files: Paths to JUnit XML reports
+
+        Return: The test suite dict, with child suites converted lazily
+        '''
+        if jobs > 1 and len(result_files) > 1:
+            # workers capture what they read themselves
+            outlines = [self._scan(result_file)
+                        for result_file in result_files]
+            suites = self._read_in_pool(result_files, jobs)
+        else:
+            captures = [self._capture() for _ in result_files]
+            outlines = [self._scan(result_file, capture)
+                        for result_file, capture in zip(result_files,
+                                                        captures)]
+            suites = (suite for result_file, outline, capture
+                      in zip(result_files, outlines, captures)
+                      for suite in JUnitReader(self, result_file, outline,
+                                               capture).top_suites())
+        return self._execution_suite(suites, outlines)
+
+    def _scan(self, result_file, capture=None):
+        outline = JUnitOutline.scan(result_file, capture)
+        _check_root(result_file, outline.root)
+        return outline
+
+    def _execution_suite(self, suites, outlines):
         suite_dict = {
             'name': 'JUnit Execution',
             'tags': self._tags,
-            'suites': [],
+            'suites': suites,
         }
 
-        if isinstance(node, JUnitXmlTestSuite):
-            node = [node]
-
-        for xunit_suite in node:
-            suite = self._transform_test_suite(xunit_suite)
-            suite_dict['suites'].append(suite)
+        starts = [start for start in (self._parse_timestamp(timestamp)
+                                      for outline in outlines
+                                      for timestamp in outline.timestamps)
+                  if start is not None]
+        if starts:
+            suite_dict['start'] = min(starts)
 
         return suite_dict
 
-    def _transform_test_suite(self, test_suite):
-        '''Convert the given suite xml object into a suite dict
+    def _capture(self):
+        '''Return: `JUnitCapture` for one report as configured, or None if
+        nothing is captured'''
+        elements = self._config.get('capture') or []
+        if isinstance(elements, str):
+            elements = [elements]
+        unknown = [element for element in elements
+                   if element not in CAPTURED_ELEMENTS]
+        if unknown:
+            raise JUnitHandlerException(
+                f'Cannot capture "{unknown[0]}", expected any of: '
+                f'{", ".join(CAPTURED_ELEMENTS)}')
+        limits = {}
+        for name, default in (('capture_limit', 2**16),
+                              ('capture_total_limit', 10 * 2**20)):
+            limit = self._config.get(name, default)
+            if (isinstance(limit, bool) or not isinstance(limit, int)
+                    or limit < 0):
+                raise JUnitHandlerException(
+                    f'{name} must be a number of bytes, not "{limit}"')
+            limits[name] = limit
+        if not elements:
+            return None
+        return JUnitCapture(elements,
+                            limits['capture_limit'],
+                            limits['capture_total_limit'],
+                            self._config.get('capture_spill_dir'))
+
+    def _jobs(self, jobs=None):
+        jobs = self._config.get('jobs', 1) if jobs is None else jobs
+        if isinstance(jobs, bool) or not isinstance(jobs, int) or jobs < 1:
+            raise JUnitHandlerException(
+                f'jobs must be a positive integer, not "{jobs}"')
+        return jobs
+
+    def _read_in_pool(self, result_files, jobs):
+        '''Yield: Top level suite dicts of `result_files`, in their order,
+        read by a pool of `jobs` processes'''
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        try:
+            pending = deque()
+            for result_file in result_files:
+                pending.append(pool.submit(_read_in_worker,
+                                           self._config,
+                                           str(result_file)))
+                if len(pending) >= 2 * jobs:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _transform_test_suite(self, frame, reader):
+        '''Convert the given suite element into a suite dict
 
-        test_suite: A JUnit suite xml object
+        frame: `SuiteFrame` of a <testsuite> element whose start tag has
+               been read
+        reader: The `JUnitReader` reading the element
 
-        Return: A suite dict
+        Return: A suite dict, with child suites and test cases converted
+                lazily
         '''
         suite_dict = {
-            'name': test_suite.name,
+            'name': _attribute(frame.element, 'name'),
             'tags': [],
-            'suites': [],
-            'tests': [],
+            # For child suites
+            'suites': reader.suites(frame),
+            # For test cases
+            'tests': reader.tests(frame),
         }
 
-        # For child suites
-        for xunit_suite in test_suite.testsuites():
-            suite = self._transform_test_suite(xunit_suite)
-            suite_dict['suites'].append(suite)
+        start = self._parse_timestamp(_attribute(frame.element, 'timestamp'))
+        if start is not None:
+            suite_dict['start'] = start
 
-        # For test cases
-        for xunit_case in test_suite:
-            case = self._transform_test_case(xunit_case)
-            suite_dict['tests'].append(case)
+        metadata = reader.metadata(frame)
+        if metadata:
+            suite_dict['metadata'] = metadata
 
         return suite_dict
 
-    def _transform_test_case(self, test_case):
-        '''Convert the given test case xml object into a test case dict
+    def _parse_timestamp(self, timestamp):
+        '''Convert the `timestamp` attribute of a suite xml object, local
+        time unless it has an offset, into milliseconds since the epoch
+
+        Return: The milliseconds or None if `timestamp` is missing or invalid
+        '''
+        if not timestamp:
+            return None
+        try:
+            # fromisoformat() of Python 3.10 does not understand "Z"
+            time_object = datetime.fromisoformat(
+                timestamp.strip().replace('Z', '+00:00'))
+        except ValueError:
+            logger.debug(f'Ignoring invalid JUnit timestamp "{timestamp}"')
+            return None
+        return time_object.timestamp() * 1000
+
+    def _transform_test_case(self, test_case, captured=None):
+        '''Convert the given test case element into a test case dict
 
-        test_case: A JUnit case xml object
+        test_case: A complete <testcase> element
+        captured: Keyword dicts of what was captured of the test case, if
+                  anything is captured
 
         Return: A test case dict
         '''
+        name = _attribute(test_case, 'name')
         test_dict = {
-            'name': '{} (Execution)'.format(test_case.name),
+            'name': '{} (Execution)'.format(name),
             'pass': True,
             'messages': [],
             'keywords': [],
         }
 
-        errors = test_case.iterchildren(Error)
-        failures = test_case.iterchildren(Failure)
-
-        if errors:
-            for error in errors:
-                error_name = 'ERROR: {} ({})'.format(
-                    error.message,
-                    error.type,
-                )
-                test_dict['messages'].append(error_name)
-
-        if failures:
-            for failure in failures:
-                failure_name = 'FAIL: {} ({})'.format(
-                    failure.message,
-                    failure.type,
-                )
-                test_dict['messages'].append(failure_name)
+        for error in test_case.iterfind('error'):
+            error_name = 'ERROR: {} ({})'.format(
+                _attribute(error, 'message'),
+                _attribute(error, 'type'),
+            )
+            test_dict['messages'].append(error_name)
+
+        for failure in test_case.iterfind('failure'):
+            failure_name = 'FAIL: {} ({})'.format(
+                _attribute(failure, 'message'),
+                _attribute(failure, 'type'),
+            )
+            test_dict['messages'].append(failure_name)
 
         # If we had errors/failures, it's not a PASS
         if test_dict['messages']:
             test_dict['pass'] = False
 
-        execution_time = (test_case.time or 0.0) * 1000
+        time = _attribute(test_case, 'time')
+        time = atof(time) if time else None
+        execution_time = (time or 0.0) * 1000
         test_dict['elapsed'] = execution_time
 
+        if captured is not None:
+            test_dict['keywords'] = captured
+
         test_case_dict = {
-            'name': test_case.name,
+            'name': name,
             'tags': [],
             'keywords': [
                 test_dict,
@@ -125,8 +315,411 @@ class JUnitHandler(BaseHandler):
         }
 
         # This is really unreliable but at least we can find the trouble spots
-        if not test_case.time:
+        if not time:
             test_case_dict['tags'].append(
                 'oxygen-junit-unknown-execution-time')
 
         return test_case_dict
+
+
+def _is_many(result_file):
+    '''Return: Whether `result_file` is a list, directory or glob pattern
+    of reports'''
+    if isinstance(result_file, (list, tuple)):
+        return True
+    if not isinstance(result_file, (str, Path)):
+        return False
+    path = Path(result_file)
+    return path.is_dir() or (not path.exists()
+                             and any(c in str(result_file) for c in '*?['))
+
+
+def _read_in_worker(config, result_file):
+    '''Read the top level suites of `result_file` in full in a worker
+    process of a handler with `jobs`
+
+    The report is scanned for an outline only if suites are captured, as
+    the main process has checked it and test cases may be kept in memory.
+    '''
+    handler = JUnitHandler(config)
+    result_file = validate_path(result_file)
+    capture = handler._capture()
+    outline = None
+    if capture is not None:
+        outline = handler._scan(result_file, capture)
+    reader = JUnitReader(handler, result_file, outline, capture)
+    return read_oxygen_suite({'suites': reader.top_suites()})['suites']
+
+
+def _check_root(result_file, root):
+    if root not in ('testsuites', 'testsuite'):
+        raise JUnitHandlerException(
+            f'Invalid JUnit report "{result_file}": expected '
+            f'<testsuites> or <testsuite>, not <{root}>')
+
+
+def _attribute(element, name):
+    '''Return: Attribute `name` of `element` or None if it is missing
+
+    Values are HTML escaped and times parsed with `locale.atof` like
+    junitparser, which Oxygen used to read JUnit reports with, did.
+    '''
+    value = element.get(name)
+    return None if value is None else escape(value)
+
+
+class JUnitOutline(object):
+    '''JUnitOutline is what needs to be known of a JUnit report before its
+    results are read: the root element, timestamps of the top level suites
+    and how many child suites every suite has, in document order.
+
+    It is collected as the target of an `XMLParser`, which only calls it for
+    start and end tags, so scanning a report is quick and takes little
+    memory.
+    '''
+
+    def __init__(self):
+        self.root = None
+        self.timestamps = []
+        self.child_suites = []
+        self.metadata = {}  # captured metadata of suites by their ordinal
+        self._open = []  # ordinals of open suites, None for other elements
+
+    @classmethod
+    def scan(cls, result_file, capture=None):
+        '''
+        capture: `JUnitCapture` of the report, if anything is captured;
+                 what is captured of suites is collected while scanning
+        '''
+        outline = cls() if capture is None else CapturingJUnitOutline(capture)
+        parser = ETree.XMLParser(target=outline)
+        with open(result_file, 'rb') as report:
+            for block in iter(lambda: report.read(2**20), b''):
+                parser.feed(block)
+        return parser.close()
+
+    def start(self, tag, attrib):
+        depth = len(self._open)
+        if depth == 0:
+            self.root = tag
+        if tag != 'testsuite':
+            self._open.append(None)
+            return
+        if depth == 0 or (depth == 1 and self.root == 'testsuites'):
+            self.timestamps.append(attrib.get('timestamp'))
+        if depth and self._open[-1] is not None:
+            self.child_suites[self._open[-1]] += 1
+        self._open.append(len(self.child_suites))
+        self.child_suites.append(0)
+
+    def end(self, tag):
+        self._open.pop()
+
+    def close(self):
+        return self
+
+
+class CapturingJUnitOutline(JUnitOutline):
+    '''CapturingJUnitOutline also captures <properties>, <system-out> and
+    <system-err> of suites into their `metadata`, as their text arrives.
+
+    They have to be captured before the results are read, because suite
+    dicts are created as soon as suites start, while <system-out> and
+    <system-err> usually come after their test cases.
+    '''
+
+    def __init__(self, capture):
+        super().__init__()
+        self._capture = capture
+        self._budgets = {}
+        self._tags = []
+        self._text = None  # being captured, with its suite and name
+        self._text_depth = None
+
+    def start(self, tag, attrib):
+        parent = self._tags[-1] if self._tags else None
+        suites = self._open[-2:]
+        super().start(tag, attrib)
+        self._tags.append(tag)
+        if self._text is not None:
+            return
+        if tag in ('system-out', 'system-err') and suites and suites[-1] \
+                is not None:
+            self._begin(suites[-1], tag, tag)
+        elif (tag == 'property' and parent == 'properties'
+                and len(suites) == 2 and suites[0] is not None
+                and 'properties' in self._capture.elements
+                and attrib.get('name') is not None):
+            self._begin(suites[0], 'properties', attrib['name'])
+            if attrib.get('value') is not None:
+                self._text[0].add(attrib['value'])
+                self._finish()
+
+    def _begin(self, suite, kind, name):
+        if suite is None or kind not in self._capture.elements:
+            return
+        if suite not in self._budgets:
+            self._budgets[suite] = self._capture.budget()
+        self._text = (self._capture.text(self._budgets[suite], kind), suite,
+                      name)
+        self._text_depth = len(self._tags)
+
+    def data(self, data):
+        if self._text is not None:
+            self._text[0].add(data)
+
+    def end(self, tag):
+        if self._text is not None and len(self._tags) == self._text_depth:
+            self._finish()
+        self._tags.pop()
+        super().end(tag)
+
+    def _finish(self):
+        text, suite, name = self._text
+        self._text = None
+        value = text.finish()
+        if value is not None:
+            self.metadata.setdefault(suite, {})[name] = value
+
+
+class SuiteFrame(object):
+    '''SuiteFrame is the reading state of a <testsuite> element, or the
+    <testsuites> root, in `JUnitReader`'''
+
+    def __init__(self, element, depth, child_suites, has_tests=True,
+                 ordinal=None):
+        self.element = element
+        self.depth = depth
+        self.child_suites = child_suites
+        self.ordinal = ordinal  # of the suite in document order
+        self.has_tests = has_tests
+        self.tests = deque()  # read before the last child suite
+        self.closed = False
+
+
+class JUnitEvents(object):
+    '''JUnitEvents is the target of an `XMLParser` that builds the elements
+    of a JUnit report like `iterparse` does and yields the same start and
+    end events, except that text of <properties>, <system-out> and
+    <system-err> is never kept in elements.
+
+    That text can be as large as the rest of the report. Suites have it
+    captured while their report is scanned; of test cases, it is captured
+    within the budgets of `capture` as the parser reads it.
+    '''
+
+    def __init__(self, capture=None):
+        self._capture = capture
+        self._builder = ETree.TreeBuilder()
+        self._events = deque()
+        self._tags = []
+        self._skipped = None  # depth of the element whose text is skipped
+        self._captured = None  # texts captured of the open test case
+        self._budget = None
+        self._text = None  # being captured
+        self._text_depth = None
+        self._in_text = False  # whether data is captured text
+
+    def read(self, result_file):
+        '''Yield: Events of `result_file` as (event, element, captured),
+        where `captured` has keyword dicts of what was captured of a test
+        case at its end event, and is None otherwise'''
+        parser = ETree.XMLParser(target=self)
+        with open(result_file, 'rb') as report:
+            for block in iter(lambda: report.read(2**16), b''):
+                parser.feed(block)
+                while self._events:
+                    yield self._events.popleft()
+            parser.close()
+        while self._events:
+            yield self._events.popleft()
+
+    def start(self, tag, attrib):
+        element = self._builder.start(tag, attrib)
+        self._events.append(('start', element, None))
+        parent = self._tags[-1] if self._tags else None
+        self._tags.append(tag)
+        if (self._text is not None and tag == 'property'
+                and len(self._tags) == self._text_depth + 1):
+            self._start_property(attrib)
+        if self._skipped is not None:
+            return
+        if tag in CAPTURED_ELEMENTS:
+            self._skipped = len(self._tags)
+            if parent == 'testcase':
+                self._begin(tag)
+        elif tag == 'testcase' and self._capture is not None:
+            self._captured = {}
+            self._budget = self._capture.budget()
+
+    def _begin(self, kind):
+        if (self._captured is None or self._text is not None
+                or kind not in self._capture.elements):
+            return
+        self._text = self._capture.text(self._budget, kind)
+        self._text_depth = len(self._tags)
+        self._in_text = kind != 'properties'
+
+    def _start_property(self, attrib):
+        # properties are captured as `name: value` lines
+        name = attrib.get('name')
+        if name is None:
+            return
+        self._text.add(f'\n{name}: ' if self._text.size else f'{name}: ')
+        value = attrib.get('value')
+        if value is None:
+            self._in_text = True
+        else:
+            self._text.add(value)
+
+    def data(self, data):
+        if self._in_text:
+            self._text.add(data)
+        elif self._skipped is None:
+            self._builder.data(data)
+
+    def end(self, tag):
+        depth = len(self._tags)
+        if self._text is not None:
+            if depth == self._text_depth:
+                self._finish()
+            elif tag == 'property' and depth == self._text_depth + 1:
+                self._in_text = False
+        if depth == self._skipped:
+            self._skipped = None
+        self._tags.pop()
+        element = self._builder.end(tag)
+        captured = None
+        if tag == 'testcase' and self._captured is not None:
+            captured = self._capture.test_case_keywords(self._captured)
+            self._captured = None
+        self._events.append(('end', element, captured))
+
+    def _finish(self):
+        text = self._text.finish()
+        if text is not None:
+            self._captured.setdefault(self._text.kind, []).append(text)
+        self._text = None
+        self._in_text = False
+
+    def close(self):
+        return self._builder.close()
+
+
+class JUnitReader(object):
+    '''JUnitReader reads a JUnit report with `JUnitEvents` as its results
+    are read, converting suites as their start tags and test cases as their
+    end tags arrive, and removing elements once they have been converted.
+
+    Results are read depth first, child suites before test cases, like the
+    lazy results of handlers are (see `OxygenResultValidator`). Thanks to
+    `JUnitOutline`, test cases are kept in memory only if they come before
+    a child suite in their suite; otherwise they are read one at a time.
+    Without an outline, test cases of a suite are kept in memory until all
+    of its child suites have been read.
+    '''
+
+    def __init__(self, handler, result_file, outline, capture=None):
+        '''
+        outline: `JUnitOutline` of the report, or None if it was not scanned
+        '''
+        self._handler = handler
+        self._result_file = result_file
+        self._events = JUnitEvents(capture).read(result_file)
+        self._captured = None  # of the test case that ended last
+        self._child_suites = outline and outline.child_suites
+        self._metadata = outline.metadata if outline else {}
+        self._suite_count = 0
+        self._top_suite_count = outline and len(outline.timestamps)
+        self._open = []
+
+    def top_suites(self):
+        _, root, _ = self._next()
+        _check_root(self._result_file, root.tag)
+        if root.tag == 'testsuite':
+            yield self._handler._transform_test_suite(self._frame(root, 0),
+                                                      self)
+            return
+        yield from self.suites(SuiteFrame(root, 0, self._top_suite_count,
+                                          has_tests=False))
+
+    def metadata(self, frame):
+        '''Return: Metadata captured of the suite of `frame` or None'''
+        return self._metadata.get(frame.ordinal)
+
+    def suites(self, frame):
+        '''Yield: Suite dicts of the child suites of `frame`'''
+        found = 0
+        while frame.child_suites is None or found < frame.child_suites:
+            child = self._read_child(frame)
+            if child is None:
+                return
+            if isinstance(child, SuiteFrame):
+                found += 1
+                yield self._handler._transform_test_suite(child, self)
+                self._skip(child)
+            else:
+                frame.tests.append(child)
+
+    def tests(self, frame):
+        '''Yield: Test case dicts of the test cases of `frame`'''
+        while frame.tests:
+            yield frame.tests.popleft()
+        while True:
+            child = self._read_child(frame)
+            if child is None:
+                return
+            if isinstance(child, SuiteFrame):  # child suites were not read
+                self._skip(child)
+            else:
+                yield child
+
+    def _skip(self, frame):
+        '''Read past what is left of `frame` without converting it'''
+        while self._read_child(frame, convert=False) is not None:
+            pass
+
+    def _read_child(self, frame, convert=True):
+        '''Read until a child suite of `frame` starts, one of its test cases
+        ends, or it ends
+
+        Return: `SuiteFrame` of the child suite, test case dict, or None
+        '''
+        while not frame.closed:
+            event, element, depth = self._next()
+            if depth == frame.depth + 1:
+                if event == 'start':
+                    if element.tag == 'testsuite':
+                        return self._frame(element, depth)
+                    continue
+                test = None
+                if convert and frame.has_tests and element.tag == 'testcase':
+                    test = self._handler._transform_test_case(element,
+                                                              self._captured)
+                del frame.element[:]
+                if test is not None:
+                    return test
+            elif depth == frame.depth:
+                frame.closed = True
+                if self._open:
+                    del self._open[-1][:]
+        return None
+
+    def _frame(self, element, depth):
+        ordinal = self._suite_count - 1
+        child_suites = None  # not known without an outline
+        if self._child_suites is not None:
+            child_suites = self._child_suites[ordinal]
+        return SuiteFrame(element, depth, child_suites, ordinal=ordinal)
+
+    def _next(self):
+        '''Return: The next event and element, and the depth of the element
+        '''
+        event, element, self._captured = next(self._events)
+        if event == 'start':
+            if element.tag == 'testsuite':
+                self._suite_count += 1
+            self._open.append(element)
+            return event, element, len(self._open) - 1
+        self._open.pop()
+        return event, element, len(self._open)
@@ -0,0 +1,131 @@
+'''Bounded capture of <properties>, <system-out> and <system-err> of JUnit
+reports.
+
+Test logs can be as large as the rest of a report, so captured text is kept
+within byte budgets: `limit` bytes for each suite or test case and
+`total_limit` bytes for the whole report. Text over budget is cut at the
+budget, on a character boundary, and ends with a marker telling how much was
+left out. With `spill_dir`, text that was cut is also written there in full,
+into a file named after its content, and the marker tells where.
+'''
+import os
+
+from hashlib import blake2b
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+CAPTURED_ELEMENTS = ('properties', 'system-out', 'system-err')
+
+
+class _Budget(object):
+
+    def __init__(self, remaining):
+        self.remaining = remaining
+
+
+class JUnitCapture(object):
+    '''JUnitCapture captures `elements` of one JUnit report within its
+    budgets.
+
+    elements: Which of `CAPTURED_ELEMENTS` are captured
+    limit: Bytes captured for each suite or test case at most
+    total_limit: Bytes captured for the whole report at most
+    spill_dir: Directory where text that was cut is written in full, or None
+    '''
+
+    def __init__(self, elements, limit, total_limit, spill_dir=None):
+        self.elements = frozenset(elements)
+        self.limit = limit
+        self.spill_dir = None if spill_dir is None else Path(spill_dir)
+        self.total = _Budget(total_limit)
+
+    def budget(self):
+        '''Return: A budget for the captured text of one suite or test case
+        '''
+        return _Budget(self.limit)
+
+    def text(self, budget, kind):
+        '''Return: `CapturedText` of `kind` within `budget`'''
+        return CapturedText(self, budget, kind)
+
+    def test_case_keywords(self, captured):
+        '''
+        captured: Lists of texts captured of a test case, by kind of
+                  element, as `CapturedText.finish` returned them
+
+        Return: Keyword dicts of what was captured of the test case, one for
+                each kind of element it has
+        '''
+        return [{'name': kind,
+                 'pass': True,
+                 'messages': ['\n'.join(captured[kind])]}
+                for kind in CAPTURED_ELEMENTS if captured.get(kind)]
+
+
+class CapturedText(object):
+    '''CapturedText keeps text given in chunks up to the budget it was
+    created with, and when the text goes over it and there is a spill
+    directory, writes the text there in full as it comes.
+    '''
+
+    def __init__(self, capture, budget, kind):
+        self.kind = kind
+        self.size = 0
+        self._capture = capture
+        self._budget = budget
+        self._room = min(budget.remaining, capture.total.remaining)
+        self._kept = []
+        self._kept_size = 0
+        self._spill = None
+        self._digest = None
+
+    def add(self, chunk):
+        data = chunk.encode('utf-8')
+        if not data:
+            return
+        fits = self.size + len(data) <= self._room
+        if not fits and self._capture.spill_dir is not None:
+            if self._spill is None:
+                self._start_spilling()
+            self._spill.write(data)
+            self._digest.update(data)
+        self.size += len(data)
+        if self._kept_size < self._room:
+            part = data[:self._room - self._kept_size]
+            self._kept.append(part)
+            self._kept_size += len(part)
+
+    def _start_spilling(self):
+        self._capture.spill_dir.mkdir(parents=True, exist_ok=True)
+        self._spill = NamedTemporaryFile(dir=self._capture.spill_dir,
+                                         prefix='.oxygen-',
+                                         suffix='.txt',
+                                         delete=False)
+        self._digest = blake2b(digest_size=10)
+        kept = b''.join(self._kept)  # all of the text so far
+        self._spill.write(kept)
+        self._digest.update(kept)
+
+    def finish(self):
+        '''Return: The captured text, ending with a marker if it was cut, or
+        None if there was no text'''
+        # a cut in the middle of a character leaves out the whole character
+        kept = b''.join(self._kept).decode('utf-8', 'ignore')
+        kept_size = len(kept.encode('utf-8'))
+        self._budget.remaining -= kept_size
+        self._capture.total.remaining -= kept_size
+        if self.size <= self._room:
+            return kept if kept.strip() else None
+        marker = (f'[{self.size - kept_size} of {self.size} bytes of '
+                  f'{self.kind} truncated')
+        if self._spill is not None:
+            marker += f', full text in {self._finish_spilling()}'
+        marker += ']'
+        return f'{kept}\n{marker}' if kept else marker
+
+    def _finish_spilling(self):
+        self._spill.close()
+        path = self._capture.spill_dir / (f'{self.kind}-'
+                                          f'{self._digest.hexdigest()}.txt')
+        os.replace(self._spill.name, path)
+        return path
@@ -0,0 +1,633 @@
+import os
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import mkstemp
+from xml.etree.ElementTree import Element, SubElement, iterparse, tostring
+
+from robot.api import ExecutionResult
+from robot.model import Message, SuiteVisitor, Tags
+from robot.model.metadata import Metadata
+from robot.model.stats import SuiteStat, TagStat, TotalStat
+from robot.result import Result
+from robot.utils import XmlWriter, normalize
+from robot.version import get_full_version, get_version as robot_version
+
+from .robot_interface import RobotInterface
+
+
+class RobotOutputWriter(object):
+    '''RobotOutputWriter writes Oxygen result dicts as Robot Framework
+    output.xml without ever building the whole Robot result tree.
+
+    Suites are walked as they are read from the dict (`suites` and `tests` may
+    be lazy iterables), one test case at a time is built into a Robot result
+    object with `RobotResultInterface` and written out immediately.
+    Timestamps are thus identical to what `RobotResultInterface.build_suite`
+    would produce. `<statistics>` are collected while writing.
+
+    RobotOutputWriter can also `splice` generated suites into an existing
+    output.xml in place of the tests they replace, streaming it through.
+
+    Robot Framework does not document how its output is written, so this is
+    done only with the versions in `STREAMED_VERSIONS`, whose output is
+    tested to be identical to `Result.save`. With other versions, the whole
+    result tree is built and written with `Result.save`.
+    '''
+
+    SCHEMA_VERSIONS = {4: '2', 5: '3', 6: '4', 7: '5'}
+    # Robot Framework versions in the CI matrix; others are written with
+    # `Result.save` instead
+    STREAMED_VERSIONS = ('3.2', '4.1', '5.0', '6.1', '7.0', '7.1', '7.2',
+                         '7.3', '7.4', '7.5')
+
+    def __init__(self, interface=None):
+        self._interface = interface or RobotInterface()
+        self._rf_major = int(robot_version().split('.')[0])
+        self._writer = None
+        self._visitor = None
+        self._suite_stack = []
+        self._suite_stats = []
+        self._tag_stats = {}
+        self._total = None
+
+    def write(self, output, starting_time, suite):
+        '''Write `suite` dict to `output` path, timeline starting at
+        `starting_time` milliseconds.
+
+        Return: The ending time of the written suite in milliseconds
+        '''
+        # written next to `output` and moved in place once complete, so that
+        # a suite failing to be read never leaves a truncated output behind
+        output = Path(output)
+        fd, partial_output = mkstemp(dir=output.parent, suffix='.xml')
+        os.close(fd)
+        try:
+            if self._streamed:
+                end_time = self._stream(partial_output, starting_time, suite)
+            else:
+                end_time = self._save(partial_output, starting_time, suite)
+        except BaseException:
+            os.remove(partial_output)
+            raise
+        os.replace(partial_output, output)
+        return end_time
+
+    def splice(self, output, tests, replace_test):
+        '''Rewrite Robot Framework `output` file in place, replacing tests.
+
+        The output is streamed through; only tests whose long name is in
+        `tests` are read into Robot result objects. Such a test is given to
+        `replace_test`, which may replace it with suites in its parent suite,
+        like `BaseHandler` does. Whatever the parent then contains is written
+        in place of the test. Suite and test ids, statuses of suites with
+        replaced tests and `<statistics>` are updated accordingly.
+        '''
+        output = Path(output)
+        fd, spliced_output = mkstemp(dir=output.parent, suffix='.xml')
+        os.close(fd)
+        try:
+            if self._streamed:
+                self._start_writing(spliced_output)
+                try:
+                    self._splice(output, set(tests), replace_test)
+                finally:
+                    self._writer.close()
+            else:
+                self._save_spliced(output, spliced_output, set(tests),
+                                   replace_test)
+        except BaseException:
+            os.remove(spliced_output)
+            raise
+        os.replace(spliced_output, output)
+
+    @property
+    def _streamed(self):
+        '''Whether the installed Robot Framework is one whose output
+        RobotOutputWriter is tested to write the same as `Result.save`'''
+        version = '.'.join(robot_version().split('.')[:2])
+        return version in self.STREAMED_VERSIONS
+
+    def _save(self, output, starting_time, suite):
+        '''Write `suite` dict with `Result.save`, building the whole Robot
+        result tree first
+
+        Return: The ending time of the written suite in milliseconds
+        '''
+        end_time, robot_suite = self._interface.result.build_suite(
+            starting_time, suite)
+        result = Result(rpa=False)
+        if robot_suite:
+            result.suite = robot_suite
+        result.save(str(output))
+        return end_time
+
+    def _save_spliced(self, source, output, tests, replace_test):
+        '''Replace tests like `_splice` does, but in the result model of
+        the whole `source` output, which is written with `Result.save`'''
+        result = ExecutionResult(str(source))
+        replaced = []
+        suites = [result.suite]
+        while suites:
+            suite = suites.pop()
+            replaced.extend(test for test in suite.tests
+                            if test.longname in tests)
+            suites.extend(reversed(suite.suites))
+        for test in replaced:
+            replace_test(test)
+        result.save(str(output))
+
+    def _stream(self, output, starting_time, suite):
+        self._start_writing(output)
+        try:
+            self._writer.start('robot', self._robot_attributes())
+            end_time = self._write_suite(starting_time, suite)
+            self._write_statistics()
+            self._writer.start('errors')
+            self._writer.end('errors')
+            self._writer.end('robot')
+        finally:
+            self._writer.close()
+        return end_time
+
+    def _start_writing(self, output):
+        self._writer = XmlWriter(str(output), write_empty=False,
+                                 usage='output')
+        self._visitor = _OutputXmlVisitor(self._writer, self._rf_major)
+        self._suite_stack = []
+        self._suite_stats = []
+        self._tag_stats = {}
+        self._total = self._new_stat()
+
+    def _splice(self, source, tests, replace_test, nested=False):
+        '''Stream `source` output through into the output being written
+
+        nested: Write only the suites and tests right under the root suite
+                of `source`, into the suite being written
+        '''
+        robot_attributes = {}
+        elements = []      # currently open elements, from root to current
+        pending = None     # element whose start tag is not written yet
+        replaced = None    # test read as a whole to be replaced
+        skipped = None     # element whose content is written by us, or not
+                           # at all when nested
+        test_status, test_tags = None, []
+        for event, elem in iterparse(str(source), events=('start', 'end')):
+            if event == 'start':
+                elements.append(elem)
+                if replaced is not None or skipped is not None:
+                    continue
+                if nested and len(elements) < 3:
+                    # only the content of <robot> and its root suite
+                    if elem.tag not in ('robot', 'suite'):
+                        skipped = elem
+                    continue
+                if nested and len(elements) == 3 and elem.tag not in (
+                        'suite', 'test'):
+                    skipped = elem
+                    continue
+                if pending is not None:
+                    self._writer.start(pending.tag, pending.attrib)
+                if elem.tag == 'robot':
+                    robot_attributes = dict(elem.attrib)
+                elif elem.tag == 'suite':
+                    elem.set('id', self._start_suite_frame(
+                        elem.get('name'))['id'])
+                elif elem.tag == 'test':
+                    suite = self._suite_stack[-1]
+                    if f'{suite["longname"]}.{elem.get("name")}' in tests:
+                        replaced = elem
+                        pending = None
+                        continue
+                    elem.set('id', self._next_test_id())
+                    test_status, test_tags = None, []
+                elif elem.tag == 'statistics':
+                    skipped = elem
+                    pending = None
+                    continue
+                pending = elem
+                continue
+
+            elements.pop()
+            parent = elements[-1] if elements else None
+            if replaced is not None or skipped is not None:
+                if elem is replaced:
+                    self._write_replacement(robot_attributes, elem,
+                                            replace_test)
+                    replaced = None
+                elif elem is skipped:
+                    if not nested:
+                        self._write_statistics()
+                    skipped = None
+                else:
+                    continue
+            elif nested and len(elements) < 2:
+                pass
+            else:
+                if elem.tag == 'status' and parent.tag == 'test':
+                    test_status = elem.get('status')
+                elif elem.tag == 'status' and parent.tag == 'suite':
+                    suite = self._suite_stack[-1]
+                    if suite.get('spliced'):
+                        elem.set('status', self._suite_status(suite['stat']))
+                elif elem.tag == 'tag' and (parent.tag == 'test' or (
+                        parent.tag == 'tags' and elements[-2].tag == 'test')):
+                    test_tags.append(elem.text or '')
+
+                if elem is pending:
+                    self._write_leaf(elem)
+                    pending = None
+                else:
+                    self._writer.end(elem.tag)
+
+                if elem.tag == 'test':
+                    self._count_test(test_status, test_tags)
+                elif elem.tag == 'suite':
+                    self._suite_stack.pop()
+            if parent is not None:
+                # written elements are not needed anymore
+                parent.remove(elem)
+
+    def _write_leaf(self, elem):
+        if elem.text or any(elem.attrib.values()):
+            self._writer.element(elem.tag, elem.text, elem.attrib)
+        else:
+            self._writer.start(elem.tag, newline=False)
+            self._writer.end(elem.tag)
+
+    def _write_replacement(self, robot_attributes, test, replace_test):
+        # the test is read alone, in a suite having the long name of its
+        # actual parent so that the test's long name stays the same
+        root = Element('robot', robot_attributes)
+        SubElement(root, 'suite', {'id': 's1',
+                                   'name': self._suite_stack[-1]['longname']}
+                   ).append(test)
+        result = ExecutionResult(tostring(root))
+        replace_test(result.suite.tests[0])
+
+        # whatever replaced the test is written with Robot Framework's own
+        # `Result.save` and copied from there, numbered and counted into
+        # statistics like the rest of the output
+        fd, replacement = mkstemp(suffix='.xml')
+        os.close(fd)
+        try:
+            result.save(replacement)
+            self._splice(replacement, (), None, nested=True)
+        finally:
+            os.remove(replacement)
+        for frame in self._suite_stack:
+            frame['spliced'] = True
+
+    def _robot_attributes(self):
+        if self._rf_major > 6:
+            generated = datetime.now().isoformat()
+        else:
+            generated = datetime.now().strftime('%Y%m%d %H:%M:%S.%f')[:-3]
+        attrs = {'generator': get_full_version('Rebot'),
+                 'generated': generated,
+                 'rpa': 'false'}
+        if self._rf_major > 3:
+            attrs['schemaversion'] = self.SCHEMA_VERSIONS.get(
+                self._rf_major, max(self.SCHEMA_VERSIONS.values()))
+        return attrs
+
+    def _new_stat(self):
+        return {'pass': 0, 'fail': 0, 'skip': 0}
+
+    def _write_suite(self, starting_time, suite):
+        '''Write `suite` dict with its child suites, walking them with an
+        explicit stack like `RobotResultBuilder.build_suite` does, so that
+        suites nested deeper than Python's recursion limit can be written
+
+        Return: The ending time of the suite in milliseconds
+        '''
+        if not suite:
+            return starting_time
+
+        stack = [self._start_suite(starting_time, suite)]
+        while True:
+            written = stack[-1]
+            child_suite = next(written.children, _END)
+            if child_suite is not _END:
+                if child_suite:
+                    stack.append(self._start_suite(written.time, child_suite))
+                continue
+
+            updated_time = self._end_suite(written)
+            stack.pop()
+            if not stack:
+                return max(updated_time, starting_time)
+            stack[-1].time = max(stack[-1].time, updated_time)
+
+    def _start_suite(self, starting_time, suite):
+        '''Write the start of `suite` and its setup, its child suites are
+        written next'''
+        result = self._interface.result
+        written = _WrittenSuite(result.get_start_time(suite, starting_time),
+                                suite)
+        name = suite.get('name') or 'Unknown Suite Name'
+        written.frame = self._start_suite_frame(name)
+        self._writer.start('suite', {'id': written.frame['id'], 'name': name})
+        written.time, robot_setup = result.build_keyword(
+            written.time, suite.get('setup') or None, setup=True)
+        written.time, written.robot_teardown = result.build_keyword(
+            written.time, suite.get('teardown') or None, teardown=True)
+        if robot_setup:
+            self._visitor.write_keyword(robot_setup)
+        if written.robot_teardown and self._rf_major < 4:
+            # RF 3 writes all suite keywords before child suites and tests
+            self._visitor.write_keyword(written.robot_teardown)
+            written.robot_teardown = None
+        return written
+
+    def _end_suite(self, written):
+        '''Write the tests, teardown and status of a suite whose child
+        suites have been written
+
+        Return: The ending time of the suite in milliseconds
+        '''
+        result = self._interface.result
+        suite = written.suite
+        tags = suite.get('tags') or []
+        updated_time = written.time
+        for test in suite.get('tests') or []:
+            updated_time, robot_test = result.build_test(updated_time, test)
+            if robot_test:
+                robot_test.tags.add(tags)
+                self._write_test(robot_test)
+
+        if written.robot_teardown:
+            self._visitor.write_keyword(written.robot_teardown)
+
+        self._write_metadata(Metadata(suite.get('metadata') or {}))
+        self._visitor.write_status(self._suite_status(written.frame['stat']),
+                                   self._time(written.start),
+                                   self._time(updated_time))
+        self._writer.end('suite')
+
+        self._suite_stack.pop()
+        return updated_time
+
+    def _time(self, milliseconds):
+        '''Return: `milliseconds` as the result model of the installed
+        Robot Framework stores times'''
+        if self._rf_major > 6:
+            return self._interface.result.ms_to_datetime(milliseconds)
+        return self._interface.result.ms_to_timestamp(milliseconds)
+
+    def _start_suite_frame(self, name):
+        '''Start collecting statistics of a suite written next'''
+        if self._suite_stack:
+            parent = self._suite_stack[-1]
+            parent['suites'] += 1
+            suite_id = f'{parent["id"]}-s{parent["suites"]}'
+            longname = f'{parent["longname"]}.{name}'
+        else:
+            suite_id = 's1'
+            longname = name
+        frame = {'id': suite_id,
+                 'name': name,
+                 'longname': longname,
+                 'suites': 0,
+                 'tests': 0,
+                 'stat': self._new_stat()}
+        self._suite_stats.append(frame)
+        self._suite_stack.append(frame)
+        return frame
+
+    def _next_test_id(self):
+        parent = self._suite_stack[-1]
+        parent['tests'] += 1
+        return f'{parent["id"]}-t{parent["tests"]}'
+
+    def _write_test(self, robot_test):
+        self._visitor.test_id = self._next_test_id()
+        self._visitor.write_test(robot_test)
+        self._count_test(robot_test.status, robot_test.tags)
+
+    def _count_test(self, status, tags):
+        key = {'PASS': 'pass', 'FAIL': 'fail'}.get(status, 'skip')
+        self._total[key] += 1
+        for frame in self._suite_stack:
+            frame['stat'][key] += 1
+        for tag in Tags(tags):
+            tag_stat = self._tag_stats.setdefault(normalize(tag, ignore='_'),
+                                                  dict(self._new_stat(),
+                                                       name=tag))
+            tag_stat[key] += 1
+
+    def _write_metadata(self, metadata):
+        if not metadata:
+            return
+        if self._rf_major < 4:
+            self._writer.start('metadata')
+            for name, value in metadata.items():
+                self._writer.element('item', value, {'name': name})
+            self._writer.end('metadata')
+        else:
+            for name, value in metadata.items():
+                self._writer.element('meta', value, {'name': name})
+
+    def _suite_status(self, stat):
+        if stat['fail']:
+            return 'FAIL'
+        if stat['pass'] or self._rf_major < 4:
+            return 'PASS'
+        return 'SKIP'
+
+    def _write_statistics(self):
+        '''Write `<statistics>` with Robot Framework's own statistics
+        objects, so that their attributes are written in the order the
+        installed version writes them'''
+        self._writer.start('statistics')
+
+        self._writer.start('total')
+        if self._rf_major < 4:
+            self._write_stat(TotalStat('Critical Tests'), self._total)
+        self._write_stat(TotalStat('All Tests'), self._total)
+        self._writer.end('total')
+
+        self._writer.start('tag')
+        for key in sorted(self._tag_stats):
+            stat = self._tag_stats[key]
+            self._write_stat(TagStat(stat['name']), stat)
+        self._writer.end('tag')
+
+        self._writer.start('suite')
+        for frame in self._suite_stats:
+            self._write_stat(SuiteStat(_StatisticsSuite(frame)),
+                             frame['stat'])
+        self._writer.end('suite')
+
+        self._writer.end('statistics')
+
+    def _write_stat(self, stat, counts):
+        stat.passed = counts['pass']
+        stat.failed = counts['fail']
+        stat.skipped = counts['skip']
+        self._writer.element('stat', stat.name,
+                             stat.get_attributes(values_as_strings=True))
+
+
+_END = object()
+
+
+class _WrittenSuite(object):
+    '''A suite being written by `RobotOutputWriter._write_suite`'''
+
+    __slots__ = ('suite', 'start', 'time', 'children', 'frame',
+                 'robot_teardown')
+
+    def __init__(self, starting_time, suite):
+        self.suite = suite
+        self.start = starting_time
+        self.time = starting_time
+        # a lazy iterable is read one suite at a time
+        self.children = iter(suite.get('suites') or ())
+        self.frame = None
+        self.robot_teardown = None
+
+
+class _StatisticsSuite(object):
+    '''What `SuiteStat` reads of a suite, for a suite whose statistics were
+    collected by `RobotOutputWriter`'''
+
+    __slots__ = ('id', 'name', 'longname', 'full_name', 'elapsedtime',
+                 'elapsed_time')
+
+    def __init__(self, frame):
+        self.id = frame['id']
+        self.name = frame['name']
+        # RF 7 renamed `longname` and `elapsedtime`
+        self.longname = self.full_name = frame['longname']
+        self.elapsedtime = 0
+        self.elapsed_time = timedelta(0)
+
+
+class _OutputXmlVisitor(SuiteVisitor):
+    '''Writes built Robot result tests and keywords the same way Robot
+    Framework's own XmlLogger of the installed version would
+
+    `write_test` and `write_keyword` walk keywords with an explicit stack
+    instead of visiting them recursively like `visit` does, so that keywords
+    nested deeper than Python's recursion limit can be written.
+    '''
+
+    def __init__(self, writer, rf_major):
+        self._writer = writer
+        self._rf_major = rf_major
+        self.test_id = None
+
+    def write_test(self, test):
+        '''Write `test` like `test.visit(self)` would'''
+        self._write(test, self.start_test, self.end_test)
+
+    def write_keyword(self, keyword):
+        '''Write `keyword` like `keyword.visit(self)` would'''
+        self._write(keyword, self.start_keyword, self.end_keyword)
+
+    def _write(self, item, start, end):
+        start(item)
+        stack = [(item, end, self._children(item))]
+        while stack:
+            item, end, children = stack[-1]
+            child = next(children, _END)
+            if child is _END:
+                stack.pop()
+                end(item)
+            elif isinstance(child, Message):
+                self.visit_message(child)
+            else:
+                self.start_keyword(child)
+                stack.append((child, self.end_keyword,
+                              self._children(child)))
+
+    def _children(self, item):
+        '''Yield: Keywords and messages right under test or keyword `item`,
+        in the order the installed Robot Framework visits them'''
+        if self._rf_major < 4:
+            # RF 3 has setups and teardowns among keywords
+            yield from item.keywords
+            yield from getattr(item, 'messages', ())
+            return
+        yield from self._special_keyword(item, 'setup')
+        yield from getattr(item, 'body', ())
+        yield from self._special_keyword(item, 'teardown')
+
+    def _special_keyword(self, item, kind):
+        # RF 4 has no `has_setup`; an empty setup or teardown is falsy
+        has_keyword = getattr(item, f'has_{kind}', None)
+        if has_keyword is None:
+            has_keyword = bool(getattr(item, kind, None))
+        if has_keyword:
+            yield getattr(item, kind)
+
+    def start_test(self, test):
+        self._writer.start('test', {'id': self.test_id, 'name': test.name})
+
+    def end_test(self, test):
+        self._write_tags(test.tags)
+        extra = {'critical': 'yes'} if self._rf_major < 4 else {}
+        self.write_status(test.status, *self._times(test), test.message,
+                          **extra)
+        self._writer.end('test')
+
+    def start_keyword(self, keyword):
+        attrs = {'name': keyword.name}
+        if keyword.type not in ('kw', 'KEYWORD'):
+            attrs['type'] = keyword.type
+        self._writer.start('kw', attrs)
+        if self._rf_major < 7:
+            self._write_tags(keyword.tags)
+
+    def end_keyword(self, keyword):
+        if self._rf_major > 6:
+            # RF 7 writes keyword tags after the keyword body
+            self._write_tags(keyword.tags)
+        self.write_status(keyword.status, *self._times(keyword),
+                          keyword.message)
+        self._writer.end('kw')
+
+    def visit_message(self, msg):
+        if self._rf_major > 6:
+            attrs = {'time': msg.timestamp.isoformat() if msg.timestamp
+                             else None,
+                     'level': msg.level}
+        else:
+            attrs = {'timestamp': msg.timestamp or 'N/A', 'level': msg.level}
+        if msg.html:
+            attrs['html'] = 'yes' if self._rf_major < 4 else 'true'
+        self._writer.element('msg', msg.message, attrs)
+
+    def _write_tags(self, tags):
+        tags = Tags(tags)
+        if self._rf_major < 4:
+            if tags:
+                self._writer.start('tags')
+                for tag in tags:
+                    self._writer.element('tag', tag)
+                self._writer.end('tags')
+        else:
+            for tag in tags:
+                self._writer.element('tag', tag)
+
+    def _times(self, item):
+        if self._rf_major > 6:
+            return item.start_time, item.end_time
+        return item.starttime, item.endtime
+
+    def write_status(self, status, start, end, message='', **extra):
+        '''
+        start: Start time, a datetime on RF 7 and a timestamp before
+        end: End time, a datetime on RF 7 and a timestamp before
+        '''
+        if self._rf_major > 6:
+            elapsed = (end - start) if start and end else timedelta(0)
+            attrs = {'status': status,
+                     'start': start.isoformat() if start else None,
+                     'elapsed': format(elapsed.total_seconds(), 'f')}
+        else:
+            attrs = {'status': status, 'starttime': start or 'N/A',
+                     'endtime': end or 'N/A'}
+        attrs.update(extra)
+        self._writer.element('status', message, attrs)
@@ -1,25 +1,34 @@
 import sys
 
 from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from inspect import getdoc, signature
-from io import StringIO
 from pathlib import Path
 from shutil import copy as copy_file
+from time import time
 from traceback import format_exception
 
-from robot.api import ExecutionResult, ResultVisitor, ResultWriter
+from robot.api import ResultVisitor, ResultWriter
 from robot.libraries.BuiltIn import BuiltIn
 from robot.errors import DataError
 from yaml import load, FullLoader, dump as dump_yaml
 
+from .base_handler import inject_suite_reports, normalize_keyword_name
+from .cache import ConversionCache
 from .config import CONFIG_FILE, ORIGINAL_CONFIG_FILE
 from .errors import (OxygenException,
                      InvalidConfigurationException,
                      ResultFileNotFoundException)
-from .robot_interface import RobotInterface
-from .utils import validate_with_deprecation_warning
+from .output_writer import RobotOutputWriter
+from .oxygen_handler_result import read_oxygen_suite
+from .robot_interface import get_keywords_from
+from .utils import (DEFAULT_VALIDATION_SAMPLE_SIZE, VALIDATION_MODES,
+                    expand_result_files, is_output_file, validate_as_read)
 from .version import VERSION
+from .watcher import ResultWatcher
 
 
 class OxygenCore(object):
@@ -65,7 +74,8 @@ class OxygenCore(object):
 class OxygenVisitor(OxygenCore, ResultVisitor):
     '''OxygenVisitor goes over Robot Framework ExcutionResult object,
     transforming test cases that use keywords of OxygenLibrary to parsed test
-    results from other tools.
+    results from other tools. Only suites that contain tests in `data` are
+    visited; keywords, statistics and errors are skipped altogether.
 
     Read up on what is Robot Framework SuiteVisitor:
     http://robot-framework.readthedocs.io/en/latest/autodoc/robot.model.html#module-robot.model.visitor
@@ -73,12 +83,79 @@ class OxygenVisitor(OxygenCore, ResultVisitor):
     def __init__(self, data):
         super().__init__()
         self.data = data
+        self._keyword_handlers = None
+        self._affected_suites = None
+        self._affected_count = None
+        self._batches = []
+
+    @property
+    def keyword_handlers(self):
+        '''Handlers by the normalized names of the keywords that trigger
+        them'''
+        if self._keyword_handlers is None:
+            self._keyword_handlers = {}
+            for tool_name, handler in self.handlers.items():
+                self._keyword_handlers.setdefault(handler.keyword, []).append(
+                    (tool_name, handler))
+        return self._keyword_handlers
+
+    @property
+    def affected_suites(self):
+        '''Long names of the suites that may contain tests in `data`'''
+        # data grows while tests are run; it is never reduced
+        if self._affected_count != len(self.data):
+            self._affected_suites = set()
+            for longname in self.data:
+                names = longname.split('.')
+                for end in range(1, len(names)):
+                    self._affected_suites.add('.'.join(names[:end]))
+            self._affected_count = len(self.data)
+        return self._affected_suites
+
+    def start_suite(self, suite):
+        if suite.longname not in self.affected_suites:
+            return False
+        self._batches.append([])
+
+    def end_suite(self, suite):
+        '''Replace the tests of `suite` visited so far, all at once'''
+        reports = self._batches.pop() if self._batches else None
+        if reports:
+            inject_suite_reports(suite, reports)
+
+    def visit_keyword(self, keyword):
+        pass
+
+    def visit_statistics(self, stats):
+        pass
+
+    def visit_errors(self, errors):
+        pass
+
+    def _find_triggers(self, test):
+        '''Return: The keywords directly under `test` and a list of
+        `(index, tool_name, handler)` for each keyword that triggers a
+        handler'''
+        keywords = get_keywords_from(test)
+        triggers = []
+        for index, keyword in enumerate(keywords):
+            for tool_name, handler in self.keyword_handlers.get(
+                    normalize_keyword_name(keyword.name), ()):
+                triggers.append((index, tool_name, handler))
+        return keywords, triggers
 
     def visit_test(self, test):
+        if test.longname not in self.data:
+            return
+        keywords, triggers = self._find_triggers(test)
         failures = []
-        for handler_type, handler in self.handlers.items():
+        # tests of the suite being visited are replaced at its end_suite;
+        # tests visited on their own are replaced right away
+        batch = self._batches[-1] if self._batches else None
+        for index, _, handler in triggers:
             try:
-                handler.check_for_keyword(test, self.data)
+                handler._replace_test(test, self.data, keywords, index,
+                                      batch=batch)
             except Exception as e:
                 failures.append(e)
         if len(failures) == 1:
@@ -91,36 +168,94 @@ class OxygenVisitor(OxygenCore, ResultVisitor):
             raise OxygenException('Multiple failures:\n{}'.format(
                 '\n'.join(tracebacks)))
 
+    def parse_test_results(self, test, pool=None):
+        '''Parse results of `test` with the handlers it used right after it
+        has run.
+
+        pool: Optional executor to parse in the background; the results are
+              waited for when the test is visited
+
+        Failures are not reported here but when the test is visited.
+        '''
+        if test.longname not in self.data:
+            return
+        _, triggers = self._find_triggers(test)
+        started = set()
+        for _, tool_name, handler in triggers:
+            if tool_name in started:
+                continue
+            started.add(tool_name)
+            submit = None
+            if isinstance(pool, ProcessPoolExecutor):
+                submit = partial(pool.submit, _parse_in_worker, tool_name)
+            elif pool is not None:
+                submit = partial(pool.submit, handler._read_run_time_data)
+            handler._start_parsing(test, self.data, submit)
+
 
 class listener(object):
     '''listener passes data from test execution to where results are written.
 
     listener object is used during test execution to get dynamically data
-    from OxygenLibrary keywords. After test execution is finished, listener
-    will initiate OxygenVisitor, replacing test cases that used OxygenLibrary
-    keywords with parsed test results from other test tools. In the end, the new
-    output is written on the disk for rebot to take over and generate Robot
-    Framework log and report normally
+    from OxygenLibrary keywords. Results of the other test tools are parsed
+    as soon as the test case that ran them ends, in the background if `jobs`
+    is given. After test execution is finished, listener streams the output through, replacing test cases that
+    used OxygenLibrary keywords with the parsed test results using
+    OxygenVisitor; other test cases are copied as they are. The new output is
+    written on the disk for rebot to take over and generate Robot Framework
+    log and report normally
     '''
 
-    ROBOT_LISTENER_API_VERSION = 2
-
-    def __init__(self):
+    ROBOT_LISTENER_API_VERSION = 3
+    POOLS = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+
+    def __init__(self, jobs=0, pool='thread'):
+        '''
+        jobs: How many results are parsed in the background at the same
+              time; 0, the default, parses them in the listener right after
+              the test
+        pool: `thread` or `process`, what parses the results in the
+              background
+        '''
         self.run_time_data = {}
+        self._visitor = OxygenVisitor(self.run_time_data)
+        try:
+            self._jobs = int(jobs)
+            self._pool_class = self.POOLS[pool.lower()]
+        except (KeyError, ValueError):
+            raise InvalidConfigurationException(
+                f'Invalid listener arguments jobs={jobs} and pool={pool}, '
+                f'expected a number and one of {", ".join(self.POOLS)}')
+        self._pool = None
 
-    def end_test(self, name, attributes):
+    @property
+    def pool(self):
+        if self._pool is None and self._jobs > 0:
+            self._pool = self._pool_class(max_workers=self._jobs)
+        return self._pool
+
+    def end_test(self, data, result):
         try:
             lib = BuiltIn()._get_context().namespace.get_library_instance(
                 'oxygen.OxygenLibrary')
             if lib:
-                self.run_time_data[attributes['longname']] = lib.data
+                self.run_time_data[result.longname] = lib.data
+                self._visitor.parse_test_results(data, self.pool)
         except DataError as _:
             pass
 
     def output_file(self, path):
-        result = ExecutionResult(path)
-        result.visit(OxygenVisitor(self.run_time_data))
-        result.save()
+        try:
+            RobotOutputWriter().splice(path,
+                                       self.run_time_data,
+                                       self._visitor.visit_test)
+        finally:
+            self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
 class OxygenLibrary(OxygenCore):
     '''Oxygen is a tool to consolidate different test tools' reports together
@@ -231,8 +366,8 @@ class OxygenLibrary(OxygenCore):
 
 class OxygenCLI(OxygenCore):
     '''
-    OxygenCLI is a command line interface to transform one test result file to
-    corresponding Robot Framework output.xml
+    OxygenCLI is a command line interface to transform test result files to
+    corresponding Robot Framework output.xml files
     '''
     MAIN_LEVEL_CLI_ARGS = {
         # we intentionally define `dest` here so we can filter arguments later
@@ -254,6 +389,50 @@ class OxygenCLI(OxygenCore):
                            'help': ('prints current Oxygen handler '
                                     'configuration')}
     }
+    HANDLER_LEVEL_CLI_ARGS = {
+        # these are shared by all handlers and never passed to `parse_results`
+        '--jobs': {'type': int,
+                   'default': 1,
+                   'metavar': 'N',
+                   'dest': 'jobs',
+                   'help': ('number of processes used to parse result files '
+                            'in parallel (default: 1)')},
+        '--output': {'type': Path,
+                     'metavar': 'FILE',
+                     'dest': 'output',
+                     'help': ('write all given result files to this single '
+                              'output.xml instead of one output per result '
+                              'file')},
+        '--no-cache': {'action': 'store_true',
+                       'dest': 'no_cache',
+                       'help': ('always parse result files instead of using '
+                                'results cached from earlier conversions')},
+        '--validation': {'choices': VALIDATION_MODES,
+                         'dest': 'validation',
+                         'help': ('how parsed results are validated: all of '
+                                  'them, a random sample of test cases or '
+                                  'not at all (default: "validation" in the '
+                                  'handler configuration, or full)')}
+    }
+    WATCH_CLI_ARGS = {
+        '--state-file': {'type': Path,
+                         'metavar': 'FILE',
+                         'dest': 'state_file',
+                         'help': ('where converted files are recorded '
+                                  '(default: DIRECTORY/'
+                                  f'{ResultWatcher.STATE_FILE})')},
+        '--interval': {'type': float,
+                       'default': 1.0,
+                       'metavar': 'SECONDS',
+                       'dest': 'interval',
+                       'help': 'seconds between polls (default: 1.0)'},
+        '--once': {'action': 'store_true',
+                   'dest': 'once',
+                   'help': ('convert what is in the directory now and exit '
+                            'instead of watching it')},
+        '--no-cache': HANDLER_LEVEL_CLI_ARGS['--no-cache'],
+        '--validation': HANDLER_LEVEL_CLI_ARGS['--validation']
+    }
     def add_arguments(self, parser):
         # Add version number here to the arguments as it depends on OxygenCLI
         # being initiated already
@@ -266,8 +445,38 @@ class OxygenCLI(OxygenCore):
         for tool_name, tool_handler in self.handlers.items():
             subcommand_parser = subcommands.add_parser(tool_name)
             for flags, params in tool_handler.cli().items():
+                if flags == ('result_file',):
+                    # handlers parse one file at a time, but the CLI can
+                    # be given many files, directories and glob patterns
+                    params = dict(params,
+                                  nargs='+',
+                                  help=params.get('help', 'result files, '
+                                                  'directories or glob '
+                                                  'patterns to convert'))
                 subcommand_parser.add_argument(*flags, **params)
-                subcommand_parser.set_defaults(func=tool_handler.parse_results)
+            for flag, params in self.HANDLER_LEVEL_CLI_ARGS.items():
+                subcommand_parser.add_argument(flag, **params)
+            subcommand_parser.set_defaults(func=tool_handler.parse_results,
+                                           handler=tool_name)
+
+        watch_parser = subcommands.add_parser(
+            'watch',
+            help=('keep converting result files as they appear in a '
+                  'directory'))
+        watch_subcommands = watch_parser.add_subparsers()
+        for tool_name, tool_handler in self.handlers.items():
+            subcommand_parser = watch_subcommands.add_parser(tool_name)
+            subcommand_parser.add_argument('watch_directory',
+                                           metavar='directory',
+                                           type=Path,
+                                           help='directory to watch')
+            for flags, params in tool_handler.cli().items():
+                # watched result files are converted one at a time
+                if flags not in (('result_file',), ('--merge',)):
+                    subcommand_parser.add_argument(*flags, **params)
+            for flag, params in self.WATCH_CLI_ARGS.items():
+                subcommand_parser.add_argument(flag, **params)
+            subcommand_parser.set_defaults(func=tool_handler.parse_results)
 
     def parse_args(self, parser):
         return vars(parser.parse_args())  # returns a dictionary
@@ -298,16 +507,223 @@ class OxygenCLI(OxygenCore):
         print(f'Using config file: {CONFIG_FILE}')
         print(dump_yaml(self.config))
 
+    def expand_result_files(self, result_files):
+        '''Expand directories and glob patterns to the result files in them'''
+        return expand_result_files(result_files)
+
+    def _is_output_file(self, path):
+        '''Outputs of earlier conversions are not converted again'''
+        return is_output_file(path)
+
     def convert_to_robot_result(self, args):
-        output_filename = self.get_output_filename(args.get('result_file'))
-        parsed_results = args['func'](
-            **{k: v for (k, v) in args.items() if not callable(v)})
-        validate_with_deprecation_warning(parsed_results, args['func'])
-        robot_suite = RobotInterface().running.build_suite(parsed_results)
-        robot_suite.run(output=output_filename,
-                        log=None,
-                        report=None,
-                        stdout=StringIO())
+        args = dict(args)
+        jobs = max(args.pop('jobs', None) or 1, 1)
+        output = args.pop('output', None)
+        tool_name = args.pop('handler', None)
+        cache = None if args.pop('no_cache', False) else ConversionCache()
+        validation = args.pop('validation', None)
+        if args.pop('merge', False):
+            return self._convert_merged(args, output, jobs, cache, validation)
+        result_files = [
+            result_file for result_file in
+            self.expand_result_files(args.pop('result_file', None))
+            if output is None or Path(result_file).resolve() != output.resolve()
+        ]
+        handler_args = {k: v for (k, v) in args.items() if not callable(v)}
+
+        if len(result_files) == 1 and output is None:
+            # a single result file fails loudly, as it always has
+            return self._convert_result_file(args['func'],
+                                             result_files[0],
+                                             handler_args,
+                                             write=True,
+                                             cache=cache,
+                                             validation=validation)
+
+        failures = []
+        conversions = self._convert_result_files(args['func'],
+                                                 tool_name,
+                                                 result_files,
+                                                 handler_args,
+                                                 jobs,
+                                                 write=output is None,
+                                                 failures=failures,
+                                                 cache=cache,
+                                                 validation=validation)
+        if output is None:
+            for _ in conversions:
+                pass
+        else:
+            RobotOutputWriter().write(str(output),
+                                      int(time() * 1000),
+                                      {'name': output.stem,
+                                       'suites': conversions})
+        for result_file, error in failures:
+            print(f'Oxygen: converting "{result_file}" failed: {error}',
+                  file=sys.stderr)
+        if failures:
+            print(f'Oxygen: {len(failures)} of {len(result_files)} result '
+                  'files failed to convert', file=sys.stderr)
+            return 1
+
+    def _convert_merged(self, args, output, jobs, cache, validation):
+        '''Convert all given result files in one call of a handler with
+        `--merge`, which takes them as a list and `jobs`, into one output'''
+        result_files = args.pop('result_file', None)
+        if not result_files:
+            raise ResultFileNotFoundException('You did not give any result '
+                                              'file to convert')
+        handler_args = {k: v for (k, v) in args.items() if not callable(v)}
+        parsed_results = self._convert_result_file(args['func'],
+                                                   list(map(str,
+                                                            result_files)),
+                                                   dict(handler_args,
+                                                        jobs=jobs),
+                                                   write=False,
+                                                   cache=cache,
+                                                   validation=validation)
+        if output is None:
+            output = self.get_output_filename(
+                self._merged_output_base(result_files[0]))
+        RobotOutputWriter().write(str(output),
+                                  int(time() * 1000),
+                                  parsed_results)
+
+    def _merged_output_base(self, result_file):
+        '''Return: What the output of merged result files is named after:
+        the first result file or directory, or the directory a glob pattern
+        starts from'''
+        path = Path(result_file)
+        while not path.exists() and any(c in path.name for c in '*?['):
+            path = path.parent
+        return path.resolve() if path.name in ('', '.', '..') else path
+
+    def _convert_result_files(self, func, tool_name, result_files,
+                              handler_args, jobs, write, failures, cache=None,
+                              validation=None):
+        '''Convert `result_files` yielding parsed results in given order.
+
+        Failing result files are recorded into `failures` and skipped. Results
+        are read in full before they are yielded, because lazily read results
+        could otherwise fail while they are already being written.
+        '''
+        pool = None
+        if jobs > 1 and tool_name is not None:
+            pool = ProcessPoolExecutor(max_workers=jobs)
+            conversions = self._pooled_conversions(pool,
+                                                   tool_name,
+                                                   result_files,
+                                                   handler_args,
+                                                   write,
+                                                   cache,
+                                                   validation,
+                                                   window=2 * jobs)
+        else:
+            conversions = (partial(self._convert_result_file,
+                                   func,
+                                   result_file,
+                                   handler_args,
+                                   write,
+                                   cache,
+                                   validation)
+                           for result_file in result_files)
+        try:
+            for result_file, convert in zip(result_files, conversions):
+                try:
+                    parsed_results = convert()
+                    if parsed_results is not None:
+                        parsed_results = read_oxygen_suite(parsed_results)
+                except Exception as e:
+                    failures.append((result_file, e))
+                    continue
+                if parsed_results is not None:
+                    yield parsed_results
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _pooled_conversions(self, pool, tool_name, result_files, handler_args,
+                            write, cache, validation, window):
+        '''Submit conversions to `pool` keeping at most `window` of them in
+        flight, so parsed results do not pile up faster than they are written
+        '''
+        pending = deque()
+        for result_file in result_files:
+            pending.append(pool.submit(_convert_in_worker,
+                                       tool_name,
+                                       result_file,
+                                       handler_args,
+                                       write,
+                                       cache,
+                                       validation))
+            if len(pending) >= window:
+                yield pending.popleft().result
+        while pending:
+            yield pending.popleft().result
+
+    def watch(self, args):
+        '''Convert result files in a directory as they appear, until
+        interrupted. Handlers and configuration are set up only once.
+        '''
+        args = dict(args)
+        directory = args.pop('watch_directory')
+        if not directory.is_dir():
+            raise ResultFileNotFoundException(f'Directory "{directory}" to '
+                                              'watch does not exist')
+        state_file = args.pop('state_file', None)
+        interval = args.pop('interval', None) or 1.0
+        once = args.pop('once', False)
+        cache = None if args.pop('no_cache', False) else ConversionCache()
+        validation = args.pop('validation', None)
+        handler_args = {k: v for (k, v) in args.items() if not callable(v)}
+        convert = partial(self._convert_result_file,
+                          args['func'],
+                          handler_args=handler_args,
+                          write=True,
+                          cache=cache,
+                          validation=validation)
+        watcher = ResultWatcher(directory,
+                                convert,
+                                state_file=state_file,
+                                interval=interval,
+                                ignore=self._is_output_file)
+        print(f'Oxygen: watching "{directory}"', file=sys.stderr)
+        watcher.run(once=once)
+
+    def _convert_result_file(self, func, result_file, handler_args, write,
+                             cache=None, validation=None):
+        '''Return: Results that are validated, and cached, as they are read,
+        or None if they were written into their own output file'''
+        # `validation` given on the command line overrides the configuration
+        handler = getattr(func, '__self__', None)
+        validation = validation or getattr(handler, 'validation', 'full')
+        sample_size = getattr(handler, 'validation_sample_size',
+                              DEFAULT_VALIDATION_SAMPLE_SIZE)
+
+        def read(results, cache_entry=None):
+            return validate_as_read(results, func, validation, sample_size,
+                                    cache_entry)
+
+        if cache is None:
+            parsed_results = read(func(result_file=result_file,
+                                       **handler_args))
+        else:
+            parsed_results = cache.parse(func,
+                                         read,
+                                         validation=validation,
+                                         sample_size=sample_size,
+                                         result_file=result_file,
+                                         **handler_args)
+        if not write:
+            return parsed_results
+        # Write the results directly instead of executing a generated suite:
+        # this keeps the elapsed times, nested keywords and messages the
+        # handler reported, skips Robot Framework's execution engine and
+        # never holds the whole Robot result tree in memory. Lazily produced
+        # results are parsed while they are written.
+        RobotOutputWriter().write(self.get_output_filename(result_file),
+                                  int(time() * 1000),
+                                  parsed_results)
 
     def run(self):
         parser = ArgumentParser(prog='oxygen')
@@ -330,8 +746,47 @@ class OxygenCLI(OxygenCore):
                                 self.MAIN_LEVEL_CLI_ARGS.values()]
                 filtered_args = {k: v for k, v in args.items()
                                     if k not in filter_list}
+                if 'watch_directory' in filtered_args:
+                    return self.watch(filtered_args)
                 return self.convert_to_robot_result(filtered_args)
 
+def _convert_in_worker(tool_name, result_file, handler_args, write, cache,
+                       validation):
+    '''Convert a single result file in a worker process of `oxygen --jobs`
+
+    Handlers are set up once per worker process and reused for every result
+    file the process converts.
+    '''
+    global _worker_cli
+    if _worker_cli is None:
+        _worker_cli = OxygenCLI()
+    # results are sent back to the main process, so read in full here
+    return read_oxygen_suite(_worker_cli._convert_result_file(
+        _worker_cli.handlers[tool_name].parse_results,
+        result_file,
+        handler_args,
+        write,
+        cache,
+        validation))
+
+_worker_cli = None
+
+
+def _parse_in_worker(tool_name, run_time_data):
+    '''Parse results of a single test in a worker process of the listener
+
+    Handlers are set up once per worker process, like in the command line
+    interface.
+    '''
+    global _worker_core
+    if _worker_core is None:
+        _worker_core = OxygenCore()
+    return _worker_core.handlers[tool_name]._read_run_time_data(
+        run_time_data)
+
+_worker_core = None
+
+
 def main():
     '''Main CLI entrypoint
 
@@ -340,7 +795,7 @@ def main():
     if '--reset-config' in sys.argv:
         OxygenCLI.reset_config()
         sys.exit(0)
-    OxygenCLI().run()
+    sys.exit(OxygenCLI().run())
 
 if __name__ == '__main__':
     main()
@@ -11,7 +11,10 @@ See more:
 '''
 
 import functools
+import random
 
+from collections.abc import Iterable, Mapping
+from contextlib import contextmanager
 from typing import List, Dict
 # TODO FIXME: Python 3.10 requires these to be imported from here
 # Python 3.10 EOL is in 2026
@@ -26,6 +29,7 @@ _Pass = TypedDict('_Pass', { 'pass': Required[bool], 'name': Required[str] })
 # define required fields in this one above
 class OxygenKeywordDict(_Pass, total=False):
     elapsed:  float  # milliseconds
+    start:    float  # milliseconds since the epoch
     tags:     List[str]
     messages: List[str]
     teardown: 'OxygenKeywordDict'  # in RF, keywords do not have setup kw; just put it as first kw in `keywords`
@@ -36,6 +40,7 @@ class OxygenTestCaseDict(TypedDict, total=False):
     name:     Required[str]
     keywords: Required[List[OxygenKeywordDict]]
     tags:     List[str]
+    start:    float  # milliseconds since the epoch
     setup:    OxygenKeywordDict
     teardown: OxygenKeywordDict
 
@@ -43,6 +48,7 @@ class OxygenTestCaseDict(TypedDict, total=False):
 class OxygenSuiteDict(TypedDict, total=False):
     name:     Required[str]
     tags:     List[str]
+    start:    float  # milliseconds since the epoch
     setup:    OxygenKeywordDict
     teardown: OxygenKeywordDict
     metadata: Dict[str, str]
@@ -59,14 +65,294 @@ def _change_validationerror_to_oxygenexception(func):
             raise InvalidOxygenResultException(e)
     return wrapper
 
+# Building an adapter builds the whole recursive core schema, so each of them
+# is built once, when first needed
+@functools.cache
+def _type_adapter(typed_dict):
+    return TypeAdapter(typed_dict)
+
 @_change_validationerror_to_oxygenexception
 def validate_oxygen_suite(oxygen_result_dict):
-    return TypeAdapter(OxygenSuiteDict).validate_python(oxygen_result_dict)
+    return _type_adapter(OxygenSuiteDict).validate_python(oxygen_result_dict)
 
 @_change_validationerror_to_oxygenexception
 def validate_oxygen_test_case(oxygen_test_case_dict):
-    return TypeAdapter(OxygenTestCaseDict).validate_python(oxygen_test_case_dict)
+    return _type_adapter(OxygenTestCaseDict).validate_python(
+        oxygen_test_case_dict)
 
 @_change_validationerror_to_oxygenexception
 def validate_oxygen_keyword(oxygen_kw_dict):
-    return TypeAdapter(OxygenKeywordDict).validate_python(oxygen_kw_dict)
+    return _type_adapter(OxygenKeywordDict).validate_python(oxygen_kw_dict)
+
+def validate_oxygen_suite_sample(oxygen_result_dict, sample_size):
+    '''Validate `oxygen_result_dict` with at most `sample_size` of its test
+    cases, picked at random. Suites, their setups and teardowns are always
+    validated.'''
+    validator = OxygenResultValidator(sample_size=sample_size)
+    if not validator.validate(oxygen_result_dict):
+        raise InvalidOxygenResultException(validator.summary())
+
+
+# stands in for a keyword that is checked on its own
+_KEYWORD_SHELL = {'name': '', 'pass': True}
+
+
+class OxygenResultValidator(object):
+    '''OxygenResultValidator validates Oxygen result dicts one suite and
+    one test case at a time, so that neither the results nor pydantic's
+    validated copy of them need to be in memory all at once.
+
+    `validate` walks through a whole result dict. `wrap` returns a suite
+    dict whose child suites and test cases are validated as they are
+    iterated, which works for lazy iterables too; call `finish`, or give
+    `wrap` a callback, to know when the results have been read.
+
+    Every error is counted, but only the first `max_errors` are kept, with
+    JSON pointers to where they are in the results. With `sample_size`,
+    only a random sample of that many test cases is validated; suites are
+    always validated.
+    '''
+
+    MAX_ERRORS = 10
+
+    def __init__(self, max_errors=MAX_ERRORS, sample_size=None, rng=random):
+        self.max_errors = max_errors
+        self.sample_size = sample_size
+        self._rng = rng
+        self.errors = []
+        self.error_count = 0
+        self._title = None
+        self._sample = []
+        self._test_count = 0
+        self._on_read = None
+        self._on_finish = None
+        self._on_abandon = None
+        self._unread = 0
+
+    @property
+    def valid(self):
+        return self.error_count == 0
+
+    def validate(self, oxygen_result_dict):
+        '''Return: True if `oxygen_result_dict` is valid'''
+        _read_oxygen_suite(self.wrap(oxygen_result_dict), keep=False)
+        return self.finish()
+
+    def wrap(self, suite, on_read=None, on_finish=None, on_abandon=None):
+        '''Validate `suite` without its child suites and test cases
+
+        on_read: Callable given each suite, without its child suites and test
+                 cases, and each test case with its JSON pointer as they
+                 are read
+        on_finish: Callable called once all child suites and test cases,
+                   at every level, have been read
+        on_abandon: Callable called if reading them fails or stops halfway
+
+        Return: A copy of `suite` that validates its child suites and test
+                cases when they are iterated
+        '''
+        self._on_read = on_read
+        self._on_finish = on_finish
+        self._on_abandon = on_abandon
+        self._unread = 0
+        wrapped = self._wrap(suite, '')
+        if self._unread == 0 and on_finish is not None:
+            on_finish()
+        return wrapped
+
+    def _wrap(self, suite, path):
+        if not isinstance(suite, dict):
+            self._check(OxygenSuiteDict, suite, path)
+            if self._on_read is not None:
+                self._on_read(path, suite)
+            return suite
+        wrapped = dict(suite)
+        shell = dict(suite)
+        for key, walk in (('suites', self._walk_suites),
+                          ('tests', self._walk_tests)):
+            if _is_collection(suite.get(key)):
+                wrapped[key] = walk(suite[key], f'{path}/{key}')
+                shell[key] = []
+                self._unread += 1
+        self._check_tree(OxygenSuiteDict, shell, path)
+        if self._on_read is not None:
+            self._on_read(path, shell)
+        return wrapped
+
+    def finish(self):
+        '''Validate the sampled test cases
+
+        Return: True if all validated results were valid
+        '''
+        for test, path in self._sample:
+            self._check_tree(OxygenTestCaseDict, test, path)
+        self._sample = []
+        return self.valid
+
+    def summary(self):
+        '''Return: Description of the errors for humans'''
+        plural = '' if self.error_count == 1 else 's'
+        lines = [f'{self.error_count} validation error{plural} for '
+                 f'{self._title}']
+        lines.extend(f'  #{pointer}: {message}'
+                     for pointer, message in self.errors)
+        if self.error_count > len(self.errors):
+            lines.append(f'  ... and {self.error_count - len(self.errors)} '
+                         'more')
+        return '\n'.join(lines)
+
+    def _walk_suites(self, suites, path):
+        with self._reading():
+            for index, suite in enumerate(suites):
+                yield self._wrap(suite, f'{path}/{index}')
+
+    def _walk_tests(self, tests, path):
+        with self._reading():
+            for index, test in enumerate(tests):
+                self._add_test(test, f'{path}/{index}')
+                if self._on_read is not None:
+                    self._on_read(f'{path}/{index}', test)
+                yield test
+
+    @contextmanager
+    def _reading(self):
+        try:
+            yield
+        except BaseException:
+            # also when the generator is closed before it is exhausted
+            if self._on_abandon is not None:
+                self._on_abandon()
+                self._on_abandon = None
+            self._on_finish = None
+            raise
+        self._unread -= 1
+        if self._unread == 0 and self._on_finish is not None:
+            self._on_finish()
+
+    def _add_test(self, test, path):
+        if self.sample_size is None:
+            self._check_tree(OxygenTestCaseDict, test, path)
+            return
+        # reservoir sampling: every test case seen so far is equally likely
+        # to be in the sample
+        self._test_count += 1
+        if len(self._sample) < self.sample_size:
+            self._sample.append((test, path))
+            return
+        index = self._rng.randrange(self._test_count)
+        if index < self.sample_size:
+            self._sample[index] = (test, path)
+
+    def _check_tree(self, typed_dict, value, path):
+        '''Check `value` and the keywords in it one keyword at a time, so
+        that keywords nested however deep do not hit pydantic's recursion
+        limit'''
+        stack = [(typed_dict, value, path)]
+        while stack:
+            typed_dict, value, path = stack.pop()
+            children = []
+            if isinstance(value, dict):
+                value = dict(value)
+                # in the order of the fields, like pydantic reports errors
+                for key in typed_dict.__annotations__:
+                    child = value.get(key)
+                    if key == 'keywords' and isinstance(child, (list, tuple)):
+                        children.extend((OxygenKeywordDict, keyword,
+                                         f'{path}/{key}/{index}')
+                                        for index, keyword in enumerate(child))
+                        value[key] = []
+                    elif key in ('setup', 'teardown') and isinstance(child,
+                                                                     dict):
+                        children.append((OxygenKeywordDict, child,
+                                         f'{path}/{key}'))
+                        value[key] = _KEYWORD_SHELL
+            self._check(typed_dict, value, path)
+            stack.extend(reversed(children))
+
+    def _check(self, typed_dict, value, path):
+        try:
+            _type_adapter(typed_dict).validate_python(value)
+        except ValidationError as e:
+            if self._title is None:
+                self._title = e.title
+            for error in e.errors():
+                self.error_count += 1
+                if len(self.errors) < self.max_errors:
+                    self.errors.append((path + _json_pointer(error['loc']),
+                                        error['msg']))
+
+
+def _json_pointer(location):
+    return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1')
+                   for part in location)
+
+
+def has_lazy_parts(oxygen_result_dict):
+    '''Return: True if child suites or test cases of `oxygen_result_dict`, at
+    any level, are iterables other than lists and tuples, such as generators
+    '''
+    stack = [oxygen_result_dict]
+    while stack:
+        suite = stack.pop()
+        if not isinstance(suite, dict):
+            continue
+        suites, tests = suite.get('suites'), suite.get('tests')
+        if _is_lazy(suites) or _is_lazy(tests):
+            return True
+        if isinstance(suites, (list, tuple)):
+            stack.extend(suites)
+    return False
+
+def _is_collection(value):
+    '''Return: True if `value` can be child suites or test cases: any
+    iterable but a string or a mapping, which pydantic does not take as a
+    list'''
+    return (isinstance(value, Iterable)
+            and not isinstance(value, (str, bytes, Mapping)))
+
+def _is_lazy(value):
+    return _is_collection(value) and not isinstance(value, (list, tuple))
+
+def read_oxygen_suite(oxygen_result_dict):
+    '''Return: A copy of `oxygen_result_dict` with its lazy child suites and
+    test cases, at every level, read into lists'''
+    return _read_oxygen_suite(oxygen_result_dict, keep=True)
+
+_END = object()
+
+def _read_oxygen_suite(suite, keep):
+    '''Read child suites and test cases of `suite` in the order Oxygen builds
+    them: all child suites of a suite, each with everything in it, before
+    its test cases.
+
+    keep: Whether to return a copy of `suite` with what was read in lists
+    '''
+    if not isinstance(suite, dict):
+        return suite
+    if keep:
+        suite = dict(suite)
+    stack = [(suite, _take_children(suite, 'suites', keep))]
+    while stack:
+        parent, suites = stack[-1]
+        child = next(suites, _END)
+        if child is _END:
+            stack.pop()
+            for test in _take_children(parent, 'tests', keep):
+                if keep:
+                    parent['tests'].append(test)
+            continue
+        if isinstance(child, dict):
+            if keep:
+                child = dict(child)
+            stack.append((child, _take_children(child, 'suites', keep)))
+        if keep:
+            parent['suites'].append(child)
+    return suite if keep else None
+
+def _take_children(suite, key, keep):
+    children = suite.get(key)
+    if not _is_collection(children):
+        return iter(())
+    if keep:
+        suite[key] = []
+    return iter(children)
@@ -0,0 +1,300 @@
+from math import ceil, floor
+
+
+class ResponseTimeHistogram(object):
+    '''ResponseTimeHistogram counts response times in buckets, so that their
+    percentiles can be computed in memory that does not depend on how many
+    there are.
+
+    Like HdrHistogram, times below `2 * SUB_BUCKETS` milliseconds are counted
+    exactly and larger ones in buckets whose width is at most 1/SUB_BUCKETS
+    of the times in them. Histograms can be merged, so times can be counted
+    in parts.
+    '''
+
+    SUB_BUCKETS = 1024
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+
+    def add(self, milliseconds, count=1):
+        value = int(round(milliseconds))
+        if value < 2 * self.SUB_BUCKETS:
+            index = value if value > 0 else 0
+        else:
+            index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+
+    def percentile(self, percent):
+        '''Return: The smallest time that at least `percent` of the times
+        are equal to or less than, or None if there are no times'''
+        if not self.count:
+            return None
+        rank = max(ceil(percent / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return self._value(index)
+        return self._value(max(self.counts))
+
+    def _index(self, value):
+        shift = max(value.bit_length() - self.SUB_BUCKETS.bit_length(), 0)
+        return shift * self.SUB_BUCKETS + (value >> shift)
+
+    def _value(self, index):
+        '''Return: The middle of the bucket at `index`'''
+        shift = max(index // self.SUB_BUCKETS - 1, 0)
+        lowest = (index - shift * self.SUB_BUCKETS) << shift
+        return lowest + ((1 << shift) - 1) / 2
+
+
+class ResponseTimeStatistics(object):
+    '''ResponseTimeStatistics collects count, KO count, minimum, mean and
+    maximum and percentiles of response times of requests, and how often
+    each KO message was seen, one request at a time.
+
+    At most `max_messages` distinct KO messages, the first ones seen, are
+    counted; the rest are counted together. Without `max_messages`, every
+    message is counted, so that statistics of parts of the requests can be
+    merged in order into statistics that are the same as if all requests
+    had been added to them. With a `window` in seconds, requests are also
+    counted in windows of that length, by when they ended, to find the
+    lowest throughput.
+    '''
+
+    PERCENTILES = (50, 75, 95, 99)
+    MAX_MESSAGES = 10
+
+    def __init__(self, window=None, max_messages=MAX_MESSAGES):
+        self.window = window
+        self.max_messages = max_messages
+        self.windows = {}
+        self.count = 0
+        self.ko_count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.start = None
+        self.end = None
+        self.histogram = ResponseTimeHistogram()
+        self.messages = {}
+        self.other_messages = 0
+
+    def add(self, start, end, ok, message=''):
+        '''
+        start: When the request started, in milliseconds since the epoch
+        end: When the request ended, in milliseconds since the epoch
+        ok: Whether the request was OK
+        message: Why the request was KO
+        '''
+        elapsed = end - start if end > start else 0
+        if not self.count:
+            self.min = self.max = elapsed
+            self.start, self.end = start, end
+        else:
+            if elapsed < self.min:
+                self.min = elapsed
+            elif elapsed > self.max:
+                self.max = elapsed
+            if start < self.start:
+                self.start = start
+            if end > self.end:
+                self.end = end
+        self.count += 1
+        self.total += elapsed
+        self.histogram.add(elapsed)
+        if self.window:
+            index = int(end // (self.window * 1000))
+            self.windows[index] = self.windows.get(index, 0) + 1
+        if not ok:
+            self.ko_count += 1
+            self._count_message(message, 1)
+
+    def merge(self, other):
+        if not other.count:
+            return
+        self.count += other.count
+        self.ko_count += other.ko_count
+        self.total += other.total
+        for name, pick in (('min', min), ('max', max), ('start', min),
+                           ('end', max)):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs if mine is None else pick(mine, theirs))
+        self.histogram.merge(other.histogram)
+        for message, count in other.messages.items():
+            self._count_message(message, count)
+        self.other_messages += other.other_messages
+        for index, count in other.windows.items():
+            self.windows[index] = self.windows.get(index, 0) + count
+
+    def _count_message(self, message, count):
+        if (message in self.messages or self.max_messages is None
+                or len(self.messages) < self.max_messages):
+            self.messages[message] = self.messages.get(message, 0) + count
+        else:
+            self.other_messages += count
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def throughput(self):
+        '''Return: Requests per second from the start of the first request
+        to the end of the last one or, with a `window`, in the window with
+        fewest requests, or None if it cannot be measured
+
+        Only windows completely between the first start and the last end
+        count; without any, throughput is measured over the whole time.
+        '''
+        if self.window:
+            width = self.window * 1000
+            first, last = ceil(self.start / width), floor(self.end / width) - 1
+            if self.count and first <= last:
+                return min(self.windows.get(index, 0)
+                           for index in range(first, last + 1)) / self.window
+        if not self.count or self.end <= self.start:
+            return None
+        return self.count / ((self.end - self.start) / 1000)
+
+    def percentiles(self):
+        '''Return: `PERCENTILES` and response times at them'''
+        return [(percent, self.histogram.percentile(percent))
+                for percent in self.PERCENTILES]
+
+    def summary(self):
+        '''Return: The statistics as lines for humans'''
+        if not self.count:
+            return ['Requests: 0']
+        lines = [f'Requests: {self.count}, OK: {self.count - self.ko_count}, '
+                 f'KO: {self._describe_ko()}',
+                 f'Response time (ms): {self._describe_times()}',
+                 f'Percentiles (ms): {self._describe_percentiles()}']
+        lines.extend(f'KO ({count}): {message}'
+                     for message, count in self.messages.items())
+        if self.other_messages:
+            lines.append(f'KO ({self.other_messages}): other messages')
+        return lines
+
+    def metadata(self):
+        '''Return: The statistics as suite metadata'''
+        if not self.count:
+            return {'Requests': '0'}
+        return {'Requests': str(self.count),
+                'KO': self._describe_ko(),
+                'Response time (ms)': self._describe_times(),
+                'Percentiles (ms)': self._describe_percentiles()}
+
+    @property
+    def ko_percent(self):
+        return 100 * self.ko_count / self.count if self.count else 0.0
+
+    def _describe_ko(self):
+        return f'{self.ko_count} ({self.ko_percent:.2f}%)'
+
+    def _describe_times(self):
+        return (f'min {_format(self.min)}, mean {_format(self.mean)}, '
+                f'max {_format(self.max)}')
+
+    def _describe_percentiles(self):
+        return ', '.join(f'p{percent} {_format(value)}'
+                         for percent, value in self.percentiles())
+
+
+class ResponseTimeAssertion(object):
+    '''ResponseTimeAssertion checks one metric of `ResponseTimeStatistics`
+    against a limit: a response time or error rate at most, or a throughput
+    at least.
+
+    metric: `min`, `mean`, `max` or a percentile like `p95` (milliseconds),
+            `error_rate` (percent of requests that were KO) or `throughput`
+            (requests per second)
+    limit: The number the metric is compared to
+    request: Name of the requests whose statistics are checked, or None for
+             all requests
+    window: For `throughput`, the length of windows in seconds that all must
+            reach the limit, or None for throughput over the whole run
+    '''
+
+    def __init__(self, metric, limit, request=None, window=None):
+        if not (metric in ('min', 'mean', 'max', 'error_rate', 'throughput')
+                or _percent(metric) is not None):
+            raise ValueError(f'Unknown metric "{metric}"')
+        if isinstance(limit, bool) or not isinstance(limit, (int, float)):
+            raise ValueError(f'Limit of {metric} must be a number, '
+                             f'not "{limit}"')
+        if window is not None and (metric != 'throughput'
+                                   or isinstance(window, bool)
+                                   or not isinstance(window, (int, float))
+                                   or window <= 0):
+            raise ValueError('Window must be a positive number of seconds '
+                             'and only given for throughput')
+        self.metric = metric
+        self.limit = limit
+        self.request = request
+        self.window = window
+
+    @property
+    def name(self):
+        subject = self.metric.replace('_', ' ')
+        if self.request is not None:
+            subject = f'{subject} of {self.request}'
+        if self.metric == 'throughput':
+            name = f'{subject} >= {self.limit:g} req/s'
+            if self.window:
+                name += f' in every {self.window:g} s'
+            return name
+        unit = '%' if self.metric == 'error_rate' else ' ms'
+        return f'{subject} <= {self.limit:g}{unit}'
+
+    def check(self, statistics):
+        '''Return: Whether `statistics` meet the limit, and a message with
+        what was measured'''
+        if not statistics.count:
+            return False, 'No requests' + (f' named {self.request}'
+                                           if self.request is not None
+                                           else '')
+        if self.metric == 'throughput':
+            measured = statistics.throughput()
+            if measured is None:
+                return False, 'Throughput cannot be measured'
+            return (measured >= self.limit,
+                    f'Measured {measured:.1f} req/s '
+                    + (f'in the slowest {statistics.window:g} s window'
+                       if statistics.window and statistics.windows else
+                       f'over {statistics.count} requests'))
+        if self.metric == 'error_rate':
+            measured = statistics.ko_percent
+            return (measured <= self.limit,
+                    f'Measured {measured:.2f}% ({statistics.ko_count} of '
+                    f'{statistics.count} requests KO)')
+        percent = _percent(self.metric)
+        measured = (getattr(statistics, self.metric) if percent is None
+                    else statistics.histogram.percentile(percent))
+        return (measured <= self.limit,
+                f'Measured {_format(measured)} ms over {statistics.count} '
+                'requests')
+
+
+def _percent(metric):
+    '''Return: The percent in a percentile metric like `p95` or None'''
+    if not isinstance(metric, str) or not metric.startswith('p'):
+        return None
+    try:
+        percent = float(metric[1:])
+    except ValueError:
+        return None
+    return percent if 0 < percent <= 100 else None
+
+
+def _format(milliseconds):
+    if milliseconds == int(milliseconds):
+        return str(int(milliseconds))
+    return f'{milliseconds:.1f}'
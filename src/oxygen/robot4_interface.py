@@ -1,5 +1,4 @@
 from datetime import datetime
-from datetime import timedelta
 from datetime import timezone
 from robot.result.model import (Keyword as RobotResultKeyword,
                                 TestCase as RobotResultTest,
@@ -7,61 +6,11 @@ from robot.result.model import (Keyword as RobotResultKeyword,
 
 from robot.running.model import TestSuite as RobotRunningSuite
 
+from .robot_interface import RobotResultBuilder, TimestampFormatter
 
-class RobotResultInterface(object):
-    def build_suites(self, starting_time, *suites):
-        '''Convert a given `suite` dictionaries into a Robot suite'''
-        finished_suites = []
-        current_time = starting_time
-
-        for suite in suites:
-            current_time, finished_suite = self.build_suite(current_time, suite)
-
-            if finished_suite:
-                finished_suites.append(finished_suite)
-
-        return current_time, finished_suites
-
-
-    def build_suite(self, starting_time, suite):
-        '''Convert a set of suite dicts into Robot suites and append them to the
-        given list-like object
-
-        target: List-like object to add the Robot suites to
-        suites: Set of suite dicts to build into Robot suites
-
-        Return: The updated list-like object
-        '''
-
-        if not suite:
-            return starting_time, None
-
-        updated_time = starting_time
-        name = suite.get('name') or 'Unknown Suite Name'
-        tags = suite.get('tags') or []
-        setup_keyword = suite.get('setup') or None
-        teardown_keyword = suite.get('teardown') or None
-        child_suites = suite.get('suites') or []
-        tests = suite.get('tests') or []
-        metadata = suite.get('metadata') or {}
-
-        updated_time, robot_setup = self.build_keyword(updated_time, setup_keyword, setup=True)
-        updated_time, robot_teardown = self.build_keyword(updated_time, teardown_keyword, teardown=True)
-        updated_time, robot_suites = self.build_suites(updated_time, *child_suites)
-        updated_time, robot_tests = self.build_tests(updated_time, *tests)
-
-        robot_suite = self.spawn_robot_suite(name,
-                                             starting_time,
-                                             updated_time,
-                                             tags,
-                                             robot_setup,
-                                             robot_teardown,
-                                             robot_suites,
-                                             robot_tests,
-                                             metadata)
-
-        return updated_time, robot_suite
 
+class RobotResultInterface(RobotResultBuilder):
+    _timestamps = None
 
     def spawn_robot_suite(self,
                           name,
@@ -73,13 +22,10 @@ class RobotResultInterface(object):
                           suites,
                           tests,
                           metadata):
-        start_timestamp = self.ms_to_timestamp(start_time)
-        end_timestamp = self.ms_to_timestamp(end_time)
-
         robot_suite = RobotResultSuite(name,
-                                       starttime=start_timestamp,
-                                       endtime=end_timestamp,
-                                       metadata=metadata)
+                                       metadata=metadata,
+                                       **self.get_time_attributes(start_time,
+                                                                  end_time))
         robot_suite.set_tags(add=tags, persist=True)
 
         if setup_keyword:
@@ -96,51 +42,6 @@ class RobotResultInterface(object):
         return robot_suite
 
 
-    def build_tests(self, starting_time, *tests):
-        '''Convert a set of `tests` dicts and add to a Robot suite `target`'''
-        updated_time = starting_time
-        robot_tests = []
-        for test in tests:
-            updated_time, robot_test = self.build_test(updated_time, test)
-
-            if robot_test:
-                robot_tests.append(robot_test)
-
-        return updated_time, robot_tests
-
-
-    def build_test(self, starting_time, test):
-        '''Convert a set of `tests` dicts and add to a Robot suite `target`'''
-        if not test:
-            return starting_time, None
-
-        updated_time = starting_time
-        test_name = test.get('name') or 'Unknown Test Name'
-        tags = test.get('tags') or []
-        setup_keyword = test.get('setup') or None
-        keywords = test.get('keywords') or []
-        teardown_keyword = test.get('teardown') or None
-
-        updated_time, robot_setup = self.build_keyword(updated_time,
-                                                       setup_keyword,
-                                                       setup=True)
-        updated_time, robot_keywords = self.build_keywords(updated_time,
-                                                           *keywords)
-        updated_time, robot_teardown = self.build_keyword(updated_time,
-                                                          teardown_keyword,
-                                                          teardown=True)
-
-        robot_test = self.spawn_robot_test(test_name,
-                                           starting_time,
-                                           updated_time,
-                                           tags,
-                                           robot_setup,
-                                           robot_teardown,
-                                           robot_keywords)
-
-        return updated_time, robot_test
-
-
     def spawn_robot_test(self,
                          name,
                          start_time,
@@ -149,15 +50,13 @@ class RobotResultInterface(object):
                          setup_keyword,
                          teardown_keyword,
                          keywords):
-        start_timestamp = self.ms_to_timestamp(start_time)
-        end_timestamp = self.ms_to_timestamp(end_time)
         status = self.get_keywords_status(setup_keyword, teardown_keyword, *(keywords or []))
 
         robot_test = RobotResultTest(name,
                                tags=tags,
                                status=status,
-                               starttime=start_timestamp,
-                               endtime=end_timestamp)
+                               **self.get_time_attributes(start_time,
+                                                          end_time))
 
         if setup_keyword:
             robot_test.setup = setup_keyword
@@ -170,51 +69,6 @@ class RobotResultInterface(object):
         return robot_test
 
 
-    def build_keywords(self, starting_time, *keywords):
-        '''Convert `keywords` dicts, add them as sub-keywords to a `target`'''
-        updated_time = starting_time
-        robot_keywords = []
-        for keyword in keywords:
-            updated_time, robot_keyword = self.build_keyword(updated_time, keyword)
-
-            if robot_keyword:
-                robot_keywords.append(robot_keyword)
-
-        return updated_time, robot_keywords
-
-
-    def build_keyword(self, starting_time, keyword, setup=False, teardown=False):
-        if not keyword:
-            return starting_time, None
-
-        updated_time = starting_time
-        name = keyword.get('name') or 'Unknown Keyword Name'
-        status = keyword.get('pass') or None
-        elapsed = keyword.get('elapsed') or 0.0
-        tags = keyword.get('tags') or []
-        messages = keyword.get('messages') or []
-        teardown = keyword.get('teardown') or None
-        keywords = keyword.get('keywords') or []
-
-        updated_time, robot_teardown = self.build_keyword(updated_time, teardown)
-        updated_time, robot_keywords = self.build_keywords(updated_time, keywords)
-
-        final_time = updated_time + elapsed
-
-        robot_keyword = self.spawn_robot_keyword(name,
-                                                 tags,
-                                                 status,
-                                                 updated_time,
-                                                 final_time,
-                                                 teardown,
-                                                 keywords,
-                                                 messages,
-                                                 setup,
-                                                 teardown)
-
-        return final_time, robot_keyword
-
-
     def spawn_robot_keyword(self,
                             name,
                             tags,
@@ -226,9 +80,6 @@ class RobotResultInterface(object):
                             messages,
                             setup=False,
                             teardown=False):
-        start_timestamp = self.ms_to_timestamp(start_time)
-        end_timestamp = self.ms_to_timestamp(end_time)
-
         # import this here so RF4 interface stays in parity with RF3
         from robot.model import BodyItem
         if setup:
@@ -248,8 +99,8 @@ class RobotResultInterface(object):
         robot_keyword = RobotResultKeyword(name,
                                            tags=tags,
                                            status=keyword_status,
-                                           starttime=start_timestamp,
-                                           endtime=end_timestamp)
+                                           **self.get_time_attributes(
+                                               start_time, end_time))
 
         robot_keyword.type = keyword_type
 
@@ -270,6 +121,18 @@ class RobotResultInterface(object):
         return robot_keyword
 
 
+    def get_time_attributes(self, start_time, end_time):
+        '''Return: Keyword arguments setting the start and end times, given
+        in milliseconds, of a Robot result object'''
+        return {'starttime': self.ms_to_timestamp(start_time),
+                'endtime': self.ms_to_timestamp(end_time)}
+
+    def get_time_span(self, *keywords):
+        '''Return: When the first of `keywords` started and the last one
+        ended, as `create_wrapper_keyword` takes them'''
+        return keywords[0].starttime, keywords[-1].endtime
+
+
     def get_time_format(self):
         '''Convenience to return the general Robot timestamp format.'''
         return '%Y%m%d %H:%M:%S.%f'
@@ -282,25 +145,30 @@ class RobotResultInterface(object):
             time_format,
         )
 
-        tz_delta = self.get_timezone_delta()
+        tz_delta = self.timestamps.tz_delta
 
         milliseconds = ((time_object + tz_delta).timestamp() * 1000)
 
         return milliseconds
 
+
     def ms_to_timestamp(self, milliseconds):
+        return self.timestamps.format(milliseconds)
+
+    @property
+    def timestamps(self):
+        '''TimestampFormatter with the timezone offset of when it was
+        created or last refreshed'''
+        if self._timestamps is None:
+            self._timestamps = TimestampFormatter(self.get_timezone_delta())
+        return self._timestamps
+
+    def refresh_timestamps(self):
+        '''Look up the timezone offset again, for example after a daylight
+        saving time change in a long-running listener'''
         tz_delta = self.get_timezone_delta()
-
-        time_object = datetime.fromtimestamp(int(milliseconds / 1000)) - tz_delta
-        if time_object.year < 1970:
-            time_object = datetime.fromtimestamp(0)
-        # fromtimestamp() loses milliseconds, add them back
-        milliseconds_delta = timedelta(milliseconds=(milliseconds % 1000))
-        time_object = (time_object + milliseconds_delta)
-
-        time_format = self.get_time_format()
-
-        return time_object.strftime(time_format)
+        if self._timestamps is None or self._timestamps.tz_delta != tz_delta:
+            self._timestamps = TimestampFormatter(tz_delta)
 
 
     def get_timezone_delta(self):
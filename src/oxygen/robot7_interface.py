@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from .robot4_interface import RobotResultInterface as Robot4ResultInterface
+
+
+class RobotResultInterface(Robot4ResultInterface):
+    '''Builds Robot Framework 7 result objects with `start_time` and
+    `elapsed_time`, the datetime and timedelta the RF 7 result model stores
+    natively, instead of timestamp strings it would parse back.
+
+    Times are still passed around in milliseconds like in other interfaces;
+    `ms_to_timestamp` and `timestamp_to_ms` work as before.
+    '''
+
+    def get_time_attributes(self, start_time, end_time):
+        '''Return: Keyword arguments setting the start and end times, given
+        in milliseconds or as datetimes, of a Robot result object'''
+        start = self.ms_to_datetime(start_time)
+        return {'start_time': start,
+                'elapsed_time': self.ms_to_datetime(end_time) - start}
+
+    def get_time_span(self, *keywords):
+        '''Return: When the first of `keywords` started and the last one
+        ended, as `create_wrapper_keyword` takes them'''
+        return keywords[0].start_time, keywords[-1].end_time
+
+    def ms_to_datetime(self, milliseconds):
+        if isinstance(milliseconds, datetime):
+            return milliseconds
+        return self.timestamps.to_datetime(milliseconds)
+
+    def create_wrapper_keyword(self,
+                               name,
+                               start_time,
+                               end_time,
+                               setup,
+                               *keywords):
+        '''
+        start_time: Start as a datetime, or a timestamp like in RF < 7
+        end_time: End as a datetime, or a timestamp like in RF < 7
+        '''
+        if isinstance(start_time, str):
+            start_time = datetime.strptime(start_time, self.get_time_format())
+        if isinstance(end_time, str):
+            end_time = datetime.strptime(end_time, self.get_time_format())
+        status = self.get_keywords_status(*keywords)
+
+        robot_keyword = self.spawn_robot_keyword(name,
+                                                 [],
+                                                 status,
+                                                 start_time,
+                                                 end_time,
+                                                 None,
+                                                 keywords,
+                                                 [],
+                                                 setup,
+                                                 (not setup))
+
+        return robot_keyword
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta
+
 from robot.version import get_version as robot_version
 
 
@@ -5,7 +7,10 @@ class RobotInterface(object):
     def __init__(self):
         major_version = int(robot_version().split('.')[0])
 
-        if major_version > 3:
+        if major_version > 6:
+            from .robot4_interface import RobotRunningInterface
+            from .robot7_interface import RobotResultInterface
+        elif major_version > 3:
             from .robot4_interface import (RobotResultInterface,
                                            RobotRunningInterface)
         else:
@@ -30,3 +35,328 @@ def set_special_keyword(suite, keyword_type, keyword):
             suite.teardown = keyword
     else:
         suite.keywords.append(keyword)
+
+
+class RobotResultBuilder(object):
+    '''Builds Robot result objects out of Oxygen result dicts, leaving
+    creating the actual objects to `spawn_robot_suite`, `spawn_robot_test` and
+    `spawn_robot_keyword` of the result interface of each Robot Framework
+    version.
+
+    Nested suites and keywords are built with explicit stacks instead of
+    recursion, so results nested deeper than Python's recursion limit can be
+    built too. Children are still built depth first, in the same order and
+    with the same timeline as a recursive builder would.
+
+    Child suites and tests of a suite may be given as lazy iterables; they
+    are read while the suite is built, child suites first.
+
+    Suites, tests and keywords start where the previous one ended, or at
+    their `start` (milliseconds since the epoch) when the result dict has it.
+    The timeline never moves backwards: what follows an item with an earlier
+    `start` still starts after whatever preceded it.
+    '''
+
+    def build_suites(self, starting_time, *suites):
+        '''Convert a given `suite` dictionaries into a Robot suite'''
+        finished_suites = []
+        current_time = starting_time
+
+        for suite in suites:
+            current_time, finished_suite = self.build_suite(current_time, suite)
+
+            if finished_suite:
+                finished_suites.append(finished_suite)
+
+        return current_time, finished_suites
+
+    def build_suite(self, starting_time, suite):
+        '''Convert a suite dict, with its child suites, into a Robot suite
+
+        Return: The ending time and the Robot suite, or None for empty `suite`
+        '''
+        self.refresh_timestamps()
+
+        if not suite:
+            return starting_time, None
+
+        stack = [self._start_suite(starting_time, suite)]
+        while True:
+            frame = stack[-1]
+            child_suite = next(frame.children, _END)
+            if child_suite is not _END:
+                if child_suite:
+                    stack.append(self._start_suite(frame.time, child_suite))
+                continue
+
+            suite = frame.suite
+            updated_time, robot_tests = self._build_tests(
+                frame.time, suite.get('tests') or ())
+            robot_suite = self.spawn_robot_suite(
+                suite.get('name') or 'Unknown Suite Name',
+                frame.start,
+                updated_time,
+                suite.get('tags') or [],
+                frame.robot_setup,
+                frame.robot_teardown,
+                frame.robot_suites,
+                robot_tests,
+                suite.get('metadata') or {})
+
+            stack.pop()
+            if not stack:
+                return max(updated_time, starting_time), robot_suite
+            parent = stack[-1]
+            parent.time = max(parent.time, updated_time)
+            if robot_suite:
+                parent.robot_suites.append(robot_suite)
+
+    def _start_suite(self, starting_time, suite):
+        '''Build the setup and teardown of `suite`, its child suites are
+        built next'''
+        frame = _SuiteFrame(self.get_start_time(suite, starting_time), suite)
+        frame.time, frame.robot_setup = self.build_keyword(
+            frame.time, suite.get('setup') or None, setup=True)
+        frame.time, frame.robot_teardown = self.build_keyword(
+            frame.time, suite.get('teardown') or None, teardown=True)
+        return frame
+
+    def build_tests(self, starting_time, *tests):
+        '''Convert a set of `tests` dicts and add to a Robot suite `target`'''
+        return self._build_tests(starting_time, tests)
+
+    def _build_tests(self, starting_time, tests):
+        '''Like `build_tests` for an iterable of `tests`, which is read one
+        test at a time'''
+        updated_time = starting_time
+        robot_tests = []
+        for test in tests:
+            updated_time, robot_test = self.build_test(updated_time, test)
+
+            if robot_test:
+                robot_tests.append(robot_test)
+
+        return updated_time, robot_tests
+
+    def build_test(self, starting_time, test):
+        '''Convert a set of `tests` dicts and add to a Robot suite `target`'''
+        if not test:
+            return starting_time, None
+
+        test_start = self.get_start_time(test, starting_time)
+        updated_time = test_start
+        test_name = test.get('name') or 'Unknown Test Name'
+        tags = test.get('tags') or []
+        setup_keyword = test.get('setup') or None
+        keywords = test.get('keywords') or []
+        teardown_keyword = test.get('teardown') or None
+
+        updated_time, robot_setup = self.build_keyword(updated_time,
+                                                       setup_keyword,
+                                                       setup=True)
+        updated_time, robot_keywords = self.build_keywords(updated_time,
+                                                           *keywords)
+        updated_time, robot_teardown = self.build_keyword(updated_time,
+                                                          teardown_keyword,
+                                                          teardown=True)
+
+        robot_test = self.spawn_robot_test(test_name,
+                                           test_start,
+                                           updated_time,
+                                           tags,
+                                           robot_setup,
+                                           robot_teardown,
+                                           robot_keywords)
+
+        return max(updated_time, starting_time), robot_test
+
+    def build_keywords(self, starting_time, *keywords):
+        '''Convert `keywords` dicts, add them as sub-keywords to a `target`'''
+        updated_time = starting_time
+        robot_keywords = []
+        for keyword in keywords:
+            updated_time, robot_keyword = self.build_keyword(updated_time, keyword)
+
+            if robot_keyword:
+                robot_keywords.append(robot_keyword)
+
+        return updated_time, robot_keywords
+
+    def build_keyword(self, starting_time, keyword, setup=False, teardown=False):
+        '''Convert a keyword dict, with its child keywords and teardown,
+        into a Robot keyword
+
+        Return: The ending time and the Robot keyword, or None for empty
+                `keyword`
+        '''
+        if not keyword:
+            return starting_time, None
+
+        stack = [_KeywordFrame(self.get_start_time(keyword, starting_time),
+                               keyword, setup, teardown)]
+        while True:
+            frame = stack[-1]
+            if frame.children:
+                child = frame.children.pop()
+                teardown = False
+            elif frame.teardown_keyword:
+                child = frame.teardown_keyword
+                frame.teardown_keyword = None
+                teardown = True
+            else:
+                stack.pop()
+                final_time, robot_keyword = self._finish_keyword(
+                    frame.keyword, frame.start, frame.time, frame.setup,
+                    frame.teardown, frame.robot_keywords, frame.robot_teardown)
+                if not stack:
+                    return max(final_time, starting_time), robot_keyword
+                parent = stack[-1]
+                parent.time = max(parent.time, final_time)
+                if frame.teardown:
+                    parent.robot_teardown = robot_keyword
+                elif robot_keyword:
+                    parent.robot_keywords.append(robot_keyword)
+                continue
+
+            if not child:
+                continue
+            child_start = self.get_start_time(child, frame.time)
+            if child.get('keywords') or child.get('teardown'):
+                stack.append(_KeywordFrame(child_start, child, False, teardown))
+                continue
+            # keywords without child keywords are built right away
+            final_time, robot_keyword = self._finish_keyword(
+                child, child_start, child_start, False, teardown, [], None)
+            frame.time = max(frame.time, final_time)
+            if teardown:
+                frame.robot_teardown = robot_keyword
+            elif robot_keyword:
+                frame.robot_keywords.append(robot_keyword)
+
+    def get_start_time(self, item, default):
+        '''Return: When `item` dict starts in milliseconds, `default` unless
+        it has `start`'''
+        start = item.get('start')
+        if start is None:
+            return default
+        return self.timestamps.from_epoch(start)
+
+    def _finish_keyword(self, keyword, starting_time, updated_time, setup,
+                        teardown, robot_keywords, robot_teardown):
+        elapsed = keyword.get('elapsed') or 0.0
+        # `elapsed` is the duration of the whole keyword, but it cannot end
+        # before its child keywords do
+        final_time = max(starting_time + elapsed, updated_time)
+
+        robot_keyword = self.spawn_robot_keyword(
+            keyword.get('name') or 'Unknown Keyword Name',
+            keyword.get('tags') or [],
+            keyword.get('pass'),
+            starting_time,
+            final_time,
+            robot_teardown,
+            robot_keywords,
+            keyword.get('messages') or [],
+            setup,
+            teardown)
+
+        return final_time, robot_keyword
+
+
+_END = object()
+
+
+class _SuiteFrame(object):
+    '''A suite being built by `RobotResultBuilder.build_suite`'''
+
+    __slots__ = ('suite', 'start', 'time', 'children', 'robot_setup',
+                 'robot_teardown', 'robot_suites')
+
+    def __init__(self, starting_time, suite):
+        self.suite = suite
+        self.start = starting_time
+        self.time = starting_time
+        # a lazy iterable is read one suite at a time
+        self.children = iter(suite.get('suites') or ())
+        self.robot_setup = None
+        self.robot_teardown = None
+        self.robot_suites = []
+
+
+class _KeywordFrame(object):
+    '''A keyword being built by `RobotResultBuilder.build_keyword`'''
+
+    __slots__ = ('keyword', 'start', 'time', 'setup', 'teardown', 'children',
+                 'teardown_keyword', 'robot_keywords', 'robot_teardown')
+
+    def __init__(self, starting_time, keyword, setup, teardown):
+        self.keyword = keyword
+        self.start = starting_time
+        self.time = starting_time
+        self.setup = setup
+        self.teardown = teardown
+        # child keywords are built first and the teardown last; children are
+        # popped from the end, so reversed
+        self.children = (keyword.get('keywords') or [])[::-1]
+        self.teardown_keyword = keyword.get('teardown') or None
+        self.robot_keywords = []
+        self.robot_teardown = None
+
+
+class TimestampFormatter(object):
+    '''Formats milliseconds since epoch to Robot Framework timestamps the
+    same way as `ms_to_timestamp` of the result interfaces, or to the
+    datetimes those timestamps stand for.
+
+    The timezone offset is fixed when the formatter is created, and the part
+    of the timestamp that changes only once a second is memoized, so most
+    timestamps are formatted with integer arithmetic only.
+    '''
+
+    MAX_SECONDS = 4096
+
+    def __init__(self, tz_delta):
+        self.tz_delta = tz_delta
+        self._offset = tz_delta.total_seconds() * 1000
+        self._seconds = {}
+        self._prefixes = {}
+
+    def _second(self, seconds):
+        second = self._seconds.get(seconds)
+        if second is None:
+            if len(self._seconds) >= self.MAX_SECONDS:
+                self._seconds.clear()
+            second = datetime.fromtimestamp(seconds) - self.tz_delta
+            if second.year < 1970:
+                second = datetime.fromtimestamp(0)
+            self._seconds[seconds] = second
+        return second
+
+    def _split(self, milliseconds):
+        '''Return: Whole seconds since the epoch in `milliseconds` and the
+        microseconds after them, rounded to the next second if need be'''
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        seconds = int(seconds)
+        microseconds = round(milliseconds * 1000)
+        if microseconds >= 1000000:
+            return seconds + 1, microseconds - 1000000
+        return seconds, microseconds
+
+    def format(self, milliseconds):
+        seconds, microseconds = self._split(milliseconds)
+        prefix = self._prefixes.get(seconds)
+        if prefix is None:
+            if len(self._prefixes) >= self.MAX_SECONDS:
+                self._prefixes.clear()
+            prefix = self._second(seconds).strftime('%Y%m%d %H:%M:%S')
+            self._prefixes[seconds] = prefix
+        return f'{prefix}.{microseconds:06d}'
+
+    def from_epoch(self, milliseconds):
+        '''Return: `milliseconds` since the epoch as the milliseconds that
+        `format` shows as the local time at that moment'''
+        return milliseconds + self._offset
+
+    def to_datetime(self, milliseconds):
+        seconds, microseconds = self._split(milliseconds)
+        return self._second(seconds) + timedelta(microseconds=microseconds)
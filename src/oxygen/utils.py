@@ -2,13 +2,16 @@ import os
 import subprocess
 import sys
 
+from glob import glob
 from pathlib import Path
 
-from .errors import (InvalidOxygenResultException,
-                     ResultFileIsNotAFileException,
+from .errors import (ResultFileIsNotAFileException,
                      ResultFileNotFoundException,
                      SubprocessException)
-from .oxygen_handler_result import validate_oxygen_suite
+from .oxygen_handler_result import OxygenResultValidator, has_lazy_parts
+
+VALIDATION_MODES = ('full', 'sample', 'off')
+DEFAULT_VALIDATION_SAMPLE_SIZE = 100
 
 def run_command_line(command, check_return_code=True, **env):
     new_env = os.environ.copy()
@@ -40,16 +43,115 @@ def validate_path(filepath):
                                             'but a directory')
     return path
 
-def validate_with_deprecation_warning(oxygen_result_dict, handler):
-    try:
-        validate_oxygen_suite(oxygen_result_dict)
-    except InvalidOxygenResultException as e:
-        import warnings
-        # this is not done with triple quotes intentionally
-        # to get sensible formatting to output
-        msg = (f'\n{handler.__module__} is producing invalid results:\n'
-               f'{e}\n\n'
-               'In Oxygen 1.0, handlers will need to produce valid '
-               'results.\nSee: '
-               'https://github.com/eficode/robotframework-oxygen/blob/master/parser_specification.md')
-        warnings.warn(msg)
+def is_output_file(path):
+    '''Return: Whether `path` is an output of an earlier conversion, or
+    hidden, which are not converted again'''
+    return path.name.startswith('.') or path.stem.endswith('_robot_output')
+
+def expand_result_files(result_files, directory_pattern='*'):
+    '''Expand directories and glob patterns to the result files in them
+
+    result_files: A path, directory or glob pattern, or a list of them
+    directory_pattern: Which files of directories are result files
+
+    Return: Paths as strings, in the given order and each expanded one
+            sorted; outputs of earlier conversions are left out
+    '''
+    if result_files is None:
+        raise ResultFileNotFoundException('You did not give any result '
+                                          'file to convert')
+    if isinstance(result_files, (str, Path)):
+        result_files = [result_files]
+    expanded = []
+    for result_file in map(str, result_files):
+        if Path(result_file).is_dir():
+            expanded.extend(
+                str(path) for path in
+                sorted(Path(result_file).glob(directory_pattern))
+                if path.is_file() and not is_output_file(path))
+        elif (not Path(result_file).exists()
+              and any(c in result_file for c in '*?[')):
+            expanded.extend(
+                path for path in sorted(glob(result_file, recursive=True))
+                if Path(path).is_file() and not is_output_file(Path(path)))
+        else:
+            expanded.append(result_file)
+    return expanded
+
+def create_validator(validation='full',
+                     sample_size=DEFAULT_VALIDATION_SAMPLE_SIZE):
+    '''
+    validation: One of `VALIDATION_MODES`; `sample` validates only
+                `sample_size` test cases picked at random, `off` nothing
+
+    Return: OxygenResultValidator for `validation`, None if it is `off`
+    '''
+    if validation == 'off':
+        return None
+    return OxygenResultValidator(
+        sample_size=sample_size if validation == 'sample' else None)
+
+def warn_if_invalid(validator, handler):
+    '''Warn about the errors `validator` found in results of `handler`, all
+    in one warning
+
+    Return: True if the results were valid
+    '''
+    if validator.finish():
+        return True
+    import warnings
+    # this is not done with triple quotes intentionally
+    # to get sensible formatting to output
+    msg = (f'\n{handler.__module__} is producing invalid results:\n'
+           f'{validator.summary()}\n\n'
+           'In Oxygen 1.0, handlers will need to produce valid '
+           'results.\nSee: '
+           'https://github.com/eficode/robotframework-oxygen/blob/master/parser_specification.md')
+    warnings.warn(msg)
+    return False
+
+def validate_with_deprecation_warning(oxygen_result_dict, handler,
+                                     validation='full',
+                                     sample_size=DEFAULT_VALIDATION_SAMPLE_SIZE):
+    '''Return: True if `oxygen_result_dict` is valid, False if it is invalid
+    or was not validated'''
+    validator = create_validator(validation, sample_size)
+    if validator is None:
+        return False
+    validator.validate(oxygen_result_dict)
+    return warn_if_invalid(validator, handler)
+
+def validate_as_read(oxygen_result_dict, handler, validation='full',
+                     sample_size=DEFAULT_VALIDATION_SAMPLE_SIZE,
+                     cache_entry=None):
+    '''Validate results that may have lazy child suites and test cases as
+    they are read, warning about invalid ones once all have been read
+
+    cache_entry: Optional `CacheEntry` the results are written into as they
+                 are read; it is committed if they were valid
+
+    Return: The results to read instead of `oxygen_result_dict`
+    '''
+    validator = create_validator(validation, sample_size)
+    if validator is None:
+        if cache_entry is not None:
+            cache_entry.discard()
+        return oxygen_result_dict
+    if not has_lazy_parts(oxygen_result_dict):
+        validator.validate(oxygen_result_dict)
+        if warn_if_invalid(validator, handler) and cache_entry is not None:
+            cache_entry.add('', oxygen_result_dict)
+            cache_entry.commit()
+        return oxygen_result_dict
+
+    def finish():
+        if warn_if_invalid(validator, handler) and cache_entry is not None:
+            cache_entry.commit()
+        elif cache_entry is not None:
+            cache_entry.discard()
+
+    return validator.wrap(
+        oxygen_result_dict,
+        on_read=None if cache_entry is None else cache_entry.add,
+        on_finish=finish,
+        on_abandon=None if cache_entry is None else cache_entry.discard)
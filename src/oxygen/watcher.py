@@ -0,0 +1,201 @@
+import json
+import os
+import select
+import struct
+import sys
+
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from pathlib import Path
+from time import monotonic, sleep
+
+
+class ResultWatcher(object):
+    '''ResultWatcher converts result files as soon as they appear in a
+    directory.
+
+    Completed files are detected with inotify where it is available (a file
+    is complete when its writer closes it or it is moved in) and by polling
+    modification times otherwise (a file is complete when its size and
+    modification time stay the same for one polling interval).
+
+    Every converted file is recorded into a JSON state file with the size and
+    modification time it had, so a restarted watcher only converts files that
+    are new or changed since.
+    '''
+
+    STATE_FILE = '.oxygen-watch-state.json'
+
+    def __init__(self, directory, convert, state_file=None, interval=1.0,
+                 ignore=None, use_inotify=True):
+        '''
+        directory: The directory to watch
+        convert: Callable converting a single result file path
+        state_file: Where converted files are recorded, defaults to a
+                    hidden file in `directory`
+        interval: Seconds between polls
+        ignore: Callable returning True for paths that are not result files
+        '''
+        self.directory = Path(directory)
+        self._convert = convert
+        self.state_file = Path(state_file or self.directory / self.STATE_FILE)
+        self.interval = interval
+        self._ignore = ignore or (lambda path: False)
+        self._use_inotify = use_inotify
+        self._pending = {}
+        self.state = self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_file) as state_file:
+                state = json.load(state_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            print(f'Oxygen: ignoring unreadable watch state file '
+                  f'"{self.state_file}"', file=sys.stderr)
+            return {}
+        return {path: tuple(signature) for path, signature in state.items()}
+
+    def _save_state(self):
+        tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+        with open(tmp_file, 'w') as state_file:
+            json.dump({path: list(signature)
+                       for path, signature in sorted(self.state.items())},
+                      state_file, indent=1)
+        os.replace(tmp_file, self.state_file)
+
+    def _signature(self, path):
+        try:
+            stat = path.stat()
+        except OSError:  # removed in the middle of a scan
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _candidates(self):
+        return sorted(path for path in self.directory.iterdir()
+                      if path.is_file() and not self._is_ignored(path))
+
+    def _is_ignored(self, path):
+        return (path.resolve() == self.state_file.resolve()
+                or path.name == self.state_file.name + '.tmp'
+                or self._ignore(path))
+
+    def check(self, path, complete=False):
+        '''Convert `path` if it is new or changed since it was converted.
+
+        Unless `complete` is True, `path` must look the same as in the
+        previous check before it is converted.
+
+        Return: True if `path` was converted
+        '''
+        signature = self._signature(path)
+        # files are recorded relative to the watched directory so that the
+        # state stays valid when the directory is moved with its state file
+        key = path.name
+        if signature is None or self.state.get(key) == signature:
+            self._pending.pop(key, None)
+            return False
+        if not complete and self._pending.get(key) != signature:
+            self._pending[key] = signature
+            return False
+        self._pending.pop(key, None)
+        try:
+            self._convert(str(path))
+        except Exception as e:
+            # recorded as well: a broken file is retried once it changes
+            print(f'Oxygen: converting "{path}" failed: {e}', file=sys.stderr)
+        self.state[key] = signature
+        self._save_state()
+        return True
+
+    def scan(self, complete=False):
+        '''Check every result file in the watched directory.
+
+        Return: The number of converted files
+        '''
+        return sum(self.check(path, complete) for path in self._candidates())
+
+    def run(self, once=False):
+        '''Convert result files until interrupted.
+
+        once: Convert what is in the directory now and return
+        '''
+        if once:
+            self.scan(complete=True)
+            return
+        inotify = _Inotify.create(self.directory) if self._use_inotify else None
+        try:
+            self.scan()
+            next_poll = monotonic() + self.interval
+            while True:
+                if inotify is None:
+                    sleep(self.interval)
+                    self.scan()
+                    continue
+                for name in inotify.read(max(0, next_poll - monotonic())):
+                    path = self.directory / name
+                    if path.is_file() and not self._is_ignored(path):
+                        self.check(path, complete=True)
+                if monotonic() >= next_poll:
+                    # files found at startup are settled by polling
+                    for name in list(self._pending):
+                        self.check(self.directory / name)
+                    next_poll = monotonic() + self.interval
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+
+class _Inotify(object):
+    '''Minimal inotify binding, just enough for ResultWatcher'''
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT = struct.Struct('iIII')
+
+    @classmethod
+    def create(cls, directory):
+        '''Return: Inotify watching `directory` or None if not available'''
+        try:
+            return cls(directory)
+        except (AttributeError, OSError):
+            return None
+
+    def __init__(self, directory):
+        libc = CDLL(find_library('c'), use_errno=True)
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(get_errno(), 'inotify_init1 failed')
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory),
+                                  self.IN_CLOSE_WRITE | self.IN_MOVED_TO) < 0:
+            errno = get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f'inotify_add_watch failed for {directory}')
+
+    def read(self, timeout):
+        '''Return: Names of the files completed within `timeout` seconds'''
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name:
+                names.append(os.fsdecode(name))
+        return list(dict.fromkeys(names))
+
+    def close(self):
+        os.close(self._fd)
@@ -95,11 +95,9 @@ class ZAProxyHandler(BaseHandler):
         zap_sites = zap_dict.get('site', [])
 
         return_dict['tags'] = self._tags
-        return_dict['suites'] = []
-
-        for zap_site in zap_sites:
-            parsed_site = self._parse_zap_site_dict(zap_site)
-            return_dict['suites'].append(parsed_site)
+        # sites are parsed lazily, when the suites are read
+        return_dict['suites'] = (self._parse_zap_site_dict(zap_site)
+                                 for zap_site in zap_sites)
 
         return return_dict
 
@@ -109,7 +107,6 @@ class ZAProxyHandler(BaseHandler):
 
         return_dict = {}
         return_dict['name'] = 'Site: {}'.format(site_name)
-        return_dict['tests'] = []
 
         zap_alerts = zap_site_dict.get('alerts', [])
         zap_alerts = zap_alerts or []
@@ -118,9 +115,9 @@ class ZAProxyHandler(BaseHandler):
             zap_alerts = zap_alerts.get('alertitem', [])
         if not isinstance(zap_alerts, list):
             zap_alerts = [zap_alerts]
-        for zap_alert in zap_alerts:
-            parsed_alert = self._parse_zap_alert_dict(zap_alert)
-            return_dict['tests'].append(parsed_alert)
+        # alerts are parsed lazily, when the tests are read
+        return_dict['tests'] = (self._parse_zap_alert_dict(zap_alert)
+                                for zap_alert in zap_alerts)
 
         return return_dict
 
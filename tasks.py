@@ -12,6 +12,7 @@ CURDIR = Path.cwd()
 SRCPATH = CURDIR / 'src'
 UNIT_TESTS = CURDIR / 'tests'
 DUMMYHANDLERS = UNIT_TESTS / 'resources' / 'my_dummy_handlers'
+BENCHMARKS = UNIT_TESTS / 'benchmark'
 
 # If you want colored output for the tasks, use `run()` with `pty=True`
 # Not on Windows, though -- it'll fail if you have `pty=True`
@@ -84,6 +85,21 @@ def atest(context, rf=''):
     finally:
         run('python -m oxygen --reset-config', env={'PYTHONPATH': pythonpath})
 
+@task(iterable=['bench'],
+      help={
+          'bench': 'Limit benchmark execution to specific benchmarks, e.g. '
+                   '"cli_conversion". Must be given multiple times to select '
+                   'several targets.'
+      })
+def benchmark(context, bench=None):
+    benchmarks = sorted(BENCHMARKS.glob('bench_*.py'))
+    if bench:
+        benchmarks = [b for b in benchmarks if b.stem[len('bench_'):] in bench]
+    for path in benchmarks:
+        run(f'python {path}',
+            env={'PYTHONPATH': str(SRCPATH)},
+            pty=(not system() == 'Windows'))
+
 @task
 def test(context):
     utest(context)
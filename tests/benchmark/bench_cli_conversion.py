@@ -0,0 +1,97 @@
+'''Compares the ways of turning parsed results into an output.xml:
+executing a generated suite with Robot Framework (the old `oxygen` CLI
+behaviour), saving the whole result model and streaming the results with
+`RobotOutputWriter` (the current `oxygen` CLI behaviour).
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_cli_conversion.py [TESTS]
+'''
+import sys
+
+from io import StringIO
+from tempfile import TemporaryDirectory
+from time import perf_counter, time
+from tracemalloc import get_traced_memory, start, stop
+
+from robot.result import Result
+
+from oxygen.output_writer import RobotOutputWriter
+from oxygen.robot_interface import RobotInterface
+
+
+def synthetic_results(test_count, tests_per_suite=100):
+    suites = []
+    for suite_index in range(0, test_count, tests_per_suite):
+        tests = []
+        for test_index in range(suite_index,
+                                min(test_count, suite_index + tests_per_suite)):
+            passed = bool(test_index % 10)
+            tests.append({
+                'name': f'test_{test_index}',
+                'tags': [],
+                'keywords': [{
+                    'name': f'test_{test_index} (Execution)',
+                    'pass': passed,
+                    'elapsed': 12.5,
+                    'messages': [] if passed else ['FAIL: boom (Assertion)']
+                }]
+            })
+        suites.append({'name': f'suite_{suite_index}', 'tests': tests})
+    return {'name': 'JUnit Execution', 'tags': [], 'suites': suites}
+
+
+def run_generated_suite(parsed_results, output):
+    robot_suite = RobotInterface().running.build_suite(parsed_results)
+    robot_suite.run(output=output, log=None, report=None, stdout=StringIO())
+
+
+def write_result_model(parsed_results, output):
+    _, robot_suite = RobotInterface().result.build_suite(int(time() * 1000),
+                                                         parsed_results)
+    result = Result(rpa=False)
+    result.suite = robot_suite
+    result.save(output)
+
+
+def stream_results(parsed_results, output):
+    RobotOutputWriter().write(output, int(time() * 1000), parsed_results)
+
+
+def timed(func, *args):
+    begin = perf_counter()
+    func(*args)
+    return perf_counter() - begin
+
+
+def peak_memory(func, *args):
+    start()
+    try:
+        func(*args)
+        return get_traced_memory()[1] / 2**20
+    finally:
+        stop()
+
+
+def main(test_count=20000):
+    parsed_results = synthetic_results(test_count)
+    with TemporaryDirectory() as tmp:
+        executed = timed(run_generated_suite, parsed_results,
+                         f'{tmp}/executed.xml')
+        direct = timed(write_result_model, parsed_results, f'{tmp}/direct.xml')
+        streamed = timed(stream_results, parsed_results, f'{tmp}/streamed.xml')
+        direct_peak = peak_memory(write_result_model, parsed_results,
+                                  f'{tmp}/direct.xml')
+        streamed_peak = peak_memory(stream_results, parsed_results,
+                                    f'{tmp}/streamed.xml')
+    print(f'{test_count} tests')
+    print(f'  executing generated suite: {executed:8.2f} s')
+    print(f'  saving result model:       {direct:8.2f} s '
+          f'(peak {direct_peak:.1f} MiB)')
+    print(f'  streaming results:         {streamed:8.2f} s '
+          f'(peak {streamed_peak:.1f} MiB)')
+    print(f'  speedup over execution:    {executed / streamed:8.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,75 @@
+'''Compares reading a Gatling simulation.log into lists of test cases (how
+the handler used to return them) with streaming the test cases one at a
+time from a text file and through `mmap` (`mmap: true`), including peak
+memory.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_gatling.py [REQUESTS]
+'''
+import sys
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from oxygen.gatling import GatlingHandler
+from oxygen.oxygen_handler_result import read_oxygen_suite
+
+START = 1600000000000
+
+
+def write_simulation_log(path, request_count):
+    with open(path, 'w') as log:
+        log.write(f'RUN\tbench.Simulation\tsimulation\t{START}\t \t3.9.5\n')
+        for index in range(request_count):
+            if index % 100 == 0:
+                log.write(f'USER\tUsers\tSTART\t{START + index}\t'
+                          f'{START + index}\n')
+            status = 'KO\tstatus.find.is(200) failed' if index % 50 == 0 \
+                else 'OK\t '
+            log.write(f'REQUEST\t\tRequest {index % 20}\t{START + index}\t'
+                      f'{START + index + 15}\t{status}\n')
+
+
+def read_into_lists(handler, path):
+    return len(read_oxygen_suite(handler.parse_results(path))['tests'])
+
+
+def stream(handler, path):
+    return sum(1 for _ in handler.parse_results(path)['tests'])
+
+
+def measure(func, *args):
+    start()
+    try:
+        begin = perf_counter()
+        count = func(*args)
+        elapsed = perf_counter() - begin
+        return count, elapsed, get_traced_memory()[1]
+    finally:
+        stop()
+
+
+def main(request_count=200000):
+    config = {'handler': 'GatlingHandler', 'keyword': 'run_gatling'}
+    text = GatlingHandler(config)
+    mapped = GatlingHandler(dict(config, mmap=True))
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'simulation.log'
+        write_simulation_log(path, request_count)
+        size = path.stat().st_size / 2**20
+        print(f'{request_count} requests, {size:.1f} MiB simulation.log')
+        for label, func, handler in (('read into lists:', read_into_lists,
+                                      text),
+                                     ('streamed:', stream, text),
+                                     ('streamed with mmap:', stream, mapped)):
+            count, elapsed, peak = measure(func, handler, str(path))
+            assert count == request_count, count
+            print(f'  {label:<20}{elapsed:8.3f} s  peak {peak / 2**20:8.1f} '
+                  'MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,55 @@
+'''Compares converting a Gatling simulation.log into an output.xml with one
+test case per request and with one test case per request name
+(`aggregate: true`): time, peak memory and size of the output.xml.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_gatling_aggregation.py [REQUESTS]
+'''
+import sys
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter, time
+from tracemalloc import get_traced_memory, start, stop
+
+from oxygen.gatling import GatlingHandler
+from oxygen.output_writer import RobotOutputWriter
+
+from bench_gatling import write_simulation_log
+
+
+def convert(handler, path, output):
+    RobotOutputWriter().write(output, int(time() * 1000),
+                              handler.parse_results(path))
+
+
+def measure(func, *args):
+    start()
+    try:
+        begin = perf_counter()
+        func(*args)
+        elapsed = perf_counter() - begin
+        return elapsed, get_traced_memory()[1]
+    finally:
+        stop()
+
+
+def main(request_count=200000):
+    config = {'handler': 'GatlingHandler', 'keyword': 'run_gatling'}
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'simulation.log'
+        write_simulation_log(path, request_count)
+        size = path.stat().st_size / 2**20
+        print(f'{request_count} requests, {size:.1f} MiB simulation.log')
+        for label, handler in (
+                ('one per request:', GatlingHandler(config)),
+                ('aggregated:', GatlingHandler(dict(config, aggregate=True)))):
+            output = Path(tmp) / 'output.xml'
+            elapsed, peak = measure(convert, handler, str(path), str(output))
+            print(f'  {label:<18}{elapsed:8.3f} s  peak {peak / 2**20:8.1f} '
+                  f'MiB  output.xml {output.stat().st_size / 2**20:8.2f} MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
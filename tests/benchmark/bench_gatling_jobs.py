@@ -0,0 +1,50 @@
+'''Compares aggregating a Gatling simulation.log (`aggregate: true`) in one
+process with reading it in parts in a pool of `jobs` processes, up to the
+number of CPU cores.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_gatling_jobs.py [REQUESTS]
+'''
+import os
+import sys
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from oxygen.gatling import GatlingHandler
+
+from bench_gatling import write_simulation_log
+
+
+def aggregate(jobs, path):
+    handler = GatlingHandler({'handler': 'GatlingHandler',
+                              'keyword': 'run_gatling',
+                              'aggregate': True,
+                              'jobs': jobs})
+    begin = perf_counter()
+    results = handler.parse_results(path)
+    return perf_counter() - begin, results
+
+
+def main(request_count=1000000):
+    cores = os.cpu_count() or 1
+    job_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'simulation.log'
+        write_simulation_log(path, request_count)
+        size = path.stat().st_size / 2**20
+        print(f'{request_count} requests, {size:.1f} MiB simulation.log, '
+              f'{cores} CPU cores')
+        baseline, expected = aggregate(1, str(path))
+        print(f'  jobs  1: {baseline:8.3f} s')
+        for jobs in job_counts[1:]:
+            elapsed, results = aggregate(jobs, str(path))
+            assert results == expected
+            print(f'  jobs {jobs:>2}: {elapsed:8.3f} s  '
+                  f'speedup {baseline / elapsed:5.2f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
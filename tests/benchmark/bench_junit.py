@@ -0,0 +1,110 @@
+'''Compares loading a JUnit report as a whole with junitparser (how the
+handler used to read reports) with streaming it like the handler does, both
+into lists of test cases and one test case at a time, including peak memory.
+
+The report is `tests/resources/big.xml` with its suites repeated COPIES
+times. junitparser is only needed for the comparison and skipped if it is
+not installed.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_junit.py [COPIES]
+'''
+import re
+import sys
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from oxygen.junit import JUnitHandler
+from oxygen.oxygen_handler_result import read_oxygen_suite
+
+BIG_XML = Path(__file__).resolve().parent.parent / 'resources' / 'big.xml'
+
+
+def write_report(path, copies):
+    content = BIG_XML.read_text()
+    suites = re.search(r'<testsuites[^>]*>(.*)</testsuites>', content,
+                       re.DOTALL).group(1)
+    with open(path, 'w') as report:
+        report.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>')
+        for _ in range(copies):
+            report.write(suites)
+        report.write('</testsuites>\n')
+
+
+def count_tests(suite):
+    return len(suite.get('tests', ())) + sum(count_tests(child)
+                                             for child in suite['suites'])
+
+
+def stream_tests(suite):
+    count = 0
+    for child in suite['suites']:
+        count += stream_tests(child)
+    return count + sum(1 for _ in suite.get('tests', ()))
+
+
+def load_with_junitparser(handler, path):
+    from junitparser import Error, Failure, JUnitXml
+
+    count = 0
+    for suite in JUnitXml.fromfile(path):
+        for case in suite:
+            messages = [f'{result.message} ({result.type})'
+                        for kind in (Error, Failure)
+                        for result in case.iterchildren(kind)]
+            (case.name, case.time, messages)
+            count += 1
+    return count
+
+
+def read_into_lists(handler, path):
+    return count_tests(read_oxygen_suite(handler.parse_results(path)))
+
+
+def stream(handler, path):
+    return stream_tests(handler.parse_results(path))
+
+
+def measure(func, *args):
+    start()
+    try:
+        begin = perf_counter()
+        count = func(*args)
+        elapsed = perf_counter() - begin
+        return count, elapsed, get_traced_memory()[1]
+    finally:
+        stop()
+
+
+def main(copies=100):
+    handler = JUnitHandler({'handler': 'JUnitHandler',
+                            'keyword': 'run_junit'})
+    benchmarks = [('streamed into lists:', read_into_lists),
+                  ('streamed:', stream)]
+    try:
+        import junitparser  # noqa: F401
+    except ImportError:
+        print('junitparser is not installed, skipping it')
+    else:
+        benchmarks.insert(0, ('junitparser:', load_with_junitparser))
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'big.xml'
+        write_report(path, copies)
+        size = path.stat().st_size / 2**20
+        expected = None
+        for label, func in benchmarks:
+            count, elapsed, peak = measure(func, handler, str(path))
+            if expected is None:
+                expected = count
+                print(f'{count} test cases, {size:.1f} MiB JUnit report')
+            assert count == expected, count
+            print(f'  {label:<22}{elapsed:8.3f} s  peak {peak / 2**20:8.1f} '
+                  'MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,135 @@
+'''Compares building Robot result objects out of Oxygen result dicts with
+the recursive builder Oxygen used to have and with the current
+`RobotResultBuilder` using explicit stacks.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_result_builder.py [KEYWORDS]
+'''
+import gc
+import sys
+
+from time import perf_counter
+
+from robot.api import ResultVisitor
+
+from oxygen.robot_interface import RobotInterface
+
+KEYWORDS_PER_TEST = 20
+TESTS_PER_SUITE = 50
+NESTING = 4
+
+
+class RecursiveInterface(type(RobotInterface().result)):
+    '''Result interface building suites and keywords recursively'''
+
+    def build_suite(self, starting_time, suite):
+        self.refresh_timestamps()
+        if not suite:
+            return starting_time, None
+        updated_time, robot_setup = self.build_keyword(
+            starting_time, suite.get('setup') or None, setup=True)
+        updated_time, robot_teardown = self.build_keyword(
+            updated_time, suite.get('teardown') or None, teardown=True)
+        updated_time, robot_suites = self.build_suites(
+            updated_time, *(suite.get('suites') or []))
+        updated_time, robot_tests = self.build_tests(
+            updated_time, *(suite.get('tests') or []))
+        return updated_time, self.spawn_robot_suite(
+            suite.get('name') or 'Unknown Suite Name', starting_time,
+            updated_time, suite.get('tags') or [], robot_setup,
+            robot_teardown, robot_suites, robot_tests,
+            suite.get('metadata') or {})
+
+    def build_keyword(self, starting_time, keyword, setup=False,
+                      teardown=False):
+        if not keyword:
+            return starting_time, None
+        updated_time, robot_keywords = self.build_keywords(
+            starting_time, *(keyword.get('keywords') or []))
+        updated_time, robot_teardown = self.build_keyword(
+            updated_time, keyword.get('teardown') or None, teardown=True)
+        final_time = max(starting_time + (keyword.get('elapsed') or 0.0),
+                         updated_time)
+        return final_time, self.spawn_robot_keyword(
+            keyword.get('name') or 'Unknown Keyword Name',
+            keyword.get('tags') or [], keyword.get('pass'), starting_time,
+            final_time, robot_teardown, robot_keywords,
+            keyword.get('messages') or [], setup, teardown)
+
+
+class Collector(ResultVisitor):
+
+    def __init__(self):
+        self.items = []
+
+    def _collect(self, item):
+        self.items.append((type(item).__name__, item.name, item.starttime,
+                           item.endtime))
+
+    start_suite = start_test = start_keyword = _collect
+
+
+def nested_keyword(level):
+    keyword = {'name': f'Level {level}', 'pass': True, 'elapsed': 1.5,
+               'messages': [f'level {level} done']}
+    if level:
+        keyword['keywords'] = [nested_keyword(level - 1)]
+        keyword['teardown'] = {'name': 'Clean Up', 'pass': True,
+                               'elapsed': 0.5}
+    return keyword
+
+
+def synthetic_results(keyword_count):
+    test_count = keyword_count // KEYWORDS_PER_TEST
+    # every top level keyword has NESTING keywords and teardowns below it
+    keywords_per_test = KEYWORDS_PER_TEST // (2 * NESTING + 1)
+    suites = []
+    for suite_index in range(0, test_count, TESTS_PER_SUITE):
+        tests = [{'name': f'Test {index}',
+                  'keywords': [nested_keyword(NESTING)
+                               for _ in range(keywords_per_test)]}
+                 for index in range(suite_index,
+                                    min(test_count,
+                                        suite_index + TESTS_PER_SUITE))]
+        suites.append({'name': f'Suite {suite_index}',
+                       'setup': {'name': 'Suite Setup', 'pass': True},
+                       'tests': tests})
+    return {'name': 'Results', 'suites': suites}
+
+
+def timed(interface, results):
+    best = float('inf')
+    for _ in range(3):
+        suite = None
+        gc.collect()
+        gc.disable()  # collections are triggered by earlier result objects
+        try:
+            begin = perf_counter()
+            _, suite = interface.build_suite(1533625284000, results)
+            best = min(best, perf_counter() - begin)
+        finally:
+            gc.enable()
+    return best, suite
+
+
+def collect(suite):
+    collector = Collector()
+    suite.visit(collector)
+    return collector.items
+
+
+def main(keyword_count=100000):
+    results = synthetic_results(keyword_count)
+    old, suite = timed(RecursiveInterface(), results)
+    items = collect(suite)
+    new, suite = timed(RobotInterface().result, results)
+    assert collect(suite) == items
+    print(f'{len(items)} suites, tests and keywords')
+    print(f'  recursive:       {old:8.3f} s {len(items) / old:10.0f} items/s')
+    print(f'  explicit stacks: {new:8.3f} s {len(items) / new:10.0f} items/s')
+    print(f'  speedup:         {old / new:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
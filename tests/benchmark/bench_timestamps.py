@@ -0,0 +1,49 @@
+'''Compares formatting Robot Framework timestamps by looking up the timezone
+offset and using datetime for every timestamp (the old `ms_to_timestamp`)
+and with the memoizing `TimestampFormatter` (the current one).
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_timestamps.py [TIMESTAMPS]
+'''
+import sys
+
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from oxygen.robot_interface import RobotInterface
+
+
+def ms_to_timestamp(milliseconds):
+    local_zone = datetime.now(timezone.utc).astimezone().tzinfo
+    tz_delta = local_zone.utcoffset(None)
+    time_object = datetime.fromtimestamp(int(milliseconds / 1000)) - tz_delta
+    if time_object.year < 1970:
+        time_object = datetime.fromtimestamp(0)
+    time_object += timedelta(milliseconds=(milliseconds % 1000))
+    return time_object.strftime('%Y%m%d %H:%M:%S.%f')
+
+
+def timed(func, values):
+    begin = perf_counter()
+    for value in values:
+        func(value)
+    return perf_counter() - begin
+
+
+def main(count=200000):
+    # keywords of a conversion are a few milliseconds apart
+    values = [1533625284000 + index * 3.5 for index in range(count)]
+    interface = RobotInterface().result
+    assert ([interface.ms_to_timestamp(v) for v in values[:1000]]
+            == [ms_to_timestamp(v) for v in values[:1000]])
+    old = timed(ms_to_timestamp, values)
+    new = timed(interface.ms_to_timestamp, values)
+    print(f'{count} timestamps')
+    print(f'  datetime per timestamp: {old:8.3f} s')
+    print(f'  memoized formatter:     {new:8.3f} s')
+    print(f'  speedup:                {old / new:8.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,88 @@
+'''Compares validating handler results with a new pydantic TypeAdapter per
+call (the old `validate_oxygen_suite`), with the cached adapter and with a
+random sample of test cases (`validation: sample`), and validating the
+whole dict at once with validating it one test case at a time with
+`OxygenResultValidator`, including peak memory.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_validation.py [TESTS]
+'''
+import sys
+import tracemalloc
+
+from time import perf_counter
+
+from pydantic import TypeAdapter
+
+from oxygen.oxygen_handler_result import (OxygenResultValidator,
+                                          OxygenSuiteDict,
+                                          validate_oxygen_suite,
+                                          validate_oxygen_suite_sample)
+from oxygen.utils import DEFAULT_VALIDATION_SAMPLE_SIZE
+
+TESTS_PER_SUITE = 100
+
+
+def synthetic_results(test_count):
+    return {'name': 'Results',
+            'suites': [{'name': f'Suite {suite_index}',
+                        'tests': [{'name': f'Test {index}',
+                                   'keywords': [{'name': 'Step',
+                                                 'pass': True,
+                                                 'elapsed': 1.0,
+                                                 'messages': ['done']}]}
+                                  for index in range(
+                                      suite_index,
+                                      min(test_count,
+                                          suite_index + TESTS_PER_SUITE))]}
+                       for suite_index in range(0, test_count,
+                                                TESTS_PER_SUITE)]}
+
+
+def timed(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        begin = perf_counter()
+        func(*args)
+        best = min(best, perf_counter() - begin)
+    return best
+
+
+def peak_memory(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(test_count=100000):
+    small = synthetic_results(10)
+    results = synthetic_results(test_count)
+    per_call = timed(lambda: [TypeAdapter(OxygenSuiteDict).validate_python(
+        small) for _ in range(100)])
+    cached = timed(lambda: [validate_oxygen_suite(small) for _ in range(100)])
+    full = timed(validate_oxygen_suite, results)
+    sample = timed(validate_oxygen_suite_sample, results,
+                   DEFAULT_VALIDATION_SAMPLE_SIZE)
+    streaming = timed(lambda: OxygenResultValidator().validate(results))
+    full_memory = peak_memory(validate_oxygen_suite, results)
+    streaming_memory = peak_memory(OxygenResultValidator().validate, results)
+    print('100 validations of 10 tests')
+    print(f'  new adapter per call: {per_call:8.3f} s')
+    print(f'  cached adapter:       {cached:8.3f} s')
+    print(f'  speedup:              {per_call / cached:8.1f}x')
+    print(f'{test_count} tests')
+    print(f'  full validation:      {full:8.3f} s')
+    label = f'sample of {DEFAULT_VALIDATION_SAMPLE_SIZE} tests:'
+    print(f'  {label:<22}{sample:8.3f} s')
+    print(f'  speedup:              {full / sample:8.1f}x')
+    print(f'  one test at a time:   {streaming:8.3f} s')
+    print(f'  peak memory, whole:   {full_memory / 2**20:8.1f} MiB')
+    print(f'  peak memory, streamed:{streaming_memory / 2**20:8.1f} MiB')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,90 @@
+'''Compares visiting an output.xml with OxygenVisitor with and without
+skipping the suites, keywords, statistics and errors that cannot contain
+test cases Oxygen replaces.
+
+Run with `invoke benchmark` or directly:
+
+    PYTHONPATH=src python tests/benchmark/bench_visitor_pruning.py [KEYWORDS]
+'''
+import sys
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter, time
+
+from robot.api import ExecutionResult, ResultVisitor
+
+from oxygen.oxygen import OxygenVisitor
+from oxygen.output_writer import RobotOutputWriter
+
+RESOURCES = Path(__file__).resolve().parent.parent / 'resources'
+KEYWORDS_PER_TEST = 10
+TESTS_PER_SUITE = 100
+
+
+class UnprunedVisitor(OxygenVisitor):
+    '''OxygenVisitor walking everything like ResultVisitor does by default'''
+    start_suite = ResultVisitor.start_suite
+    visit_keyword = ResultVisitor.visit_keyword
+    visit_statistics = ResultVisitor.visit_statistics
+    visit_errors = ResultVisitor.visit_errors
+
+
+def synthetic_output(path, keyword_count):
+    '''Write an output with `keyword_count` keywords where the first test
+    ran JUnit'''
+    test_count = keyword_count // KEYWORDS_PER_TEST
+    suites = []
+    for suite_index in range(0, test_count, TESTS_PER_SUITE):
+        tests = []
+        for test_index in range(suite_index,
+                                min(test_count,
+                                    suite_index + TESTS_PER_SUITE)):
+            keywords = [{'name': f'Step {index}',
+                         'pass': True,
+                         'keywords': [{'name': 'Log', 'pass': True,
+                                       'messages': ['step done']}]}
+                        for index in range(KEYWORDS_PER_TEST // 2 - 1)]
+            keywords.insert(0, {'name': 'Run JUnit' if test_index == 0
+                                        else 'Prepare',
+                                'pass': True})
+            keywords.append({'name': 'Clean Up', 'pass': True})
+            tests.append({'name': f'Test {test_index}', 'keywords': keywords})
+        suites.append({'name': f'Suite {suite_index}',
+                       'setup': {'name': 'Suite Setup', 'pass': True,
+                                 'messages': ['ready']},
+                       'tests': tests})
+    RobotOutputWriter().write(path, int(time() * 1000),
+                              {'name': 'Run', 'suites': suites})
+    return {'Run.Suite 0.Test 0': str(RESOURCES / 'green-junit-example.xml')}
+
+
+def timed_visit(visitor_class, output, data):
+    result = ExecutionResult(output)
+    visitor = visitor_class(data)
+    visitor.handlers  # loading handlers is not part of visiting
+    begin = perf_counter()
+    result.visit(visitor)
+    elapsed = perf_counter() - begin
+    return elapsed, len(result.suite.suites[0].suites)
+
+
+def main(keyword_count=100000):
+    with TemporaryDirectory() as tmp:
+        output = f'{tmp}/output.xml'
+        data = synthetic_output(output, keyword_count)
+        # best of several runs; the first one also fills the result cache
+        unpruned = min(timed_visit(UnprunedVisitor, output, data)
+                       for _ in range(3))
+        pruned = min(timed_visit(OxygenVisitor, output, data)
+                     for _ in range(3))
+    assert unpruned[1] == pruned[1] == 1, 'the JUnit test was not replaced'
+    unpruned, pruned = unpruned[0], pruned[0]
+    print(f'{keyword_count} keywords')
+    print(f'  visiting everything:   {unpruned:8.3f} s')
+    print(f'  visiting with pruning: {pruned:8.3f} s')
+    print(f'  speedup:               {unpruned / pruned:8.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
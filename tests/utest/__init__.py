@@ -0,0 +1,8 @@
+import os
+
+from tempfile import TemporaryDirectory
+
+# Keep the conversion cache of unit tests, and of the commands they run in
+# subprocesses, away from the user's cache and from earlier test runs
+_CACHE_DIR = TemporaryDirectory(prefix='oxygen-utest-cache-')
+os.environ['OXYGEN_CACHE_DIR'] = _CACHE_DIR.name
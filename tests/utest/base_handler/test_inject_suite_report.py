@@ -1,7 +1,10 @@
+from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from oxygen.base_handler import BaseHandler
+from robot.result import TestSuite
+
+from oxygen.base_handler import BaseHandler, inject_suite_reports
 from ..helpers import get_config
 
 
@@ -29,3 +32,66 @@ class TestInjectSuiteReport(TestCase):
     def test_finds_and_filters(self):
         self.handler._inject_suite_report(self.test, self.suite)
         self.assertEqual(self.parent.tests, [1, 2, 3])
+
+    def test_injecting_is_left_for_batch(self):
+        batch = []
+
+        self.handler._inject_suite_report(self.test, self.suite, batch)
+
+        self.assertEqual(batch, [(self.test, self.suite)])
+        self.test.parent.suites.append.assert_not_called()
+        self.assertEqual(self.parent.tests, [1, 2, self.test, 3])
+
+
+class TestInjectSuiteReports(TestCase):
+    def suite_with_tests(self, count):
+        suite = TestSuite(name='Suite')
+        for index in range(count):
+            suite.tests.create(name=f'Test {index}')
+        reports = [(test, TestSuite(name=f'Results {test.name}'))
+                   for test in suite.tests if test.name != 'Test 1']
+        return suite, reports
+
+    def test_replaces_tests_in_order(self):
+        suite, reports = self.suite_with_tests(4)
+
+        inject_suite_reports(suite, reports)
+
+        self.assertEqual([t.name for t in suite.tests], ['Test 1'])
+        self.assertIs(suite.tests[0].parent, suite)
+        self.assertEqual([s.name for s in suite.suites],
+                         ['Results Test 0', 'Results Test 2',
+                          'Results Test 3'])
+
+    def test_scans_tests_once(self):
+        # replacing tests one by one scanned the tests again for every report
+        class Tests(list):
+            scans = 0
+
+            def __iter__(self):
+                self.scans += 1
+                return super().__iter__()
+
+            def remove(self, item):
+                self.scans += 1
+                super().remove(item)
+
+            def index(self, *args):
+                self.scans += 1
+                return super().index(*args)
+
+            def __contains__(self, item):
+                self.scans += 1
+                return super().__contains__(item)
+
+        tests = Tests(SimpleNamespace(name=f'Test {index}')
+                      for index in range(1000))
+        suite = SimpleNamespace(tests=tests, suites=[])
+        reports = [(test, f'Results {test.name}') for test in tests[1:]]
+        tests.scans = 0
+
+        inject_suite_reports(suite, reports)
+
+        self.assertEqual(tests.scans, 1)
+        self.assertEqual([t.name for t in suite.tests], ['Test 0'])
+        self.assertEqual(len(suite.suites), 999)
@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import create_autospec
+
+from oxygen.base_handler import BaseHandler
+from oxygen.oxygen import OxygenVisitor
+from oxygen.robot_interface import get_keywords_from
+
+from ..helpers import (example_robot_output, get_config, lazy_suite,
+                       MINIMAL_SUITE_DICT)
+
+
+class TestParseTestResults(TestCase):
+    def setUp(self):
+        self.handler = BaseHandler(get_config()['oxygen.junit'])
+        self.handler.parse_results = create_autospec(
+            lambda result_file: None, return_value=MINIMAL_SUITE_DICT)
+        self.test = example_robot_output().suite.suites[0].tests[0]
+        self.data = {test.longname: 'path/to/results.xml'
+                     for test in self.test.parent.tests}
+
+    def test_results_are_parsed_when_keyword_was_used(self):
+        self.handler.parse_test_results(self.test, self.data)
+
+        self.handler.parse_results.assert_called_once_with(
+            'path/to/results.xml')
+
+    def test_results_are_not_parsed_when_keyword_was_not_used(self):
+        self.handler.keyword = 'run_something_else'
+
+        self.handler.parse_test_results(self.test, self.data)
+
+        self.handler.parse_results.assert_not_called()
+
+    def test_parsed_results_are_used_when_test_is_replaced(self):
+        self.handler.parse_test_results(self.test, self.data)
+
+        self.handler.check_for_keyword(self.test, self.data)
+
+        self.handler.parse_results.assert_called_once()
+        self.assertEqual(self.test.parent.suites[-1].name, 'Minimal Suite')
+
+    def test_replacing_is_left_for_batch(self):
+        keywords = get_keywords_from(self.test)
+        index = [self.handler._normalize_keyword_name(keyword.name)
+                 for keyword in keywords].index(self.handler.keyword)
+        batch = []
+
+        self.handler._replace_test(self.test, self.data, keywords, index,
+                                   batch=batch)
+
+        self.assertEqual([(test, suite.name) for test, suite in batch],
+                         [(self.test, 'Minimal Suite')])
+        self.assertIn(self.test, self.test.parent.tests)
+        self.assertEqual(list(self.test.parent.suites), [])
+
+    def test_results_are_read_in_full_when_parsed_ahead(self):
+        self.handler.parse_results.return_value = lazy_suite(
+            MINIMAL_SUITE_DICT)
+
+        self.handler.parse_test_results(self.test, self.data)
+
+        self.assertEqual(self.handler._parsed_results[self.test.longname],
+                         MINIMAL_SUITE_DICT)
+
+    def test_lazy_results_are_built_as_read(self):
+        self.handler.parse_results.return_value = lazy_suite(
+            {'name': 'Lazy', 'tests': [{'name': 'Invalid'}] * 3})
+
+        with self.assertWarns(UserWarning) as warnings:
+            self.handler.check_for_keyword(self.test, self.data)
+
+        self.assertEqual(len(warnings.warnings), 1)
+        self.assertIn('3 validation errors', str(warnings.warning))
+        self.assertEqual(len(self.test.parent.suites[-1].tests), 3)
+
+    def test_results_are_parsed_in_pool(self):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            visitor = OxygenVisitor(self.data)
+            visitor._handlers = {'oxygen.junit': self.handler}
+
+            visitor.parse_test_results(self.test, pool)
+            visitor.visit_test(self.test)
+
+        self.handler.parse_results.assert_called_once_with(
+            'path/to/results.xml')
+        self.assertEqual(self.test.parent.suites[-1].name, 'Minimal Suite')
+
+    def test_failures_are_left_for_visiting(self):
+        self.handler.parse_results.side_effect = ValueError('broken')
+        visitor = OxygenVisitor(self.data)
+        visitor._handlers = {'oxygen.junit': self.handler}
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            visitor.parse_test_results(self.test)
+            visitor.parse_test_results(self.test.parent.tests[1], pool)
+
+        self.assertEqual(self.handler.parse_results.call_count, 2)
+        with self.assertRaises(ValueError):
+            visitor.visit_test(self.test)
+        with self.assertRaises(ValueError):
+            visitor.visit_test(self.test.parent.tests[1])
+        # the failures are raised, not parsed again
+        self.assertEqual(self.handler.parse_results.call_count, 2)
+
+    def test_failing_to_start_parsing_is_left_for_visiting(self):
+        visitor = OxygenVisitor(self.data)
+        visitor._handlers = {'oxygen.junit': self.handler}
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.shutdown()
+
+        visitor.parse_test_results(self.test, pool)
+
+        with self.assertRaisesRegex(RuntimeError, 'shutdown'):
+            visitor.visit_test(self.test)
+        self.handler.parse_results.assert_not_called()
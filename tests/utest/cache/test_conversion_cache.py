@@ -0,0 +1,213 @@
+import os
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from oxygen.base_handler import BaseHandler
+from oxygen.cache import ConversionCache
+from oxygen.oxygen import OxygenCLI
+from oxygen.oxygen_handler_result import read_oxygen_suite
+
+from ..helpers import (get_config, MINIMAL_SUITE_DICT, MINIMAL_TC_DICT,
+                       RESOURCES_PATH)
+
+
+class CountingHandler(BaseHandler):
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.parsed = 0
+
+    def parse_results(self, result_file, option=None):
+        self.parsed += 1
+        return {'name': Path(result_file).read_text(), 'tests': []}
+
+
+class LazyHandler(CountingHandler):
+
+    test = MINIMAL_TC_DICT
+
+    def parse_results(self, result_file, option=None):
+        self.parsed += 1
+        return {'name': Path(result_file).read_text(),
+                'suites': ({'name': f'Suite {index}',
+                            'tests': (dict(self.test, name=f'Test {test}')
+                                      for test in range(index))}
+                           for index in range(3))}
+
+
+class TestConversionCache(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.cache = ConversionCache(self.tmp / 'cache')
+        self.handler = CountingHandler(get_config()['oxygen.junit'])
+        self.result_file = self.tmp / 'results.xml'
+        self.result_file.write_text('first')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _parse(self, *args, validate=lambda _: True, **kwargs):
+        def read(results, cache_entry):
+            if validate(results) and cache_entry is not None:
+                cache_entry.add('', results)
+                cache_entry.commit()
+            return results
+        return self.cache.parse(self.handler.parse_results, read, *args,
+                                **kwargs)
+
+    def test_unchanged_result_file_is_parsed_once(self):
+        first = self._parse(str(self.result_file))
+        second = self._parse(result_file=self.result_file)
+
+        self.assertEqual(first, {'name': 'first', 'tests': []})
+        self.assertEqual(second, first)
+        self.assertEqual(self.handler.parsed, 1)
+
+    def test_changed_content_arguments_or_config_are_parsed_again(self):
+        self._parse(str(self.result_file))
+        self.result_file.write_text('second')
+        self.assertEqual(self._parse(str(self.result_file))['name'], 'second')
+        self._parse(str(self.result_file), option=2)
+        self.handler._config = dict(self.handler._config, tags=['other'])
+        self._parse(str(self.result_file))
+
+        self.assertEqual(self.handler.parsed, 4)
+
+    def test_results_validated_differently_are_parsed_again(self):
+        self._parse(str(self.result_file), validation='sample',
+                    sample_size=10)
+        self._parse(str(self.result_file))
+        self._parse(str(self.result_file), validation='full', sample_size=10)
+        self._parse(str(self.result_file), validation='sample',
+                    sample_size=20)
+
+        self.assertEqual(self.handler.parsed, 3)
+
+    def test_invalid_results_are_not_cached(self):
+        validate = Mock(return_value=False)
+
+        self._parse(str(self.result_file), validate=validate)
+        self._parse(str(self.result_file), validate=validate)
+
+        self.assertEqual(validate.call_count, 2)
+        self.assertEqual(self.handler.parsed, 2)
+
+    def test_uncacheable_calls(self):
+        func = Mock(return_value=MINIMAL_SUITE_DICT)
+        for parse_results, args in ((func, (str(self.result_file),)),
+                                    (self.handler.parse_results, ('text',)),
+                                    (self.handler.parse_results,
+                                     (str(self.tmp),))):
+            self.assertIsNone(self.cache.key(parse_results, *args))
+
+        disabled = ConversionCache(self.tmp / 'cache', enabled=False)
+        self.assertIsNone(disabled.key(self.handler.parse_results,
+                                       str(self.result_file)))
+
+    def test_corrupted_entry_is_a_miss(self):
+        key = self.cache.key(self.handler.parse_results, str(self.result_file))
+        self.cache.put(key, MINIMAL_SUITE_DICT)
+        (self.tmp / 'cache' / f'{key}.json.z').write_bytes(b'garbage')
+
+        self.assertIsNone(self.cache.get(key))
+        self.assertFalse((self.tmp / 'cache' / f'{key}.json.z').exists())
+
+    def test_least_recently_used_entries_are_evicted(self):
+        entry_size = len(self._entry('x', 0).read_bytes())
+        self.cache.clear()
+        self.cache.max_size = 3 * entry_size
+        for age, key in enumerate(('a', 'b', 'c'), start=1):
+            self._entry(key, age)
+        self.cache.get('a')  # a is now the most recently used
+
+        self.cache.put('d', {'name': 'x'})
+
+        self.assertEqual(sorted(p.name[0] for p in
+                                (self.tmp / 'cache').glob('*.json.z')),
+                         ['a', 'c', 'd'])
+
+    def test_lazy_results_are_cached_once_read(self):
+        handler = LazyHandler(get_config()['oxygen.junit'])
+        results = self.cache.parse(handler.parse_results,
+                                   handler._validate_as_read,
+                                   str(self.result_file))
+        self.assertEqual(list(self.tmp.glob('cache/*.json.z')), [])
+
+        read = read_oxygen_suite(results)
+        again = self.cache.parse(handler.parse_results,
+                                 handler._validate_as_read,
+                                 str(self.result_file))
+
+        self.assertEqual(handler.parsed, 1)
+        self.assertEqual(again, read)
+        self.assertEqual(again['suites'][2]['tests'][1]['name'], 'Test 1')
+
+    def test_lazy_results_read_halfway_are_not_cached(self):
+        handler = LazyHandler(get_config()['oxygen.junit'])
+        results = self.cache.parse(handler.parse_results,
+                                   handler._validate_as_read,
+                                   str(self.result_file))
+
+        next(results['suites'])
+        del results
+
+        self.assertEqual(list(self.tmp.glob('cache/*')), [])
+
+    def test_invalid_lazy_results_are_not_cached(self):
+        handler = LazyHandler(get_config()['oxygen.junit'])
+        handler.test = {'name': 'Invalid'}
+
+        with self.assertWarns(UserWarning):
+            read_oxygen_suite(self.cache.parse(handler.parse_results,
+                                               handler._validate_as_read,
+                                               str(self.result_file)))
+
+        self.assertEqual(list(self.tmp.glob('cache/*')), [])
+
+    def _entry(self, key, age):
+        self.cache.put(key, {'name': 'x'})
+        path = self.tmp / 'cache' / f'{key}.json.z'
+        os.utime(path, ns=(age * 10**9, age * 10**9))
+        return path
+
+
+class TestConversionCacheInCLI(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+        self.cli = OxygenCLI()
+        self.result_file = str(RESOURCES_PATH / 'junit.xml')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _convert(self, **args):
+        with patch.dict(os.environ, {'OXYGEN_CACHE_DIR': str(self.cache_dir)}):
+            self.cli.convert_to_robot_result(dict(
+                args,
+                result_file=self.result_file,
+                func=self.cli.handlers['oxygen.junit'].parse_results,
+                output=self.cache_dir / 'output.xml'))
+
+    def test_conversion_is_cached(self):
+        self._convert()
+
+        self.assertEqual(len(list(self.cache_dir.glob('*.json.z'))), 1)
+
+    def test_validation_on_command_line_is_part_of_the_key(self):
+        self._convert(validation='sample')
+        self._convert(validation='full')
+        self._convert()
+
+        self.assertEqual(len(list(self.cache_dir.glob('*.json.z'))), 2)
+
+    def test_no_cache(self):
+        self._convert(no_cache=True)
+
+        self.assertEqual(list(self.cache_dir.glob('*.json.z')), [])
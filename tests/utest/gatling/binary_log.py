@@ -0,0 +1,136 @@
+import struct
+
+from oxygen.gatling_binary import ERROR, GROUP, REQUEST, RUN, USER
+
+
+class BinaryLogWriter(object):
+    '''Writes binary simulation.log records for tests, see
+    `oxygen.gatling_binary`'''
+
+    def __init__(self, run_start):
+        self.run_start = run_start
+        self.data = bytearray()
+        self._strings = {}
+
+    def run(self, version, simulation, description, scenarios,
+            assertions=()):
+        self._byte(RUN)
+        self._string(version)
+        self._string(simulation)
+        self.data += struct.pack('>q', self.run_start)
+        self._string(description)
+        self._int(len(scenarios))
+        for scenario in scenarios:
+            self._string(scenario)
+        self._int(len(assertions))
+        for assertion in assertions:
+            self._int(len(assertion))
+            self.data += assertion
+        return self
+
+    def user(self, scenario, started, timestamp):
+        self._byte(USER)
+        self._int(scenario)
+        self._byte(started)
+        self._timestamp(timestamp)
+        return self
+
+    def request(self, groups, name, start, end, ok, message=''):
+        self._byte(REQUEST)
+        self._groups(groups)
+        self._cached_string(name)
+        self._timestamp(start)
+        self._timestamp(end)
+        self._byte(ok)
+        self._cached_string(message)
+        return self
+
+    def group(self, groups, start, end, cumulated, ok):
+        self._byte(GROUP)
+        self._groups(groups)
+        self._timestamp(start)
+        self._timestamp(end)
+        self._int(cumulated)
+        self._byte(ok)
+        return self
+
+    def error(self, message, timestamp):
+        self._byte(ERROR)
+        self._cached_string(message)
+        self._timestamp(timestamp)
+        return self
+
+    def _byte(self, value):
+        self.data.append(int(value))
+
+    def _int(self, value):
+        self.data += struct.pack('>i', value)
+
+    def _timestamp(self, timestamp):
+        self._int(timestamp - self.run_start)
+
+    def _string(self, string):
+        try:
+            data, coder = string.encode('latin-1'), 0
+        except UnicodeEncodeError:
+            data, coder = string.encode('utf-16-le'), 1
+        self._int(len(data))
+        if data:
+            self.data += data
+            self._byte(coder)
+
+    def _cached_string(self, string):
+        if string in self._strings:
+            self._int(-self._strings[string])
+            return
+        self._strings[string] = len(self._strings) + 1
+        self._int(self._strings[string])
+        self._string(string)
+
+    def _groups(self, groups):
+        self._int(len(groups))
+        for group in groups:
+            self._cached_string(group)
+
+
+def example_binary_log():
+    '''Return: The content of tests/resources/gatling/binary-simulation.log
+    '''
+    start = 1600000000000
+    return bytes(
+        BinaryLogWriter(start)
+        .run('3.9.5', 'computerdatabase.BasicSimulation', '',
+             ['Users', 'Admins'], [b'\x00\x01assertion'])
+        .user(0, True, start + 100)
+        .request([], 'Home', start + 200, start + 250, True)
+        .request(['Search'], 'Find', start + 300, start + 390, False,
+                 'status.find.is(200) failed')
+        .user(1, True, start + 310)
+        .request(['Search'], 'Find', start + 400, start + 420, True)
+        .request(['Search', 'Pages'], 'Sivu ☃', start + 430, start + 445,
+                 True)
+        .group(['Search'], start + 290, start + 450, 125, False)
+        .error("Failed to build request: No attribute named 'id'",
+               start + 500)
+        .request([], 'Home', start + 550, start + 560, False,
+                 'status.find.is(200) failed')
+        .user(0, False, start + 600)
+        .user(1, False, start + 610)
+        .data)
+
+
+# What binary-simulation.log has, as a text simulation.log
+EXAMPLE_TEXT_LOG = '''\
+RUN\tcomputerdatabase.BasicSimulation\t\t1600000000000\t\t3.9.5
+USER\tUsers\tSTART\t1600000000100\t1600000000100
+REQUEST\t\tHome\t1600000000200\t1600000000250\tOK\t 
+REQUEST\tSearch\tFind\t1600000000300\t1600000000390\tKO\tstatus.find.is(200) failed
+USER\tAdmins\tSTART\t1600000000310\t1600000000310
+REQUEST\tSearch\tFind\t1600000000400\t1600000000420\tOK\t 
+REQUEST\tSearch,Pages\tSivu ☃\t1600000000430\t1600000000445\tOK\t 
+GROUP\tSearch\t1600000000290\t1600000000450\t125\tKO
+ERROR\tFailed to build request: No attribute named 'id'\t1600000000500
+REQUEST\t\tHome\t1600000000550\t1600000000560\tKO\tstatus.find.is(200) failed
+USER\tUsers\tEND\t1600000000600\t1600000000600
+USER\tAdmins\tEND\t1600000000610\t1600000000610
+'''
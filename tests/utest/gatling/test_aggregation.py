@@ -0,0 +1,147 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from oxygen.errors import GatlingHandlerException
+from oxygen.gatling import GatlingHandler
+from oxygen.oxygen_handler_result import validate_oxygen_suite
+
+from ..helpers import get_config, RESOURCES_PATH
+from .test_simulation_log import SIMULATION_LOG
+
+# simulation.log of Gatling before 3.4, with scenario and user id
+OLD_SIMULATION_LOG = '''\
+RUN\tBasicSimulation\tbasicsimulation\t1533120478000\t \t2.0
+REQUEST\tUsers\t1\t\tHome\t1533120479000\t1533120479010\tOK\t 
+REQUEST\tAdmins\t2\t\tHome\t1533120479100\t1533120479130\tOK\t 
+REQUEST\tUsers\t1\tSearch\tHome\t1533120479200\t1533120479220\tKO\ttimeout
+GROUP\tUsers\t1\tSearch\t1533120479190\t1533120479230\t20\tKO
+'''
+
+
+class TestAggregation(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.log = Path(self._tmp.name) / 'simulation.log'
+        self.log.write_text(SIMULATION_LOG)
+        self.handler = GatlingHandler(get_config()['oxygen.gatling'])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _summaries(self, results):
+        return [(test['name'], test['keywords'][0]['pass'],
+                 test['keywords'][0]['messages'][0])
+                for test in results['tests']]
+
+    def test_one_test_case_per_name(self):
+        results = self.handler.parse_results(self.log, aggregate=True)
+
+        validate_oxygen_suite(results)
+        self.assertEqual(results['start'], 1600000000000)
+        self.assertEqual(results['metadata'],
+                         {'Requests': '2',
+                          'KO': '1 (50.00%)',
+                          'Response time (ms)': 'min 50, mean 70, max 90',
+                          'Percentiles (ms)': 'p50 50, p75 90, p95 90, '
+                                              'p99 90'})
+        self.assertEqual(
+            [(test['name'], test['start'], test['keywords'][0]['pass'],
+              test['keywords'][0]['messages']) for test in results['tests']],
+            [('Home', 1600000000200, True,
+              ['Requests: 1, OK: 1, KO: 0 (0.00%)',
+               'Response time (ms): min 50, mean 50, max 50',
+               'Percentiles (ms): p50 50, p75 50, p95 50, p99 50']),
+             ('Find', 1600000000300, False,
+              ['Requests: 1, OK: 0, KO: 1 (100.00%)',
+               'Response time (ms): min 90, mean 90, max 90',
+               'Percentiles (ms): p50 90, p75 90, p95 90, p99 90',
+               'KO (1): status.find.is(200) failed']),
+             ('Group Search', 1600000000290, False,
+              ['Requests: 1, OK: 0, KO: 1 (100.00%)',
+               'Response time (ms): min 110, mean 110, max 110',
+               'Percentiles (ms): p50 110, p75 110, p95 110, p99 110',
+               'KO (1): ']),
+             ("ERROR: Failed to build request: No attribute named 'id'",
+              1600000000500, False,
+              ['Errors: 1',
+               "Failed to build request: No attribute named 'id'"])])
+
+    def test_requests_with_the_same_name_are_counted_together(self):
+        self.log.write_text(OLD_SIMULATION_LOG)
+
+        results = self.handler.parse_results(self.log, aggregate=True)
+
+        self.assertEqual(results['start'], 1533120478000)
+        self.assertEqual(self._summaries(results),
+                         [('Home', False,
+                           'Requests: 3, OK: 2, KO: 1 (33.33%)'),
+                          ('Group Search', False,
+                           'Requests: 1, OK: 0, KO: 1 (100.00%)')])
+        home, _ = results['tests']
+        self.assertEqual(home['start'], 1533120479000)
+        self.assertEqual(home['keywords'][0]['elapsed'], 220)
+
+    def test_aggregating_by_scenario_and_group(self):
+        self.log.write_text(OLD_SIMULATION_LOG)
+
+        by_scenario = self.handler.parse_results(self.log, aggregate=True,
+                                                 aggregate_by=['scenario'])
+        by_both = self.handler.parse_results(self.log, aggregate=True,
+                                             aggregate_by=['group',
+                                                           'scenario'])
+
+        self.assertEqual([test['name'] for test in by_scenario['tests']],
+                         ['Users / Home', 'Admins / Home',
+                          'Users / Group Search'])
+        self.assertEqual([test['name'] for test in by_both['tests']],
+                         ['Users / Home', 'Admins / Home',
+                          'Users / Search / Home', 'Users / Group Search'])
+
+    def test_configuration(self):
+        self.handler._config = dict(self.handler._config, aggregate=True,
+                                    aggregate_by='group')
+
+        results = self.handler.parse_results(self.log)
+
+        self.assertEqual([test['name'] for test in results['tests'][:2]],
+                         ['Home', 'Search / Find'])
+
+    def test_unknown_aggregation_key(self):
+        with self.assertRaises(GatlingHandlerException):
+            self.handler.parse_results(self.log, aggregate=True,
+                                       aggregate_by=['user'])
+
+    def test_empty_log(self):
+        self.log.write_text('')
+
+        results = self.handler.parse_results(self.log, aggregate=True)
+
+        self.assertEqual(results['tests'], [])
+        self.assertEqual(results['metadata'], {'Requests': '0'})
+        self.assertNotIn('start', results)
+
+    def test_example_log(self):
+        results = self.handler.parse_results(
+            RESOURCES_PATH / 'gatling-example-simulation.log', aggregate=True)
+
+        validate_oxygen_suite(results)
+        self.assertEqual(results['metadata']['Requests'], '105')
+        self.assertLess(len(results['tests']), 105)
+
+    def test_cli(self):
+        parser = ArgumentParser()
+        for flags, params in self.handler.cli().items():
+            parser.add_argument(*flags, **params)
+
+        args = parser.parse_args(['simulation.log', '--aggregate',
+                                  '--aggregate-by', 'scenario',
+                                  '--aggregate-by', 'group'])
+
+        self.assertEqual(vars(args),
+                         {'result_file': 'simulation.log',
+                          'aggregate': True,
+                          'aggregate_by': ['scenario', 'group'],
+                          'assertions': None})
@@ -0,0 +1,137 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from oxygen.errors import GatlingHandlerException
+from oxygen.gatling import GatlingHandler
+from oxygen.oxygen_handler_result import (read_oxygen_suite,
+                                          validate_oxygen_suite)
+
+from ..helpers import get_config
+
+START = 1600000000000
+
+
+def simulation_log():
+    lines = [f'RUN\tSimulation\tsimulation\t{START}\t \t3.9.5']
+    for index in range(100):
+        start = START + index * 100
+        status = 'KO\ttimeout' if index % 25 == 0 else 'OK\t '
+        lines.append(f'REQUEST\t\tHome\t{start}\t{start + index + 1}\t'
+                     f'{status}')
+        lines.append(f'REQUEST\t\tSearch\t{start}\t{start + 500}\tOK\t ')
+    return '\n'.join(lines) + '\n'
+
+
+class TestAssertions(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.log = Path(self._tmp.name) / 'simulation.log'
+        self.log.write_text(simulation_log())
+        self.handler = GatlingHandler(get_config()['oxygen.gatling'])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _assert(self, *assertions, aggregate=False):
+        self.handler._config = dict(self.handler._config,
+                                    assertions=list(assertions))
+        results = read_oxygen_suite(
+            self.handler.parse_results(self.log, aggregate=aggregate))
+        validate_oxygen_suite(results)
+        return [(test['name'], test['keywords'][0]['pass'],
+                 test['keywords'][0]['messages'][0])
+                for test in results['tests']
+                if test['name'].startswith('SLA: ')]
+
+    def test_assertions_are_test_cases(self):
+        assertions = ({'p95': 500},
+                      {'request': 'Home', 'p99': 99, 'error_rate': 4,
+                       'max': 100},
+                      {'request': 'Search', 'mean': 499},
+                      {'throughput': 19},
+                      {'request': 'Home', 'throughput': 9, 'window': 1})
+
+        expected = [
+            ('SLA: p95 <= 500 ms', True, 'Measured 500 ms over 200 requests'),
+            ('SLA: p99 of Home <= 99 ms', True,
+             'Measured 99 ms over 100 requests'),
+            ('SLA: error rate of Home <= 4%', True,
+             'Measured 4.00% (4 of 100 requests KO)'),
+            ('SLA: max of Home <= 100 ms', True,
+             'Measured 100 ms over 100 requests'),
+            ('SLA: mean of Search <= 499 ms', False,
+             'Measured 500 ms over 100 requests'),
+            ('SLA: throughput >= 19 req/s', True,
+             'Measured 19.2 req/s over 200 requests'),
+            # the last request ends in a window of its own
+            ('SLA: throughput of Home >= 9 req/s in every 1 s', True,
+             'Measured 9.0 req/s in the slowest 1 s window')]
+        self.assertEqual(self._assert(*assertions), expected)
+        self.assertEqual(self._assert(*assertions, aggregate=True), expected)
+
+    def test_assertions_come_after_requests(self):
+        self.handler._config = dict(self.handler._config,
+                                    assertions=[{'p50': 1000}])
+
+        tests = list(self.handler.parse_results(self.log)['tests'])
+
+        self.assertEqual(len(tests), 201)
+        self.assertEqual(tests[-1]['name'], 'SLA: p50 <= 1000 ms')
+        self.assertEqual(tests[-1]['start'], START)
+
+    def test_assertion_without_matching_requests_fails(self):
+        self.assertEqual(self._assert({'request': 'Login', 'p95': 100}),
+                         [('SLA: p95 of Login <= 100 ms', False,
+                           'No requests named Login')])
+
+    def test_assertions_argument_overrides_configuration(self):
+        self.handler._config = dict(self.handler._config,
+                                    assertions=[{'p50': 1000}])
+        expected = [('SLA: p95 of Home <= 99 ms', True,
+                     'Measured 95 ms over 100 requests'),
+                    ('SLA: error rate <= 1%', False,
+                     'Measured 2.00% (4 of 200 requests KO)')]
+
+        for assertions in ([{'request': 'Home', 'p95': 99},
+                            {'error_rate': 1}],
+                           '[{request: Home, p95: 99}, {error_rate: 1}]',
+                           '[{"request": "Home", "p95": 99}, '
+                           '{"error_rate": 1}]'):
+            tests = self.handler.parse_results(self.log,
+                                               assertions=assertions)['tests']
+            self.assertEqual([(test['name'], test['keywords'][0]['pass'],
+                               test['keywords'][0]['messages'][0])
+                              for test in tests
+                              if test['name'].startswith('SLA: ')],
+                             expected)
+        tests = self.handler.parse_results(self.log, assertions=[])['tests']
+        self.assertEqual(len(list(tests)), 200)
+
+    def test_assertions_on_command_line(self):
+        parser = ArgumentParser()
+        for flags, params in self.handler.cli().items():
+            parser.add_argument(*flags, **params)
+
+        args = parser.parse_args(['simulation.log',
+                                  '--assertions', '{p95: 500}'])
+
+        self.assertEqual(args.assertions, '{p95: 500}')
+        tests = list(self.handler.parse_results(self.log,
+                                                assertions=args.assertions)
+                     ['tests'])
+        self.assertEqual(tests[-1]['name'], 'SLA: p95 <= 500 ms')
+
+    def test_invalid_assertions(self):
+        for assertion in ('p95 < 100', {}, {'request': 'Home'},
+                          {'p95': 100, 'window': 10}, {'p95': 'fast'},
+                          {'latency': 100}):
+            self.handler._config = dict(self.handler._config,
+                                        assertions=[assertion])
+            with self.assertRaises(GatlingHandlerException):
+                self.handler.parse_results(self.log)
+        for assertions in ('[{p95: 100', 'p95', ['p95 < 100']):
+            with self.assertRaises(GatlingHandlerException):
+                self.handler.parse_results(self.log, assertions=assertions)
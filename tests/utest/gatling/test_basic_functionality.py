@@ -7,7 +7,7 @@ from testfixtures import compare
 from oxygen.base_handler import BaseHandler
 from oxygen.gatling import GatlingHandler
 from oxygen.errors import GatlingHandlerException
-from oxygen.oxygen_handler_result import validate_oxygen_suite
+from oxygen.oxygen_handler_result import read_oxygen_suite, validate_oxygen_suite
 from ..helpers import (example_robot_output,
                        GATLING_EXPECTED_OUTPUT,
                        get_config,
@@ -29,7 +29,7 @@ class GatlingBasicTests(TestCase):
         mock_validate_path.return_value = m
         self.handler.parse_results('some/file/path.ext')
         mock_validate_path.assert_called_once_with('some/file/path.ext')
-        mock_transform.assert_called_once_with(m.resolve())
+        mock_transform.assert_called_once_with(m.resolve(), [])
 
     @patch('oxygen.utils.subprocess')
     def test_running(self, mock_subprocess):
@@ -71,8 +71,18 @@ class GatlingBasicTests(TestCase):
         retval = self.handler.run_gatling('somefile', 'some command')
         self.assertEqual(retval, 'somefile')
 
+    @patch('oxygen.utils.subprocess')
+    def test_running_with_assertions(self, mock_subprocess):
+        mock_subprocess.run.return_value = Mock(returncode=0)
+        retval = self.handler.run_gatling('somefile', 'some command',
+                                          assertions=[{'p95': 500}])
+        self.assertEqual(retval, ('somefile', False, None, [{'p95': 500}]))
+
     def test_cli(self):
-        self.assertEqual(self.handler.cli(), BaseHandler.DEFAULT_CLI)
+        self.assertEqual(list(self.handler.cli()),
+                         list(BaseHandler.DEFAULT_CLI)
+                         + [('--aggregate',), ('--aggregate-by',),
+                            ('--assertions',)])
 
     @patch('oxygen.gatling.GatlingHandler._report_oxygen_run')
     def test_check_for_keyword(self, mock_report):
@@ -81,12 +91,21 @@ class GatlingBasicTests(TestCase):
 
         self.handler.check_for_keyword(fake_test, expected_data)
 
-        self.assertEqual(mock_report.call_args[0][0].name,
+        keyword = mock_report.call_args[0][0]
+        # RF 7 keeps the library name apart from the keyword name
+        self.assertEqual(getattr(keyword, 'full_name', keyword.name),
                          'oxygen.OxygenLibrary.Run Gatling')
         self.assertEqual(self.handler.run_time_data, 'somefile.lol')
 
     def test_gatling_parsing(self):
         example_file = RESOURCES_PATH / 'gatling-example-simulation.log'
-        retval = self.handler._transform_tests(example_file)
+        retval = read_oxygen_suite(self.handler._transform_tests(example_file))
         compare(retval, GATLING_EXPECTED_OUTPUT)
         self.assertTrue(validate_oxygen_suite(retval))
+
+    def test_test_cases_are_read_lazily(self):
+        example_file = RESOURCES_PATH / 'gatling-example-simulation.log'
+        retval = self.handler._transform_tests(example_file)
+
+        self.assertEqual(next(retval['tests']),
+                         GATLING_EXPECTED_OUTPUT['tests'][0])
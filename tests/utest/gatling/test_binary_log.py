@@ -0,0 +1,137 @@
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from oxygen.errors import GatlingHandlerException
+from oxygen.gatling import GatlingHandler
+from oxygen.gatling_binary import BinaryLogReader, is_binary_log
+from oxygen.oxygen_handler_result import (read_oxygen_suite,
+                                          validate_oxygen_suite)
+
+from ..helpers import get_config, RESOURCES_PATH
+from .binary_log import (BinaryLogWriter, example_binary_log,
+                         EXAMPLE_TEXT_LOG)
+
+BINARY_LOG = RESOURCES_PATH / 'gatling' / 'binary-simulation.log'
+START = 1600000000000
+
+
+class TestBinaryLog(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.text_log = Path(self._tmp.name) / 'simulation.log'
+        self.text_log.write_text(EXAMPLE_TEXT_LOG, encoding='utf-8')
+        self.handler = GatlingHandler(get_config()['oxygen.gatling'])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, data):
+        path = Path(self._tmp.name) / 'binary.log'
+        path.write_bytes(bytes(data))
+        return path
+
+    def _records(self, data):
+        return list(BinaryLogReader(BytesIO(bytes(data))).records())
+
+    def test_fixture_is_up_to_date(self):
+        self.assertEqual(BINARY_LOG.read_bytes(), example_binary_log())
+
+    def test_records_of_gatling(self):
+        # written out by hand like Gatling's LogFileDataWriter writes them,
+        # independently of BinaryLogWriter
+        def string(text):
+            return len(text).to_bytes(4, 'big') + text.encode() + b'\x00'
+
+        def integer(value):
+            return value.to_bytes(4, 'big', signed=True)
+
+        data = (b'\x00' + string('3.9.5') + string('Sim')
+                + START.to_bytes(8, 'big') + integer(0)
+                + integer(1) + string('Users') + integer(0)
+                + b'\x02' + integer(0) + b'\x01' + integer(5)
+                + b'\x01' + integer(0) + integer(1) + string('Home')
+                + integer(10) + integer(30) + b'\x00' + integer(2)
+                + string('KO!')
+                + b'\x04' + integer(-2) + integer(40))
+
+        self.assertEqual(self._records(data), [
+            ['RUN', 'Sim', '', str(START), '', '3.9.5'],
+            ['USER', 'Users', 'START', str(START + 5), str(START + 5)],
+            ['REQUEST', '', 'Home', str(START + 10), str(START + 30), 'KO',
+             'KO!'],
+            ['ERROR', 'KO!', str(START + 40)]])
+
+    def test_detection(self):
+        self.assertTrue(is_binary_log(BINARY_LOG))
+        self.assertFalse(is_binary_log(self.text_log))
+        self.assertFalse(is_binary_log(
+            RESOURCES_PATH / 'gatling-example-simulation.log'))
+        self.assertFalse(is_binary_log(self._write(b'')))
+
+    def test_records_are_like_in_text_logs(self):
+        with open(BINARY_LOG, 'rb') as log:
+            records = list(BinaryLogReader(log).records())
+
+        self.assertEqual(records,
+                         [line.strip().split('\t')
+                          for line in EXAMPLE_TEXT_LOG.splitlines()])
+
+    def test_parsed_like_text_logs(self):
+        binary = read_oxygen_suite(self.handler.parse_results(BINARY_LOG))
+
+        validate_oxygen_suite(binary)
+        self.assertEqual(len(binary['tests']), 7)
+        self.assertEqual(binary['start'], START)
+        self.assertEqual(
+            binary, read_oxygen_suite(self.handler.parse_results(self.text_log)))
+
+    def test_aggregated_like_text_logs(self):
+        self.handler._config = dict(self.handler._config, aggregate=True,
+                                    jobs=2, assertions=[{'p95': 100}])
+
+        binary = self.handler.parse_results(BINARY_LOG)
+
+        self.assertEqual(binary, self.handler.parse_results(self.text_log))
+        self.assertEqual([test['name'] for test in binary['tests']],
+                         ['Home', 'Find', 'Sivu ☃', 'Group Search',
+                          "ERROR: Failed to build request: No attribute "
+                          "named 'id'",
+                          'SLA: p95 <= 100 ms'])
+
+    def test_truncated_log_ends_at_last_complete_record(self):
+        data = example_binary_log()
+        records = self._records(data)
+
+        for cut in range(1, 40):
+            truncated = self._records(data[:-cut])
+            self.assertEqual(truncated, records[:len(truncated)])
+            self.assertLess(len(truncated), len(records))
+
+    def test_unknown_record_type(self):
+        data = bytearray(BinaryLogWriter(START).run('3.9.5', 'Sim', '', [])
+                         .data)
+        data.append(9)
+
+        with self.assertRaisesRegex(GatlingHandlerException,
+                                    'Unknown record type 9 at byte 39'):
+            self._records(data)
+
+    def test_unknown_cached_string(self):
+        data = BinaryLogWriter(START).run('3.9.5', 'Sim', '', []).data
+        data += bytes([4]) + (-5).to_bytes(4, 'big', signed=True)
+
+        with self.assertRaisesRegex(GatlingHandlerException,
+                                    'Unknown cached string 5'):
+            self._records(data + bytes(4))
+
+    def test_strings_in_utf_16(self):
+        data = (BinaryLogWriter(START).run('3.9.5', 'Sim', '', [])
+                .error('Virhe ☃', START + 1)
+                .error('Virhe ☃', START + 2).data)
+
+        self.assertEqual(self._records(data)[1:],
+                         [['ERROR', 'Virhe ☃', str(START + 1)],
+                          ['ERROR', 'Virhe ☃', str(START + 2)]])
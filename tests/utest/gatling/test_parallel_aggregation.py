@@ -0,0 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from oxygen.errors import GatlingHandlerException
+from oxygen.gatling import GatlingHandler
+
+from ..helpers import get_config
+
+START = 1600000000000
+
+
+def simulation_log(request_count):
+    lines = [f'RUN\tSimulation\tsimulation\t{START}\t \t3.9.5']
+    for index in range(request_count):
+        start = START + index * 7
+        if index % 40 == 0:
+            lines.append(f'USER\tUsers\tSTART\t{start}\t{start}')
+        if index % 97 == 0:
+            lines.append(f'ERROR\tCannot resolve host {index % 3}\t{start}')
+        if index % 50 == 0:
+            lines.append(f'GROUP\tSearch\t{start}\t{start + 90}\t80\tOK')
+        status = (f'KO\tstatus.find.is(200) failed, found {index % 5}'
+                  if index % 13 == 0 else 'OK\t ')
+        lines.append(f'REQUEST\tSearch\tRequest {index % 17}\t{start}\t'
+                     f'{start + index % 3000}\t{status}')
+    return '\n'.join(lines) + '\n'
+
+
+class TestParallelAggregation(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.log = Path(self._tmp.name) / 'simulation.log'
+        self.log.write_text(simulation_log(3000))
+        self.config = dict(get_config()['oxygen.gatling'], aggregate=True,
+                           assertions=[{'p95': 2000, 'error_rate': 5},
+                                       {'request': 'Request 3',
+                                        'throughput': 5, 'window': 2}])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _parse(self, jobs, **kwargs):
+        handler = GatlingHandler(dict(self.config, jobs=jobs))
+        handler.CHUNK_SIZE = 4096
+        handler.MIN_PARALLEL_SIZE = 0
+        return handler.parse_results(self.log, **kwargs)
+
+    def test_results_do_not_depend_on_jobs(self):
+        sequential = self._parse(1)
+
+        for jobs in (2, 3):
+            self.assertEqual(self._parse(jobs), sequential)
+        self.assertEqual(self._parse(2, aggregate_by=['group']),
+                         self._parse(1, aggregate_by=['group']))
+
+    def test_ko_messages_do_not_depend_on_jobs(self):
+        # more distinct KO messages than are counted, first seen in a
+        # different order in every part
+        self.log.write_text(''.join(
+            f'REQUEST\t\tRequest\t{START + index}\t{START + index + 5}\tKO\t'
+            f'failed {index % 23}\n' for index in range(3000)))
+
+        sequential = self._parse(1)
+
+        messages = sequential['tests'][0]['keywords'][0]['messages']
+        self.assertEqual(messages[3:], [f'KO (131): failed {index}'
+                                        for index in range(10)]
+                         + ['KO (1690): other messages'])
+        for jobs in (2, 3):
+            self.assertEqual(self._parse(jobs), sequential)
+
+    def test_chunks_are_read_in_a_process_pool(self):
+        with patch('oxygen.gatling.ProcessPoolExecutor',
+                   wraps=ProcessPoolExecutor) as pool:
+            self._parse(3)
+
+        pool.assert_called_once_with(max_workers=3)
+
+    def test_small_files_are_read_in_one_go(self):
+        handler = GatlingHandler(dict(self.config, jobs=4))
+
+        with patch('oxygen.gatling.ProcessPoolExecutor') as pool:
+            handler.parse_results(self.log)
+
+        pool.assert_not_called()
+
+    def test_invalid_jobs(self):
+        for jobs in (0, -1, 'many', 1.5, True):
+            with self.assertRaises(GatlingHandlerException):
+                self._parse(jobs)
+
+
+class TestChunks(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.log = Path(self._tmp.name) / 'simulation.log'
+        self.handler = GatlingHandler(get_config()['oxygen.gatling'])
+        self.handler.MIN_PARALLEL_SIZE = 0
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _chunks(self, content, chunk_size, jobs=100):
+        self.log.write_bytes(content)
+        self.handler.CHUNK_SIZE = chunk_size
+        return self.handler._chunks(self.log, jobs)
+
+    def test_chunks_are_whole_lines(self):
+        content = b''.join(b'x' * (index % 23) + b'\n'
+                           for index in range(500))
+
+        chunks = self._chunks(content, 100)
+
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], len(content))
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(content[start - 1:start], b'\n')
+        self.assertTrue(all(end - start <= 100 + 23
+                            for start, end in chunks))
+
+    def test_lines_longer_than_chunks(self):
+        content = b'a\n' + b'b' * 1000 + b'\nc\nd'
+
+        self.assertEqual(self._chunks(content, 100),
+                         [(0, 1003), (1003, 1006)])
+
+    def test_chunks_are_spread_over_jobs(self):
+        content = b'line\n' * 1000
+
+        self.assertEqual(len(self._chunks(content, 2**20, jobs=4)), 4)
+
+    def test_small_files_are_not_split(self):
+        self.handler.MIN_PARALLEL_SIZE = 2**20
+
+        self.assertEqual(self._chunks(b'line\n' * 1000, 100), [])
@@ -0,0 +1,67 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from oxygen.gatling import GatlingHandler
+from oxygen.oxygen_handler_result import read_oxygen_suite
+
+from ..helpers import GATLING_EXPECTED_OUTPUT, get_config, RESOURCES_PATH
+
+# simulation.log of Gatling 3.4 and later, without scenario and user id
+SIMULATION_LOG = '''\
+RUN\tcomputerdatabase.BasicSimulation\tbasicsimulation\t1600000000000\t \t3.4.0
+USER\tUsers\tSTART\t1600000000100\t1600000000100
+REQUEST\t\tHome\t1600000000200\t1600000000250\tOK\t 
+REQUEST\tSearch\tFind\t1600000000300\t1600000000390\tKO\tstatus.find.is(200) failed
+GROUP\tSearch\t1600000000290\t1600000000400\t90\tKO
+ERROR\tFailed to build request: No attribute named 'id'\t1600000000500
+USER\tUsers\tEND\t1600000000100\t1600000000600
+'''
+
+
+class TestSimulationLog(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.log = Path(self._tmp.name) / 'simulation.log'
+        self.log.write_text(SIMULATION_LOG)
+        self.handler = GatlingHandler(get_config()['oxygen.gatling'])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _parse(self, log):
+        return read_oxygen_suite(self.handler.parse_results(log))
+
+    def test_all_record_types(self):
+        results = self._parse(self.log)
+
+        self.assertEqual(results['start'], 1600000000000)
+        self.assertEqual(
+            [(test['name'], test['start'], test['keywords'][0]['elapsed'],
+              test['keywords'][0]['pass'], test['keywords'][0]['messages'])
+             for test in results['tests']],
+            [('Home', 1600000000200, 50, True, []),
+             ('Find', 1600000000300, 90, False,
+              ['status.find.is(200) failed']),
+             ('Group Search', 1600000000290, 110, False, ['']),
+             ("ERROR: Failed to build request: No attribute named 'id'",
+              1600000000500, 0, False,
+              ["Failed to build request: No attribute named 'id'"])])
+
+    def test_groups_of_older_gatling_versions(self):
+        self.log.write_text('GROUP\tUsers\t1\tSearch\t1533120479221\t'
+                            '1533120479313\t92\tOK\n')
+
+        test, = self._parse(self.log)['tests']
+
+        self.assertEqual(test['name'], 'Group Search')
+        self.assertEqual(test['keywords'][0]['elapsed'], 92)
+
+    def test_reading_through_mmap(self):
+        self.handler._config = dict(self.handler._config, mmap=True)
+        example_file = RESOURCES_PATH / 'gatling-example-simulation.log'
+
+        self.assertEqual(self._parse(example_file), GATLING_EXPECTED_OUTPUT)
+        self.log.write_text('')
+        self.assertEqual(self._parse(self.log)['tests'], [])
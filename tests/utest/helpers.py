@@ -53,10 +53,29 @@ def suppress_stdout():
     finally:
         sys.stdout = old
 
+@contextmanager
+def suppress_stderr():
+    old = sys.stderr
+    sys.stderr = StringIO()
+    try:
+        yield sys.stderr
+    finally:
+        sys.stderr = old
+
 def example_robot_output():
     output = RESOURCES_PATH / 'example_robot_output.xml'
     return ExecutionResult(output)
 
+def lazy_suite(suite):
+    '''Return: Copy of `suite` with child suites and test cases, at every
+    level, as generators like handlers may give them'''
+    lazy = dict(suite)
+    if 'suites' in suite:
+        lazy['suites'] = (lazy_suite(child) for child in suite['suites'])
+    if 'tests' in suite:
+        lazy['tests'] = (test for test in suite['tests'])
+    return lazy
+
 MINIMAL_KEYWORD_DICT = { 'name': 'someKeyword', 'pass': True }
 MINIMAL_TC_DICT = { 'name': 'Minimal TC', 'keywords': [MINIMAL_KEYWORD_DICT] }
 MINIMAL_SUITE_DICT = {'name': 'Minimal Suite',
@@ -84,638 +103,849 @@ class _StrSubclass(str):
     pass
 
 GATLING_EXPECTED_OUTPUT = {'name': 'Gatling Scenario',
+ 'start': 1533120477681,
  'tags': ['GATLING'],
- 'tests': [{'keywords': [{
+ 'tests': [{'keywords': [{'elapsed': 92,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Home | '
                                   '1533120479221 | 1533120479313 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120479221}],
+            'name': 'Home',
+            'start': 1533120479221},
+           {'keywords': [{'elapsed': 174,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Home | '
                                   '1533120479124 | 1533120479298 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120479124}],
+            'name': 'Home',
+            'start': 1533120479124},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Home Redirect 1 | '
                                   '1533120479321 | 1533120479368 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120479321}],
+            'name': 'Home Redirect 1',
+            'start': 1533120479321},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Home Redirect 1 | '
                                   '1533120479321 | 1533120479367 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120479321}],
+            'name': 'Home Redirect 1',
+            'start': 1533120479321},
+           {'keywords': [{'elapsed': 186,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Home | '
                                   '1533120480235 | 1533120480421 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120480235}],
+            'name': 'Home',
+            'start': 1533120480235},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Home Redirect 1 | '
                                   '1533120480422 | 1533120480466 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120480422}],
+            'name': 'Home Redirect 1',
+            'start': 1533120480422},
+           {'keywords': [{'elapsed': 334,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Search | '
                                   '1533120480410 | 1533120480744 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120480410}],
+            'name': 'Search',
+            'start': 1533120480410},
+           {'keywords': [{'elapsed': 361,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Search | '
                                   '1533120480407 | 1533120480768 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120480407}],
+            'name': 'Search',
+            'start': 1533120480407},
+           {'keywords': [{'elapsed': 88,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Home | '
                                   '1533120481234 | 1533120481322 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120481234}],
+            'name': 'Home',
+            'start': 1533120481234},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Home Redirect 1 | '
                                   '1533120481323 | 1533120481368 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120481323}],
+            'name': 'Home Redirect 1',
+            'start': 1533120481323},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Search | '
                                   '1533120481486 | 1533120481533 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120481486}],
+            'name': 'Search',
+            'start': 1533120481486},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Select | '
                                   '1533120481736 | 1533120481783 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120481736}],
+            'name': 'Select',
+            'start': 1533120481736},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Select | '
                                   '1533120481756 | 1533120481800 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120481756}],
+            'name': 'Select',
+            'start': 1533120481756},
+           {'keywords': [{'elapsed': 92,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Home | '
                                   '1533120482095 | 1533120482187 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120482095}],
+            'name': 'Home',
+            'start': 1533120482095},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Home Redirect 1 | '
                                   '1533120482188 | 1533120482235 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120482188}],
+            'name': 'Home Redirect 1',
+            'start': 1533120482188},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Search | '
                                   '1533120482385 | 1533120482431 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120482385}],
+            'name': 'Search',
+            'start': 1533120482385},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Select | '
                                   '1533120482536 | 1533120482582 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120482536}],
+            'name': 'Select',
+            'start': 1533120482536},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Page 0 | '
                                   '1533120482801 | 1533120482848 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120482801}],
+            'name': 'Page 0',
+            'start': 1533120482801},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Page 0 | '
                                   '1533120482804 | 1533120482848 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120482804}],
+            'name': 'Page 0',
+            'start': 1533120482804},
+           {'keywords': [{'elapsed': 94,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Home | '
                                   '1533120483096 | 1533120483190 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483096}],
+            'name': 'Home',
+            'start': 1533120483096},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Home Redirect 1 | '
                                   '1533120483191 | 1533120483238 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483191}],
+            'name': 'Home Redirect 1',
+            'start': 1533120483191},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Search | '
                                   '1533120483256 | 1533120483303 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483256}],
+            'name': 'Search',
+            'start': 1533120483256},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Select | '
                                   '1533120483436 | 1533120483482 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483436}],
+            'name': 'Select',
+            'start': 1533120483436},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Page 0 | '
                                   '1533120483585 | 1533120483631 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483585}],
+            'name': 'Page 0',
+            'start': 1533120483585},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Page 1 | '
                                   '1533120483835 | 1533120483881 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483835}],
+            'name': 'Page 1',
+            'start': 1533120483835},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Page 1 | '
                                   '1533120483845 | 1533120483889 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120483845}],
+            'name': 'Page 1',
+            'start': 1533120483845},
+           {'keywords': [{'elapsed': 96,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Home | '
                                   '1533120484086 | 1533120484182 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484086}],
+            'name': 'Home',
+            'start': 1533120484086},
+           {'keywords': [{'elapsed': 126,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Home | '
                                   '1533120484095 | 1533120484221 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484095}],
+            'name': 'Home',
+            'start': 1533120484095},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Home Redirect 1 | '
                                   '1533120484183 | 1533120484228 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484183}],
+            'name': 'Home Redirect 1',
+            'start': 1533120484183},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Home Redirect 1 | '
                                   '1533120484222 | 1533120484269 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484222}],
+            'name': 'Home Redirect 1',
+            'start': 1533120484222},
+           {'keywords': [{'elapsed': 48,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Search | '
                                   '1533120484255 | 1533120484303 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484255}],
+            'name': 'Search',
+            'start': 1533120484255},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Select | '
                                   '1533120484305 | 1533120484352 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484305}],
+            'name': 'Select',
+            'start': 1533120484305},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Page 0 | '
                                   '1533120484476 | 1533120484523 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484476}],
+            'name': 'Page 0',
+            'start': 1533120484476},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Page 1 | '
                                   '1533120484635 | 1533120484679 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484635}],
+            'name': 'Page 1',
+            'start': 1533120484635},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Page 2 | '
                                   '1533120484887 | 1533120484933 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484887}],
+            'name': 'Page 2',
+            'start': 1533120484887},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Page 2 | '
                                   '1533120484896 | 1533120484940 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120484896}],
+            'name': 'Page 2',
+            'start': 1533120484896},
+           {'keywords': [{'elapsed': 86,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Home | '
                                   '1533120485084 | 1533120485170 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485084}],
+            'name': 'Home',
+            'start': 1533120485084},
+           {'keywords': [{'elapsed': 54,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Home Redirect 1 | '
                                   '1533120485171 | 1533120485225 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485171}],
+            'name': 'Home Redirect 1',
+            'start': 1533120485171},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Search | '
                                   '1533120485246 | 1533120485291 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485246}],
+            'name': 'Search',
+            'start': 1533120485246},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Search | '
                                   '1533120485286 | 1533120485331 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485286}],
+            'name': 'Search',
+            'start': 1533120485286},
+           {'keywords': [{'elapsed': 51,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Select | '
                                   '1533120485306 | 1533120485357 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485306}],
+            'name': 'Select',
+            'start': 1533120485306},
+           {'keywords': [{'elapsed': 63,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Page 0 | '
                                   '1533120485345 | 1533120485408 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485345}],
+            'name': 'Page 0',
+            'start': 1533120485345},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Page 1 | '
                                   '1533120485536 | 1533120485583 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485536}],
+            'name': 'Page 1',
+            'start': 1533120485536},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Page 2 | '
                                   '1533120485676 | 1533120485720 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485676}],
+            'name': 'Page 2',
+            'start': 1533120485676},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Page 3 | '
                                   '1533120485936 | 1533120485981 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485936}],
+            'name': 'Page 3',
+            'start': 1533120485936},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 1 |  | Page 3 | '
                                   '1533120485936 | 1533120485982 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120485936}],
+            'name': 'Page 3',
+            'start': 1533120485936},
+           {'keywords': [{'elapsed': 81,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Home | '
                                   '1533120486085 | 1533120486166 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486085}],
+            'name': 'Home',
+            'start': 1533120486085},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Home Redirect 1 | '
                                   '1533120486167 | 1533120486212 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486167}],
+            'name': 'Home Redirect 1',
+            'start': 1533120486167},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Search | '
                                   '1533120486247 | 1533120486291 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486247}],
+            'name': 'Search',
+            'start': 1533120486247},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Select | '
                                   '1533120486295 | 1533120486340 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486295}],
+            'name': 'Select',
+            'start': 1533120486295},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Select | '
                                   '1533120486335 | 1533120486380 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486335}],
+            'name': 'Select',
+            'start': 1533120486335},
+           {'keywords': [{'elapsed': 48,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Page 0 | '
                                   '1533120486355 | 1533120486403 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486355}],
+            'name': 'Page 0',
+            'start': 1533120486355},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Page 1 | '
                                   '1533120486414 | 1533120486460 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486414}],
+            'name': 'Page 1',
+            'start': 1533120486414},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Page 2 | '
                                   '1533120486586 | 1533120486631 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486586}],
+            'name': 'Page 2',
+            'start': 1533120486586},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 2 |  | Page 3 | '
                                   '1533120486716 | 1533120486761 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486716}],
+            'name': 'Page 3',
+            'start': 1533120486716},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Form | '
                                   '1533120486987 | 1533120487033 | OK',
-                          'pass': True}],
-            'name': 'Form'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120486987}],
+            'name': 'Form',
+            'start': 1533120486987},
+           {'keywords': [{'elapsed': 97,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Home | '
                                   '1533120487094 | 1533120487191 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487094}],
+            'name': 'Home',
+            'start': 1533120487094},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Home Redirect 1 | '
                                   '1533120487192 | 1533120487237 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487192}],
+            'name': 'Home Redirect 1',
+            'start': 1533120487192},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Search | '
                                   '1533120487236 | 1533120487280 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487236}],
+            'name': 'Search',
+            'start': 1533120487236},
+           {'keywords': [{'elapsed': 48,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Select | '
                                   '1533120487284 | 1533120487332 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487284}],
+            'name': 'Select',
+            'start': 1533120487284},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Page 0 | '
                                   '1533120487334 | 1533120487378 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487334}],
+            'name': 'Page 0',
+            'start': 1533120487334},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Page 0 | '
                                   '1533120487375 | 1533120487420 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487375}],
+            'name': 'Page 0',
+            'start': 1533120487375},
+           {'keywords': [{'elapsed': 48,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Page 1 | '
                                   '1533120487416 | 1533120487464 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487416}],
+            'name': 'Page 1',
+            'start': 1533120487416},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Page 2 | '
                                   '1533120487455 | 1533120487502 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487455}],
+            'name': 'Page 2',
+            'start': 1533120487455},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 3 |  | Page 3 | '
                                   '1533120487615 | 1533120487662 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120487615}],
+            'name': 'Page 3',
+            'start': 1533120487615},
+           {'keywords': [{'elapsed': 50,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Post | '
                                   '1533120488053 | 1533120488103 | OK',
-                          'pass': True}],
-            'name': 'Post'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488053}],
+            'name': 'Post',
+            'start': 1533120488053},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 4 |  | Post Redirect 1 | '
                                   '1533120488113 | 1533120488157 | OK',
-                          'pass': True}],
-            'name': 'Post Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488113}],
+            'name': 'Post Redirect 1',
+            'start': 1533120488113},
+           {'keywords': [{'elapsed': 85,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Home | '
                                   '1533120488096 | 1533120488181 | OK',
-                          'pass': True}],
-            'name': 'Home'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488096}],
+            'name': 'Home',
+            'start': 1533120488096},
+           {'keywords': [{'elapsed': 67,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Home Redirect 1 | '
                                   '1533120488182 | 1533120488249 | OK',
-                          'pass': True}],
-            'name': 'Home Redirect 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488182}],
+            'name': 'Home Redirect 1',
+            'start': 1533120488182},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Search | '
                                   '1533120488256 | 1533120488300 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488256}],
+            'name': 'Search',
+            'start': 1533120488256},
+           {'keywords': [{'elapsed': 43,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Select | '
                                   '1533120488276 | 1533120488319 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488276}],
+            'name': 'Select',
+            'start': 1533120488276},
+           {'keywords': [{'elapsed': 56,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Page 0 | '
                                   '1533120488334 | 1533120488390 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488334}],
+            'name': 'Page 0',
+            'start': 1533120488334},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Page 1 | '
                                   '1533120488384 | 1533120488429 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488384}],
+            'name': 'Page 1',
+            'start': 1533120488384},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Page 1 | '
                                   '1533120488425 | 1533120488471 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488425}],
+            'name': 'Page 1',
+            'start': 1533120488425},
+           {'keywords': [{'elapsed': 48,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Page 2 | '
                                   '1533120488465 | 1533120488513 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488465}],
+            'name': 'Page 2',
+            'start': 1533120488465},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 5 |  | Page 3 | '
                                   '1533120488504 | 1533120488549 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120488504}],
+            'name': 'Page 3',
+            'start': 1533120488504},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Search | '
                                   '1533120489266 | 1533120489311 | OK',
-                          'pass': True}],
-            'name': 'Search'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489266}],
+            'name': 'Search',
+            'start': 1533120489266},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Select | '
                                   '1533120489306 | 1533120489348 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489306}],
+            'name': 'Select',
+            'start': 1533120489306},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Page 0 | '
                                   '1533120489316 | 1533120489358 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489316}],
+            'name': 'Page 0',
+            'start': 1533120489316},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Page 1 | '
                                   '1533120489395 | 1533120489441 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489395}],
+            'name': 'Page 1',
+            'start': 1533120489395},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Page 2 | '
                                   '1533120489425 | 1533120489470 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489425}],
+            'name': 'Page 2',
+            'start': 1533120489425},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Page 2 | '
                                   '1533120489463 | 1533120489509 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489463}],
+            'name': 'Page 2',
+            'start': 1533120489463},
+           {'keywords': [{'elapsed': 73,
                           'messages': [],
                           'name': 'REQUEST | Users | 6 |  | Page 3 | '
                                   '1533120489504 | 1533120489577 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120489504}],
+            'name': 'Page 3',
+            'start': 1533120489504},
+           {'keywords': [{'elapsed': 49,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Select | '
                                   '1533120490304 | 1533120490353 | OK',
-                          'pass': True}],
-            'name': 'Select'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120490304}],
+            'name': 'Select',
+            'start': 1533120490304},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Page 0 | '
                                   '1533120490344 | 1533120490386 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120490344}],
+            'name': 'Page 0',
+            'start': 1533120490344},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Page 1 | '
                                   '1533120490365 | 1533120490407 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120490365}],
+            'name': 'Page 1',
+            'start': 1533120490365},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Page 2 | '
                                   '1533120490436 | 1533120490481 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120490436}],
+            'name': 'Page 2',
+            'start': 1533120490436},
+           {'keywords': [{'elapsed': 50,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Page 3 | '
                                   '1533120490475 | 1533120490525 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120490475}],
+            'name': 'Page 3',
+            'start': 1533120490475},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 7 |  | Page 3 | '
                                   '1533120490515 | 1533120490560 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120490515}],
+            'name': 'Page 3',
+            'start': 1533120490515},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Page 0 | '
                                   '1533120491366 | 1533120491413 | OK',
-                          'pass': True}],
-            'name': 'Page 0'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120491366}],
+            'name': 'Page 0',
+            'start': 1533120491366},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Page 1 | '
                                   '1533120491386 | 1533120491430 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120491386}],
+            'name': 'Page 1',
+            'start': 1533120491386},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Page 2 | '
                                   '1533120491405 | 1533120491447 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120491405}],
+            'name': 'Page 2',
+            'start': 1533120491405},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 9 |  | Page 3 | '
                                   '1533120491486 | 1533120491531 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120491486}],
+            'name': 'Page 3',
+            'start': 1533120491486},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Form | '
                                   '1533120491515 | 1533120491560 | OK',
-                          'pass': True}],
-            'name': 'Form'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120491515}],
+            'name': 'Form',
+            'start': 1533120491515},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Page 1 | '
                                   '1533120492404 | 1533120492449 | OK',
-                          'pass': True}],
-            'name': 'Page 1'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120492404}],
+            'name': 'Page 1',
+            'start': 1533120492404},
+           {'keywords': [{'elapsed': 43,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Page 2 | '
                                   '1533120492436 | 1533120492479 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120492436}],
+            'name': 'Page 2',
+            'start': 1533120492436},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 10 |  | Page 3 | '
                                   '1533120492446 | 1533120492488 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120492446}],
+            'name': 'Page 3',
+            'start': 1533120492446},
+           {'keywords': [{'elapsed': 46,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Post | '
                                   '1533120492564 | 1533120492610 | OK',
-                          'pass': True}],
-            'name': 'Post'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120492564}],
+            'name': 'Post',
+            'start': 1533120492564},
+           {'keywords': [{'elapsed': 44,
                           'messages': ['status.find.is(201), but actually '
                                        'found 200'],
                           'name': 'REQUEST | Admins | 8 |  | Post Redirect 1 | '
                                   '1533120492611 | 1533120492655 | KO | '
                                   'status.find.is(201), but actually found 200',
-                          'pass': False}],
-            'name': 'Post Redirect 1'},
-           {'keywords': [{
+                          'pass': False,
+                          'start': 1533120492611}],
+            'name': 'Post Redirect 1',
+            'start': 1533120492611},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Form | '
                                   '1533120492674 | 1533120492719 | OK',
-                          'pass': True}],
-            'name': 'Form'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120492674}],
+            'name': 'Form',
+            'start': 1533120492674},
+           {'keywords': [{'elapsed': 45,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Page 2 | '
                                   '1533120493454 | 1533120493499 | OK',
-                          'pass': True}],
-            'name': 'Page 2'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120493454}],
+            'name': 'Page 2',
+            'start': 1533120493454},
+           {'keywords': [{'elapsed': 42,
                           'messages': [],
                           'name': 'REQUEST | Users | 11 |  | Page 3 | '
                                   '1533120493476 | 1533120493518 | OK',
-                          'pass': True}],
-            'name': 'Page 3'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120493476}],
+            'name': 'Page 3',
+            'start': 1533120493476},
+           {'keywords': [{'elapsed': 44,
                           'messages': [],
                           'name': 'REQUEST | Admins | 8 |  | Post | '
                                   '1533120493706 | 1533120493750 | OK',
-                          'pass': True}],
-            'name': 'Post'},
-           {'keywords': [{
+                          'pass': True,
+                          'start': 1533120493706}],
+            'name': 'Post',
+            'start': 1533120493706},
+           {'keywords': [{'elapsed': 46,
                           'messages': ['status.find.is(201), but actually '
                                        'found 200'],
                           'name': 'REQUEST | Admins | 8 |  | Post Redirect 1 | '
                                   '1533120493751 | 1533120493797 | KO | '
                                   'status.find.is(201), but actually found 200',
-                          'pass': False}],
-            'name': 'Post Redirect 1'},
-           {'keywords': [{
+                          'pass': False,
+                          'start': 1533120493751}],
+            'name': 'Post Redirect 1',
+            'start': 1533120493751},
+           {'keywords': [{'elapsed': 47,
                           'messages': [],
                           'name': 'REQUEST | Users | 12 |  | Page 3 | '
                                   '1533120494505 | 1533120494552 | OK',
-                          'pass': True}],
-            'name': 'Page 3'}]}
+                          'pass': True,
+                          'start': 1533120494505}],
+            'name': 'Page 3',
+            'start': 1533120494505}]}
@@ -1,14 +1,14 @@
+from datetime import datetime
 from pathlib import Path
 from unittest import skip, TestCase
 from unittest.mock import ANY, create_autospec, Mock, patch
 
-from junitparser import JUnitXml
 from testfixtures import compare
 
 from oxygen.base_handler import BaseHandler
 from oxygen.errors import JUnitHandlerException, ResultFileIsNotAFileException
 from oxygen.junit import JUnitHandler
-from oxygen.oxygen_handler_result import validate_oxygen_suite
+from oxygen.oxygen_handler_result import read_oxygen_suite, validate_oxygen_suite
 from ..helpers import example_robot_output, get_config, RESOURCES_PATH
 
 class JUnitBasicTests(TestCase):
@@ -20,19 +20,16 @@ class JUnitBasicTests(TestCase):
         self.assertEqual(self.handler.keyword, 'run_junit')
         self.assertEqual(self.handler._tags, ['JUNIT', 'EXTRA_JUNIT_CASE'])
 
-    @patch('oxygen.junit.JUnitXml')
     @patch('oxygen.junit.JUnitHandler._transform_tests')
     @patch('oxygen.junit.validate_path')
-    def test_parsing(self, mock_validate_path, mock_transform, mock_junitxml):
+    def test_parsing(self, mock_validate_path, mock_transform):
         m = create_autospec(Path)
         mock_validate_path.return_value = m
-        mock_junitxml.fromfile.return_value = 'some junit'
 
         self.handler.parse_results('some/file/path.ext')
 
         mock_validate_path.assert_called_once_with('some/file/path.ext')
-        mock_junitxml.fromfile.assert_called_once_with(m)
-        mock_transform.assert_called_once_with('some junit')
+        mock_transform.assert_called_once_with(m)
 
     def test_result_file_is_not_a_string(self):
         with self.assertRaises(ResultFileIsNotAFileException) as ex:
@@ -81,7 +78,8 @@ class JUnitBasicTests(TestCase):
         self.assertEqual(retval, 'somefile')
 
     def test_cli(self):
-        self.assertEqual(self.handler.cli(), BaseHandler.DEFAULT_CLI)
+        self.assertEqual(list(self.handler.cli()),
+                         list(BaseHandler.DEFAULT_CLI) + [('--merge',)])
 
     @patch('oxygen.junit.JUnitHandler._report_oxygen_run')
     def test_check_for_keyword(self, mock_report):
@@ -90,14 +88,20 @@ class JUnitBasicTests(TestCase):
 
         self.handler.check_for_keyword(fake_test, expected_data)
 
-        self.assertEqual(mock_report.call_args[0][0].name,
+        keyword = mock_report.call_args[0][0]
+        # RF 7 keeps the library name apart from the keyword name
+        self.assertEqual(getattr(keyword, 'full_name', keyword.name),
                          'oxygen.OxygenLibrary.Run Junit')
         self.assertEqual(self.handler.run_time_data, '/some/path/to.ext')
 
     def test_transform_tests_with_single_test_suite(self):
+        # timestamp="2020-05-18T12:41:01" is in local time
+        start = datetime(2020, 5, 18, 12, 41, 1).timestamp() * 1000
         expected_output = {
             'name': 'JUnit Execution',
+            'start': start,
             'suites': [{'name': 'com.example.demo.DemoApplicationTests',
+                'start': start,
                 'suites': [],
                 'tags': [],
                 'tests': [{'keywords': [{'elapsed': 454.0,
@@ -109,8 +113,8 @@ class JUnitBasicTests(TestCase):
                             'tags': []}]}],
             'tags': ['JUNIT', 'EXTRA_JUNIT_CASE'],
         }
-        xml = JUnitXml.fromfile(str(RESOURCES_PATH / 'junit-single-testsuite.xml'))
-        retval = self.handler._transform_tests(xml)
+        retval = read_oxygen_suite(self.handler._transform_tests(
+            RESOURCES_PATH / 'junit-single-testsuite.xml'))
         compare(retval, expected_output)
 
     def test_transform_tests_with_multiple_suites(self):
@@ -181,7 +185,29 @@ class JUnitBasicTests(TestCase):
                 }]
             }],
         }
-        xml = JUnitXml.fromfile(RESOURCES_PATH / 'junit.xml')
-        retval = self.handler._transform_tests(xml)
+        retval = read_oxygen_suite(self.handler._transform_tests(
+            RESOURCES_PATH / 'junit.xml'))
         compare(retval, expected_output)
         self.assertTrue(validate_oxygen_suite(retval))
+
+    @patch('oxygen.junit.JUnitHandler._transform_test_case')
+    def test_test_cases_are_converted_when_read(self, mock_transform):
+        mock_transform.return_value = {'name': 'case', 'keywords': []}
+        results = self.handler._transform_tests(RESOURCES_PATH / 'junit.xml')
+
+        suite1 = next(results['suites'])
+        mock_transform.assert_not_called()
+        self.assertEqual(next(suite1['tests']), mock_transform.return_value)
+        self.assertEqual(mock_transform.call_count, 1)
+
+    def test_parse_timestamp(self):
+        self.assertEqual(self.handler._parse_timestamp('2020-05-18T12:41:01Z'),
+                         1589805661000)
+        self.assertEqual(
+            self.handler._parse_timestamp('2020-05-18T12:41:01.5+03:00'),
+            1589794861500)
+        self.assertEqual(
+            self.handler._parse_timestamp('2020-05-18T12:41:01'),
+            datetime(2020, 5, 18, 12, 41, 1).timestamp() * 1000)
+        self.assertIsNone(self.handler._parse_timestamp(None))
+        self.assertIsNone(self.handler._parse_timestamp('yesterday'))
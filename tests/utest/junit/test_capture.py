@@ -0,0 +1,179 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from oxygen.errors import JUnitHandlerException
+from oxygen.junit import JUnitHandler
+from oxygen.oxygen_handler_result import (read_oxygen_suite,
+                                          validate_oxygen_suite)
+
+from ..helpers import get_config
+
+REPORT = '''<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="suite" timestamp="2020-05-18T12:41:01Z">
+    <properties>
+      <property name="os" value="linux"/>
+      <property name="description">two
+lines</property>
+    </properties>
+    <testcase name="first" time="1">
+      <properties><property name="owner" value="team a"/></properties>
+      <failure message="expected 1" type="AssertionError"/>
+      <system-out>started &lt;first&gt;</system-out>
+      <system-err>warning</system-err>
+    </testcase>
+    <testcase name="second" time="1">
+      <system-out>{second}</system-out>
+    </testcase>
+    <testsuite name="child">
+      <testcase name="third" time="1"><system-out>third</system-out></testcase>
+    </testsuite>
+    <system-out>suite output</system-out>
+  </testsuite>
+</testsuites>
+'''
+
+
+class TestCapture(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.report = self.tmp / 'report.xml'
+        self._write()
+        self.config = dict(get_config()['oxygen.junit'],
+                           capture=['properties', 'system-out',
+                                    'system-err'])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, second='second'):
+        self.report.write_text(REPORT.format(second=second), 'utf-8')
+
+    def _parse(self, **config):
+        handler = JUnitHandler(dict(self.config, **config))
+        results = read_oxygen_suite(handler.parse_results(self.report))
+        validate_oxygen_suite(results)
+        return results['suites'][0]
+
+    def _captured(self, test):
+        return {keyword['name']: keyword['messages']
+                for keyword in test['keywords'][0]['keywords']}
+
+    def test_nothing_is_captured_by_default(self):
+        del self.config['capture']
+
+        suite = self._parse()
+
+        self.assertNotIn('metadata', suite)
+        self.assertEqual(suite['tests'][0]['keywords'][0]['keywords'], [])
+
+    def test_test_cases(self):
+        first, second = self._parse()['tests']
+
+        self.assertEqual(self._captured(first),
+                         {'properties': ['owner: team a'],
+                          'system-out': ['started <first>'],
+                          'system-err': ['warning']})
+        self.assertEqual(first['keywords'][0]['messages'],
+                         ['FAIL: expected 1 (AssertionError)'])
+        self.assertEqual(self._captured(second),
+                         {'system-out': ['second']})
+
+    def test_suites(self):
+        suite = self._parse()
+
+        self.assertEqual(suite['metadata'],
+                         {'os': 'linux',
+                          'description': 'two\nlines',
+                          'system-out': 'suite output'})
+        self.assertNotIn('metadata', suite['suites'][0])
+        self.assertEqual(self._captured(suite['suites'][0]['tests'][0]),
+                         {'system-out': ['third']})
+
+    def test_only_configured_elements(self):
+        suite = self._parse(capture='system-err')
+
+        self.assertNotIn('metadata', suite)
+        self.assertEqual([self._captured(test) for test in suite['tests']],
+                         [{'system-err': ['warning']}, {}])
+
+    def test_limit_of_each_test_case(self):
+        self._write(second='ä' * 10)
+
+        first, second = self._parse(capture_limit=19)['tests']
+
+        self.assertEqual(self._captured(first),
+                         {'properties': ['owner: team a'],
+                          'system-out': ['starte\n[9 of 15 bytes of '
+                                         'system-out truncated]'],
+                          'system-err': ['[7 of 7 bytes of system-err '
+                                         'truncated]']})
+        # not cut in the middle of a character
+        self.assertEqual(self._captured(second),
+                         {'system-out': ['ä' * 9 + '\n[2 of 20 bytes of '
+                                         'system-out truncated]']})
+
+    def test_text_is_captured_as_it_is_read(self):
+        self._write(second='x' * 2**18)  # over many blocks of the parser
+        transform = JUnitHandler._transform_test_case
+        texts = []
+
+        def transform_test_case(handler, test_case, captured=None):
+            texts.append(test_case.findtext('system-out'))
+            return transform(handler, test_case, captured)
+
+        with patch.object(JUnitHandler, '_transform_test_case',
+                          transform_test_case):
+            second = self._parse(capture_limit=10)['tests'][1]
+
+        # the text is not kept in elements
+        self.assertEqual(texts, ['', '', ''])
+        self.assertEqual(self._captured(second),
+                         {'system-out': ['x' * 10 + '\n[262134 of 262144 '
+                                         'bytes of system-out truncated]']})
+
+    def test_total_limit_of_the_report(self):
+        suite = self._parse(capture_total_limit=30)
+
+        # suites are captured before test cases
+        self.assertEqual(suite['metadata'],
+                         {'os': 'linux',
+                          'description': 'two\nlines',
+                          'system-out': 'suite output'})
+        first, second = suite['tests']
+        self.assertEqual(self._captured(first)['properties'],
+                         ['owne\n[9 of 13 bytes of properties '
+                          'truncated]'])
+        self.assertEqual(self._captured(second),
+                         {'system-out': ['[6 of 6 bytes of system-out '
+                                         'truncated]']})
+
+    def test_spill_directory(self):
+        spill_dir = self.tmp / 'spill'
+        self._write(second='x' * 100)
+
+        second = self._parse(capture_limit=10,
+                             capture_spill_dir=str(spill_dir))['tests'][1]
+
+        message, = self._captured(second)['system-out']
+        self.assertTrue(message.startswith('x' * 10 + '\n[90 of 100 bytes '
+                                           'of system-out truncated, full '
+                                           'text in '))
+        spilled = Path(message[message.index(' in ') + 4:-1])
+        self.assertEqual(spilled.parent, spill_dir)
+        self.assertEqual(spilled.read_text(), 'x' * 100)
+        self.assertEqual({path.read_text() for path in
+                          spill_dir.glob('system-out-*.txt')},
+                         {'started <first>', 'x' * 100, 'suite output'})
+        self.assertEqual(list(spill_dir.glob('.oxygen-*')), [])
+
+    def test_invalid_configuration(self):
+        for config in ({'capture': ['stdout']},
+                       {'capture_limit': -1},
+                       {'capture_total_limit': '1 MB'}):
+            with self.assertRaises(JUnitHandlerException):
+                self._parse(**config)
@@ -0,0 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from robot.api import ExecutionResult
+
+from oxygen.errors import JUnitHandlerException, ResultFileNotFoundException
+from oxygen.junit import JUnitHandler, JUnitOutline, _read_in_worker
+from oxygen.oxygen import OxygenCLI
+from oxygen.oxygen_handler_result import read_oxygen_suite
+
+from ..helpers import get_config
+
+
+def report(name, timestamp, *tests):
+    cases = ''.join(f'<testcase name="{test}" time="1"/>' for test in tests)
+    return (f'<testsuite name="{name}" timestamp="{timestamp}">{cases}'
+            '</testsuite>')
+
+
+class TestManyJUnitReports(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.directory = Path(self._tmp.name) / 'reports'
+        self.directory.mkdir()
+        self._write('TEST-b.xml', report('b', '2020-05-18T12:41:01Z', 'b1'))
+        self._write('TEST-a.xml', f'''<testsuites>
+            {report('a1', '2020-05-18T12:42:00Z', 'a1 1', 'a1 2')}
+            {report('a2', '2020-05-18T12:40:00Z', 'a2 1')}
+        </testsuites>''')
+        self._write('TEST-a.txt', 'not a report')
+        self._write('TEST-a_robot_output.xml', '<robot/>')
+        self.config = get_config()['oxygen.junit']
+        self.handler = JUnitHandler(self.config)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, content):
+        path = self.directory / name
+        path.write_text(content)
+        return path
+
+    def _parse(self, result_file, **kwargs):
+        return read_oxygen_suite(self.handler.parse_results(result_file,
+                                                            **kwargs))
+
+    def _suites(self, results):
+        return [(suite['name'], [test['name'] for test in suite['tests']])
+                for suite in results['suites']]
+
+    def test_directory(self):
+        results = self._parse(self.directory)
+
+        self.assertEqual(results['name'], 'JUnit Execution')
+        self.assertEqual(results['tags'], ['JUNIT', 'EXTRA_JUNIT_CASE'])
+        self.assertEqual(self._suites(results),
+                         [('a1', ['a1 1', 'a1 2']),
+                          ('a2', ['a2 1']),
+                          ('b', ['b1'])])
+        self.assertEqual(results['start'], 1589805600000)
+
+    def test_glob_pattern_and_list(self):
+        expected = self._suites(self._parse(self.directory))
+
+        self.assertEqual(
+            self._suites(self._parse(str(self.directory / '**' / '*.xml'))),
+            expected)
+        self.assertEqual(
+            self._suites(self._parse([str(self.directory / 'TEST-b.xml'),
+                                      str(self.directory)])),
+            [('b', ['b1']), ('a1', ['a1 1', 'a1 2']), ('a2', ['a2 1'])])
+
+    def test_reports_are_read_in_a_process_pool(self):
+        expected = self._parse(self.directory)
+
+        with patch('oxygen.junit.ProcessPoolExecutor',
+                   wraps=ProcessPoolExecutor) as pool:
+            results = self._parse(self.directory, jobs=2)
+
+        pool.assert_called_once_with(max_workers=2)
+        self.assertEqual(results, expected)
+
+    def test_workers_read_reports_without_scanning_them(self):
+        path = self._write('TEST-c.xml', '''<testsuites>
+            <testsuite name="c">
+                <testcase name="c 1"/>
+                <testsuite name="c1"><testcase name="c1 1"/></testsuite>
+                <testcase name="c 2"/>
+            </testsuite>
+        </testsuites>''')
+        expected = read_oxygen_suite(
+            self.handler.parse_results(str(path)))['suites']
+
+        with patch.object(JUnitOutline, 'scan') as scan:
+            suites = _read_in_worker(self.config, str(path))
+
+        scan.assert_not_called()
+        self.assertEqual(suites, expected)
+        self.assertEqual([test['name'] for test in suites[0]['tests']],
+                         ['c 1', 'c 2'])
+        self.assertEqual(suites[0]['suites'][0]['name'], 'c1')
+
+    def test_workers_check_reports_without_scanning_them(self):
+        path = self._write('TEST-c.xml', '<results/>')
+
+        with self.assertRaisesRegex(JUnitHandlerException, 'TEST-c.xml'):
+            _read_in_worker(self.config, str(path))
+
+    def test_jobs_from_configuration(self):
+        self.handler = JUnitHandler(dict(self.config, jobs=3))
+
+        with patch('oxygen.junit.ProcessPoolExecutor',
+                   wraps=ProcessPoolExecutor) as pool:
+            self._parse(self.directory)
+
+        pool.assert_called_once_with(max_workers=3)
+
+    def test_single_report_is_read_in_one_go(self):
+        with patch('oxygen.junit.ProcessPoolExecutor') as pool:
+            self._parse([str(self.directory / 'TEST-b.xml')], jobs=4)
+
+        pool.assert_not_called()
+
+    def test_invalid_jobs(self):
+        for jobs in (0, -1, 'many', 1.5, True):
+            with self.assertRaises(JUnitHandlerException):
+                self._parse(self.directory, jobs=jobs)
+
+    def test_no_reports(self):
+        with self.assertRaises(ResultFileNotFoundException):
+            self._parse(str(self.directory / '*.json'))
+
+    def test_invalid_report_fails_before_results_are_read(self):
+        self._write('TEST-c.xml', '<results/>')
+
+        with self.assertRaisesRegex(JUnitHandlerException, 'TEST-c.xml'):
+            self.handler.parse_results(self.directory)
+
+    def test_merged_conversion_on_command_line(self):
+        cli = OxygenCLI()
+
+        cli.convert_to_robot_result({
+            'result_file': [str(self.directory)],
+            'func': cli.handlers['oxygen.junit'].parse_results,
+            'handler': 'oxygen.junit',
+            'merge': True,
+            'no_cache': True,
+        })
+
+        output = ExecutionResult(str(Path(self._tmp.name)
+                                     / 'reports_robot_output.xml'))
+        self.assertEqual(output.suite.name, 'JUnit Execution')
+        self.assertEqual([suite.name for suite in output.suite.suites],
+                         ['a1', 'a2', 'b'])
@@ -0,0 +1,138 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from xml.etree.ElementTree import ParseError
+
+from oxygen.errors import JUnitHandlerException
+from oxygen.junit import JUnitHandler, JUnitOutline
+from oxygen.oxygen_handler_result import read_oxygen_suite
+
+from ..helpers import get_config
+
+NESTED_REPORT = '''<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testcase name="ignored outside of suites"/>
+  <testsuite name="outer" timestamp="2020-05-18T12:41:01Z">
+    <properties><property name="os" value="linux"/></properties>
+    <testcase name="before" time="0.5"/>
+    <testsuite name="inner">
+      <testcase name="inner case" time="1">
+        <failure message="expected &lt;1&gt;" type="AssertionError"/>
+      </testcase>
+    </testsuite>
+    <testcase name="between" time="0.25"><error message="boom"/></testcase>
+    <testsuite name="second inner"/>
+    <testcase name="after"/>
+    <system-out>output</system-out>
+  </testsuite>
+  <testsuite name="last" timestamp="2020-05-18T12:40:00Z">
+    <testcase name="last case" time="2"/>
+  </testsuite>
+</testsuites>
+'''
+
+
+def names(suite):
+    return {'name': suite['name'],
+            'suites': [names(child) for child in suite.get('suites', ())],
+            'tests': [test['name'] for test in suite.get('tests', ())]}
+
+
+class TestStreamingJUnitReports(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.report = Path(self._tmp.name) / 'report.xml'
+        self.report.write_text(NESTED_REPORT)
+        self.handler = JUnitHandler(get_config()['oxygen.junit'])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, content):
+        self.report.write_text(content)
+        return self.report
+
+    def test_suites_and_test_cases_in_any_order(self):
+        results = read_oxygen_suite(self.handler.parse_results(self.report))
+
+        self.assertEqual(
+            names(results),
+            {'name': 'JUnit Execution',
+             'tests': [],
+             'suites': [
+                 {'name': 'outer',
+                  'suites': [{'name': 'inner', 'suites': [],
+                              'tests': ['inner case']},
+                             {'name': 'second inner', 'suites': [],
+                              'tests': []}],
+                  'tests': ['before', 'between', 'after']},
+                 {'name': 'last', 'suites': [], 'tests': ['last case']}]})
+        self.assertEqual(results['start'], 1589805600000)
+        outer = results['suites'][0]
+        self.assertEqual(outer['suites'][0]['tests'][0]['keywords'][0]
+                         ['messages'],
+                         ['FAIL: expected &lt;1&gt; (AssertionError)'])
+        self.assertEqual(outer['tests'][1]['keywords'][0]['messages'],
+                         ['ERROR: boom (None)'])
+
+    def test_test_cases_are_read_one_at_a_time(self):
+        cases = ''.join(f'<testcase name="case {i}" time="1"/>'
+                        for i in range(1000))
+        self._write(f'<testsuite name="big">{cases}</testsuite>')
+        results = self.handler.parse_results(self.report)
+        suite = next(results['suites'])
+        self.assertEqual(list(suite['suites']), [])
+
+        with patch.object(JUnitHandler, '_transform_test_case',
+                          wraps=self.handler._transform_test_case) as convert:
+            tests = suite['tests']
+            first = next(tests)
+
+        self.assertEqual(first['name'], 'case 0')
+        self.assertEqual(convert.call_count, 1)
+        self.assertEqual(sum(1 for _ in tests), 999)
+
+    def test_unread_suites_are_skipped(self):
+        results = self.handler.parse_results(self.report)
+
+        suites = results['suites']
+        outer, last = next(suites), next(suites)
+
+        self.assertEqual(outer['name'], 'outer')
+        self.assertEqual([test['name'] for test in last['tests']],
+                         ['last case'])
+        self.assertEqual(list(outer['tests']), [])
+
+    def test_outline(self):
+        outline = JUnitOutline.scan(self.report)
+
+        self.assertEqual(outline.root, 'testsuites')
+        self.assertEqual(outline.timestamps,
+                         ['2020-05-18T12:41:01Z', '2020-05-18T12:40:00Z'])
+        self.assertEqual(outline.child_suites, [2, 0, 0, 0])
+
+    def test_single_suite_as_root(self):
+        self._write('<testsuite name="root" timestamp="2020-05-18T12:41:01Z">'
+                    '<testsuite name="child"><testcase name="a"/></testsuite>'
+                    '<testcase name="b" time="1"/></testsuite>')
+
+        results = read_oxygen_suite(self.handler.parse_results(self.report))
+
+        self.assertEqual(results['start'], 1589805661000)
+        root, = results['suites']
+        self.assertEqual(names(root),
+                         {'name': 'root',
+                          'suites': [{'name': 'child', 'suites': [],
+                                      'tests': ['a']}],
+                          'tests': ['b']})
+
+    def test_invalid_reports(self):
+        self._write('<results><testsuite/></results>')
+        with self.assertRaisesRegex(JUnitHandlerException, '<results>'):
+            self.handler.parse_results(self.report)
+
+        self._write('<testsuites><testsuite></testsuites>')
+        with self.assertRaises(ParseError):
+            self.handler.parse_results(self.report)
@@ -0,0 +1,310 @@
+import re
+
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+import robot
+
+from robot.api import ExecutionResult
+from robot.result import Result
+
+from oxygen.base_handler import BaseHandler
+from oxygen.output_writer import RobotOutputWriter
+from oxygen.robot_interface import RobotInterface, get_keywords_from
+
+from ..helpers import lazy_suite, MINIMAL_SUITE_DICT
+from ..robot_interface.test_robot_interface_basic_usage import EXAMPLE_SUITES
+
+
+STARTING_TIME = 1533625284100
+
+NESTED_SUITE = {
+    'name': 'Root',
+    'tags': ['root-tag'],
+    'metadata': {'key': 'value'},
+    'setup': {'name': 'Suite setup', 'pass': True, 'elapsed': 3.0},
+    'teardown': {'name': 'Suite teardown', 'pass': True, 'elapsed': 2.0},
+    'suites': [EXAMPLE_SUITES[0], EXAMPLE_SUITES[1], {'name': 'Empty'}],
+    'tests': [{'name': 'nested keywords',
+               'tags': ['Some Tag', 'some_tag'],
+               'keywords': [{'name': 'outer',
+                             'pass': False,
+                             'elapsed': 5.0,
+                             'tags': ['kw-tag'],
+                             'messages': ['plain', '*HTML* <b>bold</b>'],
+                             'keywords': [{'name': 'inner',
+                                           'pass': True,
+                                           'elapsed': 1.0}],
+                             'teardown': {'name': 'keyword teardown',
+                                          'pass': True}}]}]
+}
+
+
+class TestRobotOutputWriter(TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _without_generation_time(self, path):
+        with open(path) as f:
+            return re.sub(r'generated="[^"]*"', '', f.read())
+
+    def _saved_result_model(self, suite):
+        _, robot_suite = RobotInterface().result.build_suite(STARTING_TIME,
+                                                             suite)
+        result = Result(rpa=False)
+        result.suite = robot_suite
+        result.save(str(self.tmp / 'expected.xml'))
+        return self._without_generation_time(self.tmp / 'expected.xml')
+
+    def test_output_is_identical_to_saved_result_model(self):
+        expected = self._saved_result_model(NESTED_SUITE)
+
+        RobotOutputWriter().write(self.tmp / 'actual.xml',
+                                  STARTING_TIME,
+                                  NESTED_SUITE)
+
+        self.assertEqual(
+            self._without_generation_time(self.tmp / 'actual.xml'), expected)
+
+    def test_lazy_results_are_built_and_written_like_lists(self):
+        expected = self._saved_result_model(NESTED_SUITE)
+
+        self.assertEqual(self._saved_result_model(lazy_suite(NESTED_SUITE)),
+                         expected)
+        RobotOutputWriter().write(self.tmp / 'actual.xml',
+                                  STARTING_TIME,
+                                  lazy_suite(NESTED_SUITE))
+        self.assertEqual(
+            self._without_generation_time(self.tmp / 'actual.xml'), expected)
+
+    def test_untested_versions_are_written_with_result_save(self):
+        expected = self._saved_result_model(NESTED_SUITE)
+        expected_end, _ = RobotInterface().result.build_suite(STARTING_TIME,
+                                                              NESTED_SUITE)
+        writer = RobotOutputWriter()
+        writer.STREAMED_VERSIONS = ()
+
+        with patch.object(writer, '_write_suite') as write_suite:
+            end = writer.write(self.tmp / 'actual.xml', STARTING_TIME,
+                               lazy_suite(NESTED_SUITE))
+
+        write_suite.assert_not_called()
+        self.assertEqual(end, expected_end)
+        self.assertEqual(
+            self._without_generation_time(self.tmp / 'actual.xml'), expected)
+
+    def test_returns_ending_time(self):
+        expected_end, _ = RobotInterface().result.build_suite(STARTING_TIME,
+                                                              NESTED_SUITE)
+
+        end = RobotOutputWriter().write(self.tmp / 'actual.xml',
+                                        STARTING_TIME,
+                                        NESTED_SUITE)
+
+        self.assertEqual(end, expected_end)
+
+    def _stat(self, root, path, text):
+        stat = root.find(f'./statistics/{path}/stat[.="{text}"]')
+        return int(stat.get('pass')), int(stat.get('fail'))
+
+    def test_statistics_are_counted_while_writing(self):
+        RobotOutputWriter().write(self.tmp / 'actual.xml',
+                                  STARTING_TIME,
+                                  NESTED_SUITE)
+        root = ElementTree.parse(self.tmp / 'actual.xml').getroot()
+
+        self.assertEqual(self._stat(root, 'total', 'All Tests'), (4, 5))
+        self.assertEqual(self._stat(root, 'suite', 'Root'), (4, 5))
+        self.assertEqual(self._stat(root, 'suite', 'Root.suite1.suite2'),
+                         (2, 0))
+        self.assertEqual(self._stat(root, 'tag', 'root-tag'), (0, 1))
+        self.assertEqual(
+            self._stat(root, 'tag', 'OXYGEN_JUNIT_UNKNOWN_EXECUTION_TIME'),
+            (4, 4))
+
+    def test_tests_can_be_generated_lazily(self):
+        consumed = []
+
+        def tests():
+            for i in range(1000):
+                consumed.append(i)
+                yield {'name': f'test {i}',
+                       'keywords': [{'name': 'kw', 'pass': bool(i % 2),
+                                     'elapsed': 1.0}]}
+
+        suite = {'name': 'Generated', 'tests': tests()}
+        self.assertEqual(consumed, [])
+
+        RobotOutputWriter().write(self.tmp / 'actual.xml', STARTING_TIME,
+                                  suite)
+
+        result = ExecutionResult(str(self.tmp / 'actual.xml'))
+        self.assertEqual(len(result.suite.tests), 1000)
+        self.assertEqual(result.suite.tests[999].name, 'test 999')
+        self.assertEqual(sum(t.passed for t in result.suite.tests), 500)
+
+    def test_no_output_is_left_when_reading_results_fails(self):
+        (self.tmp / 'existing.xml').write_text('kept')
+
+        def tests():
+            yield {'name': 'test', 'keywords': [{'name': 'kw', 'pass': True}]}
+            raise ValueError('corrupt result file')
+
+        for output in ('actual.xml', 'existing.xml'):
+            with self.assertRaises(ValueError):
+                RobotOutputWriter().write(self.tmp / output, STARTING_TIME,
+                                          {'name': 'Broken', 'tests': tests()})
+
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir()),
+                         ['existing.xml'])
+        self.assertEqual((self.tmp / 'existing.xml').read_text(), 'kept')
+
+
+SPLICED_SUITE = '''*** Test Cases ***
+Passing
+    [Tags]    kept
+    Log    hello
+
+Replaced
+    [Tags]    replaced
+    Log    setup
+    Run Dummy
+    Log    teardown
+
+Failing
+    Fail    boom
+
+*** Keywords ***
+Run Dummy
+    No Operation
+'''
+
+
+class DummyHandler(BaseHandler):
+
+    def parse_results(self, result_file):
+        return MINIMAL_SUITE_DICT
+
+
+class TestSplicingOutput(TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        (self.tmp / 'Spliced.robot').write_text(SPLICED_SUITE)
+        robot.run(str(self.tmp / 'Spliced.robot'),
+                  output=str(self.tmp / 'output.xml'),
+                  log=None, report=None, stdout=StringIO())
+        self.handler = DummyHandler({'keyword': 'run_dummy',
+                                     'tags': 'oxygen-dummy'})
+        self.data = {'Spliced.Replaced': 'doesentmatter'}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _replace(self, test):
+        self.handler.check_for_keyword(test, self.data)
+
+    def _signature(self, suite):
+        return (suite.name,
+                suite.status,
+                [self._signature(child) for child in suite.suites],
+                [(test.name, test.status, list(test.tags),
+                  [(kw.name, kw.status, len(get_keywords_from(kw)))
+                   for kw in get_keywords_from(test)])
+                 for test in suite.tests])
+
+    def test_spliced_output_matches_replacing_in_result_model(self):
+        expected = ExecutionResult(str(self.tmp / 'output.xml'))
+        for test in list(expected.suite.tests):
+            self._replace(test)
+
+        RobotOutputWriter().splice(self.tmp / 'output.xml', self.data,
+                                   self._replace)
+
+        actual = ExecutionResult(str(self.tmp / 'output.xml'))
+        self.assertEqual(self._signature(actual.suite),
+                         self._signature(expected.suite))
+        oxygen_suite = actual.suite.suites[0]
+        oxygen_setup = (oxygen_suite.setup if hasattr(oxygen_suite, 'setup')
+                        else oxygen_suite.keywords.setup)
+        self.assertEqual(oxygen_setup.name, 'Oxygen Setup')
+
+    def test_untested_versions_are_spliced_in_result_model(self):
+        expected = ExecutionResult(str(self.tmp / 'output.xml'))
+        for test in list(expected.suite.tests):
+            self._replace(test)
+        writer = RobotOutputWriter()
+        writer.STREAMED_VERSIONS = ()
+
+        with patch.object(writer, '_splice') as splice:
+            writer.splice(self.tmp / 'output.xml', self.data, self._replace)
+
+        splice.assert_not_called()
+        actual = ExecutionResult(str(self.tmp / 'output.xml'))
+        self.assertEqual(self._signature(actual.suite),
+                         self._signature(expected.suite))
+        self._assert_ids_and_statistics()
+
+    def test_ids_and_statistics_are_updated(self):
+        RobotOutputWriter().splice(self.tmp / 'output.xml', self.data,
+                                   self._replace)
+
+        root = self._assert_ids_and_statistics()
+        if RobotOutputWriter()._streamed:
+            # replacing suites are written in place of the test
+            self.assertEqual([e.get('id') for e in root.iter('test')],
+                             ['s1-t1', 's1-s1-s1-t1', 's1-t2'])
+
+    def _assert_ids_and_statistics(self):
+        root = ElementTree.parse(self.tmp / 'output.xml').getroot()
+        self.assertEqual([e.get('id') for e in root.iter('suite')
+                          if e.get('id')],
+                         ['s1', 's1-s1', 's1-s1-s1'])
+        self.assertEqual(sorted(e.get('id') for e in root.iter('test')),
+                         ['s1-s1-s1-t1', 's1-t1', 's1-t2'])
+        self.assertEqual(root.find('./suite/status').get('status'), 'FAIL')
+        self.assertEqual(self._stat(root, 'total', 'All Tests'), (2, 1))
+        self.assertEqual(self._stat(root, 'tag', 'replaced'), (1, 0))
+        self.assertEqual(self._stat(root, 'tag', 'oxygen-dummy'), (1, 0))
+        self.assertEqual(self._stat(root, 'suite', 'Spliced.Minimal Suite'),
+                         (1, 0))
+        return root
+
+    def _stat(self, root, path, text):
+        stat = root.find(f'./statistics/{path}/stat[.="{text}"]')
+        return int(stat.get('pass')), int(stat.get('fail'))
+
+    def test_other_tests_are_copied_as_they_are(self):
+        original = ExecutionResult(str(self.tmp / 'output.xml'))
+
+        RobotOutputWriter().splice(self.tmp / 'output.xml', {},
+                                   self._replace)
+
+        copied = ExecutionResult(str(self.tmp / 'output.xml'))
+        self.assertEqual(self._signature(copied.suite),
+                         self._signature(original.suite))
+        messages = [m.message for t in copied.suite.tests
+                    for kw in get_keywords_from(t) for m in kw.messages]
+        self.assertEqual(messages, ['hello', 'setup', 'teardown', 'boom'])
+
+    def test_output_is_kept_when_replacing_fails(self):
+        original = (self.tmp / 'output.xml').read_text()
+
+        def fail(test):
+            raise ValueError('cannot replace')
+
+        with self.assertRaises(ValueError):
+            RobotOutputWriter().splice(self.tmp / 'output.xml', self.data,
+                                       fail)
+
+        self.assertEqual((self.tmp / 'output.xml').read_text(), original)
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir()),
+                         ['Spliced.robot', 'output.xml'])
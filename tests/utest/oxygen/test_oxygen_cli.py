@@ -1,17 +1,22 @@
 from argparse import ArgumentParser, Namespace
 from pathlib import Path
+from shutil import copy as copy_file
 from subprocess import check_output, run, STDOUT, CalledProcessError
-from tempfile import mkstemp
-from unittest import TestCase
+from tempfile import mkstemp, TemporaryDirectory
+from unittest import skipUnless, TestCase
 from unittest.mock import ANY, create_autospec, patch, Mock
+from warnings import catch_warnings, simplefilter
 from xml.etree import ElementTree
 
-from robot.running.model import TestSuite
+from robot.api import ExecutionResult
 
 from oxygen.oxygen import OxygenCLI, OxygenCore
+from oxygen.output_writer import RobotOutputWriter
+from oxygen.robot_interface import get_keywords_from
 from oxygen.config import CONFIG_FILE, ORIGINAL_CONFIG_FILE
+from oxygen.errors import ResultFileNotFoundException
 
-from ..helpers import RESOURCES_PATH
+from ..helpers import RESOURCES_PATH, suppress_stderr
 
 
 class TestOxygenCLIEntryPoints(TestCase):
@@ -84,6 +89,33 @@ class TestOxygenCLIEntryPoints(TestCase):
         self.assertEqual(example_stat.get('pass'), actual_stat.get('pass'))
         self.assertEqual(example_stat.get('fail'), actual_stat.get('fail'))
 
+    def test_junit_batch_conversion_with_jobs_on_cli(self):
+        with TemporaryDirectory() as tmp:
+            for name in ('junit.xml', 'junit-single-testsuite.xml'):
+                copy_file(RESOURCES_PATH / name, Path(tmp) / name)
+            (Path(tmp) / 'broken.xml').write_text('not xml at all')
+            merged = Path(tmp) / 'merged.xml'
+
+            proc = run(f'python -m oxygen oxygen.junit {tmp} '
+                       f'--jobs 2 --output {merged}',
+                       shell=True, text=True, capture_output=True)
+
+            self.assertEqual(proc.returncode, 1)
+            self.assertIn('broken.xml', proc.stderr)
+            self.assertIn('1 of 3 result files failed', proc.stderr)
+            result = ExecutionResult(str(merged))
+            self.assertEqual(result.suite.name, 'merged')
+            self.assertEqual(len(result.suite.suites), 2)
+
+    def test_watch_once_on_cli(self):
+        with TemporaryDirectory() as tmp:
+            copy_file(RESOURCES_PATH / 'junit.xml', Path(tmp) / 'junit.xml')
+
+            self._run(f'python -m oxygen watch oxygen.junit {tmp} --once')
+
+            result = ExecutionResult(str(Path(tmp) / 'junit_robot_output.xml'))
+            self.assertTrue(result.suite.tests or result.suite.suites)
+
     def _validate_handler_names(self, text):
         for handler in ('JUnitHandler', 'GatlingHandler', 'ZAProxyHandler'):
             self.assertIn(handler, text)
@@ -149,26 +181,239 @@ class TestOxygenCLI(TestCase):
     def setUp(self):
         self.cli = OxygenCLI()
 
-    @patch('oxygen.oxygen.RobotInterface')
+    @patch('oxygen.oxygen.RobotOutputWriter')
     @patch('oxygen.oxygen.OxygenCLI.parse_args')
-    def test_run(self, mock_parse_args, mock_robot_iface):
+    def test_run(self, mock_parse_args, mock_writer):
         mock_parse_args.return_value = {
             'result_file': 'path/to/file.xml',
             'func': lambda *_, **__: {'some': 'results'}}
-        expected_suite = create_autospec(TestSuite)
-        mock = Mock()
-        mock.running.build_suite = Mock(return_value=expected_suite)
-        mock_robot_iface.return_value = mock
 
         self.cli.run()
 
-        mock.running.build_suite.assert_called_once_with({'some': 'results'})
-        expected_suite.run.assert_called_once_with(
-            output=str(Path('path/to/file_robot_output.xml')),
-            log=None,
-            report=None,
-            stdout=ANY
-        )
+        mock_writer.return_value.write.assert_called_once_with(
+            str(Path('path/to/file_robot_output.xml')),
+            ANY,
+            {'some': 'results'})
+
+    def test_convert_to_robot_result_writes_result_model(self):
+        _, result_file = mkstemp(suffix='.xml')
+        parsed = {'name': 'Converted',
+                  'tests': [{'name': 'nested test',
+                             'keywords': [{'name': 'outer',
+                                           'pass': False,
+                                           'elapsed': 50.0,
+                                           'keywords': [{
+                                               'name': 'inner',
+                                               'pass': False,
+                                               'elapsed': 20.0,
+                                               'messages': ['went wrong']}]}
+                             ]}]}
+        self.cli.convert_to_robot_result({'result_file': result_file,
+                                          'func': lambda **_: parsed})
+
+        output = ExecutionResult(self.cli.get_output_filename(result_file))
+        test = output.suite.tests[0]
+        outer = get_keywords_from(test)[0]
+        inner = get_keywords_from(outer)[0]
+        self.assertEqual(output.suite.name, 'Converted')
+        self.assertEqual(test.status, 'FAIL')
+        self.assertEqual(outer.elapsedtime, 50)
+        self.assertEqual(inner.elapsedtime, 20)
+        self.assertEqual(inner.status, 'FAIL')
+        self.assertEqual(inner.messages[0].message, 'went wrong')
+
+    @skipUnless(RobotOutputWriter()._streamed,
+                'Result.save writes suites recursively')
+    def test_convert_deeply_nested_results(self):
+        depth = 2000
+        keyword = {'name': 'kw', 'pass': True, 'messages': ['deepest']}
+        for _ in range(depth - 1):
+            keyword = {'name': 'kw', 'pass': True, 'keywords': [keyword]}
+        suite = {'name': 'suite',
+                 'tests': [{'name': 'test', 'keywords': [keyword]}]}
+        for _ in range(depth - 1):
+            suite = {'name': 'suite', 'suites': [suite]}
+        suite['setup'] = keyword
+
+        with TemporaryDirectory() as tmp:
+            result_file = str(Path(tmp) / 'deep.xml')
+            with catch_warnings():
+                simplefilter('error')  # results are valid
+                self.cli.convert_to_robot_result({'result_file': result_file,
+                                                  'func': lambda **_: suite,
+                                                  'no_cache': True})
+
+            open_elements, deepest = [], {}
+            for event, elem in ElementTree.iterparse(
+                    self.cli.get_output_filename(result_file),
+                    events=('start', 'end')):
+                if event == 'start':
+                    open_elements.append(elem.tag)
+                    deepest[elem.tag] = max(deepest.get(elem.tag, 0),
+                                            open_elements.count(elem.tag))
+                else:
+                    open_elements.pop()
+                    if elem.tag == 'msg':
+                        message = elem.text
+            self.assertEqual(deepest['suite'], depth)
+            self.assertEqual(deepest['kw'], depth)
+            self.assertEqual(message, 'deepest')
+
+    def test_validation_given_on_command_line_overrides_config(self):
+        _, result_file = mkstemp(suffix='.xml')
+        invalid = {'name': 'Converted', 'setup': []}
+
+        with self.assertWarns(UserWarning):
+            self.cli.convert_to_robot_result({'result_file': result_file,
+                                              'func': lambda **_: invalid,
+                                              'no_cache': True})
+        with catch_warnings():
+            simplefilter('error')
+            self.cli.convert_to_robot_result({'result_file': result_file,
+                                              'func': lambda **_: invalid,
+                                              'no_cache': True,
+                                              'validation': 'off'})
+
+    def _result_files(self, tmp, *names):
+        for name in names:
+            (Path(tmp) / name).write_text(name)
+        return [str(Path(tmp) / name) for name in names]
+
+    def test_expand_result_files(self):
+        with TemporaryDirectory() as tmp:
+            a, b, _, _ = self._result_files(tmp, 'a.xml', 'b.log',
+                                            'a_robot_output.xml', '.hidden')
+            Path(tmp, 'subdir').mkdir()
+
+            self.assertEqual(self.cli.expand_result_files(tmp), [a, b])
+            self.assertEqual(
+                self.cli.expand_result_files([str(Path(tmp) / '*.xml'), b]),
+                [a, b])
+            self.assertEqual(self.cli.expand_result_files('not/there.xml'),
+                             ['not/there.xml'])
+
+    def test_expand_result_files_leaves_out_directories_of_glob_patterns(self):
+        with TemporaryDirectory() as tmp:
+            a, = self._result_files(tmp, 'a.xml')
+            Path(tmp, 'reports.xml').mkdir()
+
+            self.assertEqual(
+                self.cli.expand_result_files(str(Path(tmp) / '*.xml')), [a])
+            self.assertEqual(
+                self.cli.expand_result_files(str(Path(tmp) / '**')), [a])
+
+    def test_expand_result_files_without_files(self):
+        with self.assertRaises(ResultFileNotFoundException):
+            self.cli.expand_result_files(None)
+
+    def _parse(self, result_file):
+        if result_file.endswith('broken.xml'):
+            raise ValueError('cannot parse this')
+        return {'name': Path(result_file).stem,
+                'tests': [{'name': 'test',
+                           'keywords': [{'name': 'kw', 'pass': True}]}]}
+
+    def test_batch_conversion_continues_after_failures(self):
+        with TemporaryDirectory() as tmp:
+            a, broken, b = self._result_files(tmp, 'a.xml', 'broken.xml',
+                                              'b.xml')
+
+            with suppress_stderr() as stderr:
+                retval = self.cli.convert_to_robot_result(
+                    {'result_file': [tmp], 'func': self._parse})
+
+            self.assertEqual(retval, 1)
+            self.assertIn(f'converting "{broken}" failed: cannot parse this',
+                          stderr.getvalue())
+            for result_file in (a, b):
+                output = ExecutionResult(
+                    self.cli.get_output_filename(result_file))
+                self.assertEqual(output.suite.name,
+                                 Path(result_file).stem)
+            self.assertFalse(
+                Path(self.cli.get_output_filename(broken)).exists())
+
+    def test_batch_conversion_to_single_output(self):
+        with TemporaryDirectory() as tmp:
+            result_files = self._result_files(tmp, 'b.xml', 'a.xml')
+            merged = Path(tmp) / 'all.xml'
+
+            retval = self.cli.convert_to_robot_result(
+                {'result_file': result_files,
+                 'func': self._parse,
+                 'output': merged,
+                 'jobs': 1})
+
+            self.assertIsNone(retval)
+            output = ExecutionResult(str(merged))
+            self.assertEqual(output.suite.name, 'all')
+            self.assertEqual([suite.name for suite in output.suite.suites],
+                             ['b', 'a'])
+
+    def _gatling_logs(self, tmp):
+        '''Return: Three binary Gatling logs, of which the middle one fails
+        only once its records are read'''
+        log = (RESOURCES_PATH / 'gatling' / 'binary-simulation.log').read_bytes()
+        paths = [Path(tmp) / f'{name}.log' for name in 'abc']
+        for path in paths:
+            path.write_bytes(log + (b'\x09' if path.stem == 'b' else b''))
+        return [str(path) for path in paths]
+
+    def _convert_gatling_logs(self, result_files, **args):
+        with suppress_stderr() as stderr:
+            retval = self.cli.convert_to_robot_result(dict(
+                {'result_file': result_files,
+                 'func': self.cli.handlers['oxygen.gatling'].parse_results,
+                 'handler': 'oxygen.gatling',
+                 'no_cache': True},
+                **args))
+        return retval, stderr.getvalue()
+
+    def test_batch_conversion_continues_after_lazy_failures(self):
+        with TemporaryDirectory() as tmp:
+            a, b, c = self._gatling_logs(tmp)
+
+            retval, stderr = self._convert_gatling_logs([a, b, c])
+
+            self.assertEqual(retval, 1)
+            self.assertIn(f'converting "{b}" failed: Unknown record type 9',
+                          stderr)
+            for result_file in (a, c):
+                ExecutionResult(self.cli.get_output_filename(result_file))
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()),
+                             ['a.log', 'a_robot_output.xml', 'b.log',
+                              'c.log', 'c_robot_output.xml'])
+
+    def test_batch_conversion_to_single_output_after_lazy_failures(self):
+        with TemporaryDirectory() as tmp:
+            a, b, c = self._gatling_logs(tmp)
+            merged = Path(tmp) / 'merged.xml'
+
+            retval, stderr = self._convert_gatling_logs([a, b, c],
+                                                        output=merged)
+
+            self.assertEqual(retval, 1)
+            self.assertIn(f'converting "{b}" failed: Unknown record type 9',
+                          stderr)
+            output = ExecutionResult(str(merged))
+            self.assertEqual(len(output.suite.suites), 2)
+
+    def test_watch_once(self):
+        with TemporaryDirectory() as tmp:
+            a, = self._result_files(tmp, 'a.xml')
+
+            self.cli.watch({'watch_directory': Path(tmp),
+                            'func': self._parse,
+                            'once': True})
+
+            output = ExecutionResult(self.cli.get_output_filename(a))
+            self.assertEqual(output.suite.name, 'a')
+            self.assertTrue((Path(tmp) / '.oxygen-watch-state.json').exists())
+
+    def test_watch_missing_directory(self):
+        with self.assertRaises(ResultFileNotFoundException):
+            self.cli.watch({'watch_directory': Path('not/there'),
+                            'func': self._parse})
 
     def test_parse_args(self):
         '''verifies that `parse_args()` returns a dictionary'''
@@ -188,8 +433,9 @@ class TestOxygenCLI(TestCase):
 
         # verify all main-level cli arguments were added
         self.assertEqual(len(mock_parser.add_argument.call_args_list), 4)
-        # verify all built-in handlers were added
-        self.assertEqual(len(m.add_parser.call_args_list), 3)
+        # verify all built-in handlers and `watch` were added
+        self.assertEqual(len(m.add_parser.call_args_list), 4)
+        self.assertEqual(m.add_parser.call_args_list[-1].args, ('watch',))
 
     def _actual(self, path):
         return self.cli.get_output_filename(path)
@@ -1,14 +1,16 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
 from oxygen import listener
+from oxygen.errors import InvalidConfigurationException
 
 class OxygenListenerBasicTests(TestCase):
     def setUp(self):
         self.listener = listener()
 
     def test_listener_api_version_is_not_changed_accidentally(self):
-        self.assertEqual(self.listener.ROBOT_LISTENER_API_VERSION, 2)
+        self.assertEqual(self.listener.ROBOT_LISTENER_API_VERSION, 3)
 
     def mock_lib_instance(self, mock_builtin, return_value):
         m_builtin = Mock()
@@ -23,20 +25,60 @@ class OxygenListenerBasicTests(TestCase):
     def test_end_test_when_library_was_not_used(self, mock_builtin):
         m = self.mock_lib_instance(mock_builtin, None)
 
-        self.listener.end_test('foo', {})
+        self.listener.end_test(Mock(), Mock())
 
         m._get_context().namespace.get_library_instance.assert_called_once_with('oxygen.OxygenLibrary')
         self.assertEqual(self.listener.run_time_data, {})
 
+    @patch('oxygen.oxygen.OxygenVisitor.parse_test_results')
     @patch('oxygen.oxygen.BuiltIn')
-    def test_end_test_when_library_was_used(self, mock_builtin):
+    def test_end_test_when_library_was_used(self, mock_builtin, mock_parse):
         o = lambda: None
         o.data = 'I do not have a solution, but I do admire the problem'
         m = self.mock_lib_instance(mock_builtin, o)
+        data, result = Mock(), Mock(longname='hello')
 
-        self.listener.end_test('oxygen.OxygenLibrary', {'longname': 'hello'})
+        self.listener.end_test(data, result)
 
         m._get_context().namespace.get_library_instance.assert_called_once_with('oxygen.OxygenLibrary')
         self.assertEqual(self.listener.run_time_data,
                          {'hello': ('I do not have a solution, but I do '
                                     'admire the problem')})
+        mock_parse.assert_called_once_with(data, self.listener.pool)
+
+    @patch('oxygen.oxygen.RobotOutputWriter')
+    def test_output_file_is_spliced(self, mock_writer):
+        self.listener.run_time_data['hello'] = 'data'
+
+        self.listener.output_file('path/to/output.xml')
+
+        mock_writer.return_value.splice.assert_called_once_with(
+            'path/to/output.xml',
+            {'hello': 'data'},
+            self.listener._visitor.visit_test)
+
+    def test_results_are_parsed_in_the_listener_by_default(self):
+        self.assertIsNone(self.listener.pool)
+
+    def test_pool_is_configurable(self):
+        self.assertIsInstance(listener('2', 'process').pool,
+                              ProcessPoolExecutor)
+        pool = listener(jobs='1').pool
+        self.assertIsInstance(pool, ThreadPoolExecutor)
+        self.assertEqual(pool._max_workers, 1)
+
+    def test_invalid_pool_configuration(self):
+        with self.assertRaises(InvalidConfigurationException):
+            listener(pool='fork')
+        with self.assertRaises(InvalidConfigurationException):
+            listener(jobs='many')
+
+    @patch('oxygen.oxygen.RobotOutputWriter')
+    def test_pool_is_shut_down_after_output_file(self, mock_writer):
+        self.listener = listener(jobs=1)
+        pool = self.listener.pool
+
+        self.listener.output_file('path/to/output.xml')
+
+        self.assertTrue(pool._shutdown)
+        self.assertIsNone(self.listener._pool)
@@ -1,33 +1,43 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+from robot.result import TestSuite
 
 from oxygen.oxygen import OxygenVisitor
 from oxygen import errors as oxygen_errors
 
+from ..helpers import example_robot_output
+
 
 class CustomUserException(Exception):
     pass
 
 
 class TestOxygen(TestCase):
+    def setUp(self):
+        self.test = example_robot_output().suite.suites[0].tests[0]
+        self.data = {self.test.longname: 'fakedata'}
+
+    def fake_handler(self, keyword='run_junit', *side_effect):
+        m = Mock(keyword=keyword)
+        m._replace_test.side_effect = side_effect or None
+        return m
+
     def test_multiple_errors_are_reported(self):
-        m = Mock()
-        m.check_for_keyword.side_effect = [
-            TypeError('different'),
-            oxygen_errors.JUnitHandlerException('kinds of'),
-            oxygen_errors.OxygenException('exceptions'),
-            CustomUserException('for fun and profit')
-        ]
-        oxy = OxygenVisitor('fakedata')
+        oxy = OxygenVisitor(self.data)
         oxy._handlers = {
-            'fake_handler': m,
-            'another_fake': m,
-            'third': m,
-            'and fourth': m
+            'fake_handler': self.fake_handler(
+                'run_junit', TypeError('different')),
+            'another_fake': self.fake_handler(
+                'run_junit', oxygen_errors.JUnitHandlerException('kinds of')),
+            'third': self.fake_handler(
+                'run_junit', oxygen_errors.OxygenException('exceptions')),
+            'and fourth': self.fake_handler(
+                'run_junit', CustomUserException('for fun and profit'))
         }
 
         with self.assertRaises(oxygen_errors.OxygenException) as ex:
-            oxy.visit_test(Mock())
+            oxy.visit_test(self.test)
 
         exception_message = str(ex.exception)
         for expected in ('different',
@@ -37,13 +47,87 @@ class TestOxygen(TestCase):
             self.assertIn(expected, exception_message)
 
     def test_single_exception_raised_directly(self):
-        m = Mock()
-        m.check_for_keyword.side_effect = [CustomUserException('single')]
-        oxy = OxygenVisitor('fakedata')
-        oxy._handlers = {'fake_handler': m}
+        oxy = OxygenVisitor(self.data)
+        oxy._handlers = {'fake_handler': self.fake_handler(
+            'run_junit', CustomUserException('single'))}
 
         with self.assertRaises(CustomUserException) as ex:
-            oxy.visit_test(Mock())
+            oxy.visit_test(self.test)
 
         self.assertIn('single', str(ex.exception))
-        self.assertEqual(oxy.data, 'fakedata')
+        self.assertEqual(oxy.data, self.data)
+
+    def test_only_handlers_of_used_keywords_are_called(self):
+        junit = self.fake_handler('run_junit')
+        gatling = self.fake_handler('run_gatling')
+        oxy = OxygenVisitor(self.data)
+        oxy._handlers = {'junit': junit, 'gatling': gatling}
+
+        oxy.visit_test(self.test)
+
+        junit._replace_test.assert_called_once()
+        _, data, keywords, index = junit._replace_test.call_args[0]
+        self.assertEqual(data, self.data)
+        self.assertEqual(index, 2)
+        self.assertTrue(keywords[index].name.endswith('Run Junit'))
+        gatling._replace_test.assert_not_called()
+
+    def test_tests_without_run_time_data_are_skipped(self):
+        junit = self.fake_handler('run_junit')
+        oxy = OxygenVisitor({})
+        oxy._handlers = {'junit': junit}
+
+        oxy.visit_test(self.test)
+        oxy.parse_test_results(self.test)
+
+        junit._replace_test.assert_not_called()
+        junit._start_parsing.assert_not_called()
+
+    def test_suites_without_oxygen_tests_are_not_visited(self):
+        top = TestSuite(name='Top')
+        top.suites.create(name='Sub').tests.create(name='Test')
+        other = top.suites.create(name='Other')
+        other.tests.create(name='Test')
+        other.suites.create(name='Deeper').tests.create(name='Test')
+        oxy = OxygenVisitor({'Top.Sub.Test': 'data'})
+        oxy._handlers = {}
+
+        with patch.object(OxygenVisitor, 'visit_test') as mock_visit_test, \
+                patch.object(OxygenVisitor, 'end_suite') as mock_end_suite:
+            top.visit(oxy)
+
+        self.assertEqual(
+            [c[0][0].longname for c in mock_visit_test.call_args_list],
+            ['Top.Sub.Test'])
+        self.assertEqual(
+            [c[0][0].longname for c in mock_end_suite.call_args_list],
+            ['Top.Sub', 'Top'])
+
+    def test_affected_suites_follow_growing_data(self):
+        oxy = OxygenVisitor({'Top.Sub.Test': 'data'})
+        self.assertEqual(oxy.affected_suites, {'Top', 'Top.Sub'})
+
+        oxy.data['Top.Another.Test'] = 'data'
+
+        self.assertEqual(oxy.affected_suites, {'Top', 'Top.Sub', 'Top.Another'})
+
+    def test_tests_are_replaced_at_end_of_suite(self):
+        top = TestSuite(name='Top')
+        for name in ('First', 'Second', 'Third'):
+            top.tests.create(name=name)
+        oxy = OxygenVisitor({'Top.First': 'data', 'Top.Third': 'data'})
+        handler = self.fake_handler('run_junit')
+        oxy._handlers = {'junit': handler}
+        def replace(test, *_, batch=None):
+            self.assertEqual(len(top.tests), 3)
+            batch.append((test, TestSuite(name=test.name)))
+        handler._replace_test.side_effect = replace
+
+        with patch('oxygen.oxygen.get_keywords_from',
+                   return_value=[Mock(name='keyword')]), \
+                patch('oxygen.oxygen.normalize_keyword_name',
+                      return_value='run_junit'):
+            top.visit(oxy)
+
+        self.assertEqual([t.name for t in top.tests], ['Second'])
+        self.assertEqual([s.name for s in top.suites], ['First', 'Third'])
@@ -34,15 +34,15 @@ class TestDeprecationWarningWhenValidating(TestCase):
 
         self._validate_warning_msg(warning, 'oxygen.base_handler')
 
-    @patch('oxygen.oxygen.RobotInterface')
-    def test_warning_about_invalid_result_in_CLI(self, mock_iface):
+    @patch('oxygen.oxygen.RobotOutputWriter')
+    def test_warning_about_invalid_result_in_CLI(self, mock_writer):
         with self.assertWarns(UserWarning) as warning:
             self.cli.convert_to_robot_result({
                 'result_file': 'doesentmatter',
                 'func': lambda **_: {**MINIMAL_SUITE_DICT, 'setup': []}
             })
 
-        mock_iface.assert_any_call()
+        mock_writer.assert_any_call()
         # this one has weird name because we fake `func` with lambda
         self._validate_warning_msg(warning, 'test_deprecation_warning')
 
@@ -0,0 +1,237 @@
+from unittest import TestCase
+
+from oxygen.base_handler import BaseHandler
+from oxygen.oxygen_handler_result import (has_lazy_parts,
+                                          OxygenResultValidator,
+                                          read_oxygen_suite)
+
+from ..helpers import (get_config, lazy_suite, MINIMAL_KEYWORD_DICT,
+                       MINIMAL_SUITE_DICT, MINIMAL_TC_DICT)
+
+INVALID_TC_DICT = {'name': 'Invalid TC', 'keywords': [{'name': 'no pass'}]}
+
+
+class Tests(object):
+    '''An iterable that is neither a list nor an iterator'''
+
+    def __init__(self, *items):
+        self._items = items
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class TestOxygenResultValidator(TestCase):
+
+    def setUp(self):
+        self.validator = OxygenResultValidator(max_errors=3)
+
+    def test_valid_results(self):
+        self.assertTrue(self.validator.validate(
+            {'name': 'Suite',
+             'setup': MINIMAL_KEYWORD_DICT,
+             'suites': [{'name': 'Subsuite', 'tests': [MINIMAL_TC_DICT]}],
+             'tests': [MINIMAL_TC_DICT]}))
+        self.assertEqual(self.validator.errors, [])
+
+    def test_errors_have_json_pointers(self):
+        self.validator.validate(
+            {'name': 'Suite',
+             'setup': [],
+             'metadata': {'a/b': 1},
+             'suites': [{'name': 'Subsuite',
+                         'tests': [MINIMAL_TC_DICT, INVALID_TC_DICT]}]})
+
+        self.assertEqual(self.validator.errors, [
+            ('/setup', 'Input should be a valid dictionary'),
+            ('/metadata/a~1b', 'Input should be a valid string'),
+            ('/suites/0/tests/1/keywords/0/pass', 'Field required')])
+
+    def test_deeply_nested_keywords(self):
+        keyword = {'name': 'deepest'}
+        for _ in range(2000):
+            keyword = {'name': 'kw', 'pass': True, 'keywords': [keyword]}
+        test = {'name': 'TC', 'keywords': [keyword], 'teardown': keyword}
+
+        self.assertFalse(self.validator.validate(
+            {'name': 'Suite', 'setup': keyword, 'tests': [test]}))
+
+        depth = '/keywords/0' * 2000
+        self.assertEqual(self.validator.errors, [
+            (f'/setup{depth}/pass', 'Field required'),
+            (f'/tests/0/keywords/0{depth}/pass', 'Field required'),
+            (f'/tests/0/teardown{depth}/pass', 'Field required')])
+
+    def test_reported_errors_are_capped(self):
+        self.validator.validate({'name': 'Suite',
+                                 'tests': [INVALID_TC_DICT] * 1000})
+
+        self.assertEqual(self.validator.error_count, 1000)
+        self.assertEqual(len(self.validator.errors), 3)
+        summary = self.validator.summary().splitlines()
+        self.assertEqual(len(summary), 5)
+        self.assertIn('1000 validation errors', summary[0])
+        self.assertEqual(summary[1],
+                         '  #/tests/0/keywords/0/pass: Field required')
+        self.assertEqual(summary[-1], '  ... and 997 more')
+
+    def test_invalid_children_are_errors_of_their_suite(self):
+        self.validator.validate({'name': 'Suite', 'tests': {}, 'suites': 'a'})
+
+        self.assertEqual([pointer for pointer, _ in self.validator.errors],
+                         ['/suites', '/tests'])
+
+    def test_wrapped_results_are_validated_as_they_are_read(self):
+        read = []
+
+        def tests():
+            for test in (MINIMAL_TC_DICT, INVALID_TC_DICT):
+                read.append(test)
+                yield test
+
+        suite = self.validator.wrap({'name': 'Suite',
+                                     'suites': iter([{'name': 'Subsuite',
+                                                      'tests': tests()}])})
+        self.assertEqual(read, [])
+        self.assertTrue(self.validator.valid)
+
+        subsuite, = suite['suites']
+        self.assertEqual(next(subsuite['tests']), MINIMAL_TC_DICT)
+        self.assertTrue(self.validator.valid)
+        self.assertEqual(list(subsuite['tests']), [INVALID_TC_DICT])
+        self.assertFalse(self.validator.finish())
+        self.assertEqual(self.validator.errors,
+                         [('/suites/0/tests/1/keywords/0/pass',
+                           'Field required')])
+
+    def test_validate_reads_lazy_results(self):
+        self.assertFalse(self.validator.validate(
+            {'name': 'Suite',
+             'tests': (test for test in [MINIMAL_TC_DICT, INVALID_TC_DICT])}))
+
+    def test_any_iterable_but_strings_and_dicts_are_read(self):
+        self.assertFalse(self.validator.validate(
+            {'name': 'Suite',
+             'suites': ({'name': 'Subsuite',
+                         'tests': Tests(MINIMAL_TC_DICT, INVALID_TC_DICT)},),
+             'tests': Tests(MINIMAL_TC_DICT)}))
+        self.assertEqual(self.validator.errors,
+                         [('/suites/0/tests/1/keywords/0/pass',
+                           'Field required')])
+
+        for tests in ('tests', {'name': 'TC', 'keywords': []}):
+            validator = OxygenResultValidator()
+            self.assertFalse(validator.validate({'name': 'Suite',
+                                                 'tests': tests}))
+            self.assertEqual(validator.errors[0][0], '/tests')
+
+    def test_sample_is_bounded(self):
+        validator = OxygenResultValidator(sample_size=10)
+        suite = validator.wrap({'name': 'Suite',
+                                'tests': [INVALID_TC_DICT] * 1000})
+
+        for _ in suite['tests']:
+            self.assertLessEqual(len(validator._sample), 10)
+        self.assertTrue(validator.valid)
+        self.assertFalse(validator.finish())
+        self.assertEqual(validator.error_count, 10)
+
+    def test_callbacks_when_wrapped_results_are_read(self):
+        read, finished = [], []
+        suite = self.validator.wrap(lazy_suite(MINIMAL_SUITE_DICT),
+                                    on_read=lambda *item: read.append(item),
+                                    on_finish=lambda: finished.append(True))
+
+        self.assertEqual(read_oxygen_suite(suite), MINIMAL_SUITE_DICT)
+        self.assertEqual(finished, [True])
+        self.assertEqual([pointer for pointer, _ in read],
+                         ['', '/suites/0', '/suites/0/tests/0'])
+        self.assertEqual(read[1][1], {'name': 'Minimal Subsuite',
+                                      'tests': []})
+
+    def test_callback_when_reading_stops_halfway(self):
+        abandoned, finished = [], []
+        suite = self.validator.wrap(lazy_suite(MINIMAL_SUITE_DICT),
+                                    on_finish=lambda: finished.append(True),
+                                    on_abandon=lambda: abandoned.append(True))
+
+        next(suite['suites'])
+        suite['suites'].close()
+
+        self.assertEqual(abandoned, [True])
+        self.assertEqual(finished, [])
+
+    def test_results_without_children_are_read_right_away(self):
+        finished = []
+
+        self.validator.wrap({'name': 'Suite'},
+                            on_finish=lambda: finished.append(True))
+
+        self.assertEqual(finished, [True])
+
+
+class TestReadingLazyResults(TestCase):
+
+    def test_child_suites_are_read_before_tests(self):
+        order = []
+
+        def tests(suite):
+            order.append(suite)
+            yield {'name': f'{suite} test', 'keywords': []}
+
+        def suites(names):
+            for name in names:
+                order.append(name)
+                yield {'name': name, 'tests': tests(name)}
+
+        suite = {'name': 'root',
+                 'suites': suites(['a', 'b']),
+                 'tests': tests('root')}
+        read = read_oxygen_suite(suite)
+
+        self.assertEqual(order, ['a', 'a', 'b', 'b', 'root'])
+        self.assertEqual([test['name'] for test in read['tests']],
+                         ['root test'])
+
+    def test_has_lazy_parts(self):
+        self.assertFalse(has_lazy_parts(MINIMAL_SUITE_DICT))
+        self.assertTrue(has_lazy_parts(lazy_suite(MINIMAL_SUITE_DICT)))
+        self.assertTrue(has_lazy_parts(
+            {'name': 'Root',
+             'suites': [{'name': 'Child', 'tests': iter([])}]}))
+        self.assertFalse(has_lazy_parts(
+            {'name': 'Root',
+             'suites': ({'name': 'Child', 'tests': (MINIMAL_TC_DICT,)},)}))
+        self.assertTrue(has_lazy_parts(
+            {'name': 'Root',
+             'suites': ({'name': 'Child', 'tests': Tests(MINIMAL_TC_DICT)},)}))
+        self.assertFalse(has_lazy_parts({'name': 'Root', 'tests': 'tests'}))
+
+    def test_any_iterable_is_read_into_lists(self):
+        read = read_oxygen_suite(
+            {'name': 'Root',
+             'suites': Tests({'name': 'Child',
+                              'tests': Tests(MINIMAL_TC_DICT)}),
+             'tests': (MINIMAL_TC_DICT,)})
+
+        self.assertEqual(read, {'name': 'Root',
+                                'suites': [{'name': 'Child',
+                                            'tests': [MINIMAL_TC_DICT]}],
+                                'tests': [MINIMAL_TC_DICT]})
+
+
+class TestAggregatedWarning(TestCase):
+
+    def test_one_warning_for_all_errors(self):
+        handler = BaseHandler(get_config()['oxygen.junit'])
+
+        with self.assertWarns(UserWarning) as warnings:
+            handler._validate({'name': 'Suite',
+                               'tests': [INVALID_TC_DICT] * 100})
+
+        self.assertEqual(len(warnings.warnings), 1)
+        message = str(warnings.warning)
+        self.assertIn('100 validation errors', message)
+        self.assertIn('#/tests/9/keywords/0/pass: Field required', message)
+        self.assertNotIn('#/tests/10/', message)
+        self.assertIn('... and 90 more', message)
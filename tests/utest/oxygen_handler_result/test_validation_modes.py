@@ -0,0 +1,104 @@
+from unittest import TestCase
+from unittest.mock import patch
+from warnings import catch_warnings, simplefilter
+
+from oxygen import oxygen_handler_result
+from oxygen.base_handler import BaseHandler
+from oxygen.errors import (InvalidConfigurationException,
+                           InvalidOxygenResultException)
+from oxygen.oxygen_handler_result import (validate_oxygen_suite,
+                                          validate_oxygen_suite_sample)
+
+from ..helpers import get_config, MINIMAL_TC_DICT
+
+INVALID_TC_DICT = {'name': 'Invalid TC', 'keywords': [{'name': 'no pass'}]}
+
+
+def suite_with(*tests):
+    return {'name': 'Suite',
+            'suites': [{'name': 'Subsuite', 'tests': list(tests)}]}
+
+
+class TestCachedTypeAdapters(TestCase):
+
+    def test_adapter_is_built_once(self):
+        oxygen_handler_result._type_adapter.cache_clear()
+        with patch.object(oxygen_handler_result, 'TypeAdapter',
+                          wraps=oxygen_handler_result.TypeAdapter) as adapter:
+            for _ in range(3):
+                validate_oxygen_suite(suite_with(MINIMAL_TC_DICT))
+
+        adapter.assert_called_once_with(
+            oxygen_handler_result.OxygenSuiteDict)
+
+
+class TestSampleValidation(TestCase):
+
+    def test_validates_sampled_tests_only(self):
+        suite = suite_with(MINIMAL_TC_DICT, INVALID_TC_DICT)
+
+        # the second test replaces the first one in the sample only when
+        # it is given index 0 out of 2
+        with patch('random.randrange', return_value=1):
+            validate_oxygen_suite_sample(suite, 1)
+        with patch('random.randrange', return_value=0):
+            with self.assertRaises(InvalidOxygenResultException):
+                validate_oxygen_suite_sample(suite, 1)
+
+    def test_validates_all_tests_when_sample_is_large_enough(self):
+        with self.assertRaises(InvalidOxygenResultException):
+            validate_oxygen_suite_sample(
+                suite_with(*[MINIMAL_TC_DICT] * 10, INVALID_TC_DICT), 11)
+
+    def test_always_validates_suites(self):
+        suite = suite_with(MINIMAL_TC_DICT)
+        suite['suites'].append({'name': 'Broken', 'setup': []})
+
+        with self.assertRaises(InvalidOxygenResultException):
+            validate_oxygen_suite_sample(suite, 1)
+        with self.assertRaises(InvalidOxygenResultException):
+            validate_oxygen_suite_sample({'name': 'Suite', 'tests': {}}, 1)
+
+    def test_does_not_modify_results(self):
+        suite = suite_with(MINIMAL_TC_DICT)
+
+        validate_oxygen_suite_sample(suite, 1)
+
+        self.assertEqual(suite, suite_with(MINIMAL_TC_DICT))
+
+
+class TestHandlerValidationModes(TestCase):
+
+    def handler(self, **config):
+        return BaseHandler(dict(get_config()['oxygen.junit'], **config))
+
+    def test_full_by_default(self):
+        handler = self.handler()
+
+        self.assertEqual(handler.validation, 'full')
+        with self.assertWarns(UserWarning):
+            self.assertFalse(handler._validate(suite_with(INVALID_TC_DICT)))
+
+    def test_sample(self):
+        handler = self.handler(validation='sample', validation_sample_size=2)
+
+        self.assertTrue(handler._validate(suite_with(*[MINIMAL_TC_DICT] * 5)))
+        with self.assertWarns(UserWarning) as warning:
+            self.assertFalse(
+                handler._validate(suite_with(*[INVALID_TC_DICT] * 5)))
+        self.assertIn('2 validation errors', str(warning.warning))
+
+    def test_off(self):
+        handler = self.handler(validation='off')
+
+        with catch_warnings():
+            simplefilter('error')
+            # not validated, so not known to be valid either
+            self.assertFalse(handler._validate(suite_with(INVALID_TC_DICT)))
+
+    def test_invalid_configuration(self):
+        for config in ({'validation': 'some'},
+                       {'validation': 'sample', 'validation_sample_size': 0},
+                       {'validation_sample_size': 'all'}):
+            with self.assertRaises(InvalidConfigurationException):
+                self.handler(**config)
@@ -0,0 +1,207 @@
+from math import ceil
+from random import Random
+from unittest import TestCase
+
+from oxygen.response_times import (ResponseTimeAssertion,
+                                   ResponseTimeHistogram,
+                                   ResponseTimeStatistics)
+
+
+class TestResponseTimeHistogram(TestCase):
+
+    def _exact(self, times, percent):
+        times = sorted(times)
+        return times[max(ceil(percent / 100 * len(times)), 1) - 1]
+
+    def test_short_times_are_exact(self):
+        histogram = ResponseTimeHistogram()
+        times = list(range(2000)) * 3
+
+        for time in times:
+            histogram.add(time)
+
+        for percent in (0, 1, 50, 75, 95, 99, 100):
+            self.assertEqual(histogram.percentile(percent),
+                             self._exact(times, percent))
+
+    def test_long_times_have_small_relative_error(self):
+        rng = Random(19)
+        histogram = ResponseTimeHistogram()
+        times = [rng.randint(0, 10**6) for _ in range(10000)]
+
+        for time in times:
+            histogram.add(time)
+
+        for percent in (50, 75, 95, 99, 100):
+            exact = self._exact(times, percent)
+            self.assertLessEqual(abs(histogram.percentile(percent) - exact),
+                                 exact / ResponseTimeHistogram.SUB_BUCKETS)
+
+    def test_memory_does_not_grow_with_count(self):
+        histogram = ResponseTimeHistogram()
+
+        for time in range(100000):
+            histogram.add(time % 5000)
+
+        self.assertEqual(histogram.count, 100000)
+        self.assertLess(len(histogram.counts), 5000)
+
+    def test_merging(self):
+        first, second, both = (ResponseTimeHistogram() for _ in range(3))
+        for time in range(0, 10000, 7):
+            first.add(time)
+            both.add(time)
+        for time in range(5000, 20000, 3):
+            second.add(time)
+            both.add(time)
+
+        first.merge(second)
+
+        self.assertEqual(first.counts, both.counts)
+        self.assertEqual(first.count, both.count)
+
+    def test_empty(self):
+        self.assertIsNone(ResponseTimeHistogram().percentile(50))
+
+
+class TestResponseTimeStatistics(TestCase):
+
+    def test_statistics(self):
+        statistics = ResponseTimeStatistics()
+        for elapsed in range(1, 101):
+            statistics.add(1000 + elapsed, 1000 + 2 * elapsed, elapsed % 10,
+                           'timeout')
+
+        self.assertEqual((statistics.count, statistics.ko_count,
+                          statistics.min, statistics.mean, statistics.max),
+                         (100, 10, 1, 50.5, 100))
+        self.assertEqual((statistics.start, statistics.end), (1001, 1200))
+        self.assertEqual(statistics.percentiles(),
+                         [(50, 50), (75, 75), (95, 95), (99, 99)])
+        self.assertEqual(statistics.summary(),
+                         ['Requests: 100, OK: 90, KO: 10 (10.00%)',
+                          'Response time (ms): min 1, mean 50.5, max 100',
+                          'Percentiles (ms): p50 50, p75 75, p95 95, p99 99',
+                          'KO (10): timeout'])
+        self.assertEqual(statistics.metadata(),
+                         {'Requests': '100',
+                          'KO': '10 (10.00%)',
+                          'Response time (ms)': 'min 1, mean 50.5, max 100',
+                          'Percentiles (ms)': 'p50 50, p75 75, p95 95, '
+                                              'p99 99'})
+
+    def test_distinct_messages_are_bounded(self):
+        statistics = ResponseTimeStatistics()
+
+        for i in range(ResponseTimeStatistics.MAX_MESSAGES + 5):
+            statistics.add(0, 10, False, f'error {i}')
+        statistics.add(0, 10, False, 'error 0')
+
+        self.assertEqual(len(statistics.messages),
+                         ResponseTimeStatistics.MAX_MESSAGES)
+        self.assertEqual(statistics.messages['error 0'], 2)
+        self.assertEqual(statistics.other_messages, 5)
+        self.assertEqual(statistics.summary()[-1], 'KO (5): other messages')
+
+    def test_merging(self):
+        first, second, both = (ResponseTimeStatistics() for _ in range(3))
+        for start in range(0, 1000, 10):
+            first.add(start, start + start % 37, start % 3, 'a')
+            both.add(start, start + start % 37, start % 3, 'a')
+        for start in range(500, 3000, 7):
+            second.add(start, start + start % 91, start % 5, 'b')
+            both.add(start, start + start % 91, start % 5, 'b')
+
+        first.merge(second)
+        first.merge(ResponseTimeStatistics())
+
+        self.assertEqual(first.summary(), both.summary())
+        self.assertEqual((first.start, first.end), (both.start, both.end))
+
+    def test_empty(self):
+        statistics = ResponseTimeStatistics()
+
+        self.assertEqual(statistics.summary(), ['Requests: 0'])
+        self.assertEqual(statistics.metadata(), {'Requests': '0'})
+
+
+class TestThroughput(TestCase):
+
+    def test_over_the_whole_run(self):
+        statistics = ResponseTimeStatistics()
+        for index in range(100):
+            statistics.add(index * 100, index * 100 + 100, True)
+
+        self.assertEqual(statistics.throughput(), 10.0)
+
+    def test_slowest_full_window(self):
+        statistics = ResponseTimeStatistics(window=1)
+        for end in (range(500, 1000, 100), range(1000, 2000, 50),
+                    range(3000, 4000, 200), range(4000, 4500, 10)):
+            for time in end:
+                statistics.add(time - 10, time, True)
+
+        # windows 1..3 are full, and window 2 has no requests at all
+        self.assertEqual(statistics.throughput(), 0.0)
+        statistics.add(2500, 2510, True)
+        self.assertEqual(statistics.throughput(), 1.0)
+
+    def test_without_full_windows(self):
+        statistics = ResponseTimeStatistics(window=10)
+        for index in range(10):
+            statistics.add(index * 100, index * 100 + 100, True)
+
+        self.assertEqual(statistics.throughput(), 10.0)
+
+    def test_cannot_be_measured(self):
+        statistics = ResponseTimeStatistics()
+        self.assertIsNone(statistics.throughput())
+        statistics.add(100, 100, True)
+        self.assertIsNone(statistics.throughput())
+
+
+class TestResponseTimeAssertion(TestCase):
+
+    def setUp(self):
+        self.statistics = ResponseTimeStatistics()
+        for elapsed in range(1, 101):
+            self.statistics.add(elapsed * 10, elapsed * 10 + elapsed,
+                                elapsed > 2, 'timeout')
+
+    def test_names(self):
+        self.assertEqual(
+            [ResponseTimeAssertion(*args).name for args in
+             (('p95', 500), ('mean', 200.5, 'Home'), ('error_rate', 0.5),
+              ('throughput', 20), ('throughput', 20, 'Home', 10))],
+            ['p95 <= 500 ms', 'mean of Home <= 200.5 ms',
+             'error rate <= 0.5%', 'throughput >= 20 req/s',
+             'throughput of Home >= 20 req/s in every 10 s'])
+
+    def test_checks(self):
+        self.assertEqual(
+            [ResponseTimeAssertion(metric, limit).check(self.statistics)
+             for metric, limit in (('p95', 95), ('p99.9', 99), ('max', 100),
+                                   ('mean', 50), ('error_rate', 2),
+                                   ('error_rate', 1.99), ('throughput', 91),
+                                   ('throughput', 92))],
+            [(True, 'Measured 95 ms over 100 requests'),
+             (False, 'Measured 100 ms over 100 requests'),
+             (True, 'Measured 100 ms over 100 requests'),
+             (False, 'Measured 50.5 ms over 100 requests'),
+             (True, 'Measured 2.00% (2 of 100 requests KO)'),
+             (False, 'Measured 2.00% (2 of 100 requests KO)'),
+             (True, 'Measured 91.7 req/s over 100 requests'),
+             (False, 'Measured 91.7 req/s over 100 requests')])
+
+    def test_without_requests(self):
+        self.assertEqual(
+            ResponseTimeAssertion('p95', 1, 'Home').check(
+                ResponseTimeStatistics()),
+            (False, 'No requests named Home'))
+
+    def test_invalid(self):
+        for args in (('p0', 1), ('pxx', 1), ('median', 1), ('p95', '1 s'),
+                     ('p95', True), ('p95', 1, None, 10),
+                     ('throughput', 1, None, 0)):
+            with self.assertRaises(ValueError):
+                ResponseTimeAssertion(*args)
@@ -0,0 +1,87 @@
+from sys import getrecursionlimit
+from unittest import TestCase
+
+from oxygen.robot_interface import RobotInterface, get_keywords_from
+
+
+DEPTH = max(10000, getrecursionlimit() * 2)
+
+
+def keyword(name, elapsed=0.0, keywords=None, teardown=None):
+    return {'name': name,
+            'pass': True,
+            'elapsed': elapsed,
+            'keywords': keywords or [],
+            'teardown': teardown or {}}
+
+
+def sub_keywords(robot_keyword):
+    sub_keywords = list(get_keywords_from(robot_keyword))
+    teardown = getattr(robot_keyword, 'teardown', None)
+    if teardown and teardown not in sub_keywords:
+        sub_keywords.append(teardown)
+    return sub_keywords
+
+
+class TestDeepNesting(TestCase):
+
+    def setUp(self):
+        self.iface = RobotInterface()
+
+    def test_keywords_nested_deeper_than_recursion_limit(self):
+        nested = keyword('level 0', elapsed=1)
+        for level in range(1, DEPTH):
+            nested = keyword(f'level {level}', keywords=[nested])
+
+        end_time, robot_keyword = self.iface.result.build_keyword(1000,
+                                                                  nested)
+
+        self.assertEqual(end_time, 1001)
+        depth = 1
+        while sub_keywords(robot_keyword):
+            robot_keyword, = sub_keywords(robot_keyword)
+            depth += 1
+        self.assertEqual(depth, DEPTH)
+        self.assertEqual(robot_keyword.name, 'level 0')
+
+    def test_teardowns_nested_deeper_than_recursion_limit(self):
+        nested = keyword('teardown', elapsed=1)
+        for level in range(DEPTH):
+            nested = keyword(f'level {level}',
+                             keywords=[keyword('step', elapsed=1)],
+                             teardown=nested)
+
+        end_time, robot_keyword = self.iface.result.build_keyword(1000,
+                                                                  nested)
+
+        # every level runs a step before its teardown starts
+        self.assertEqual(end_time, 1000 + DEPTH + 1)
+        depth = 0
+        while sub_keywords(robot_keyword):
+            step, robot_keyword = sub_keywords(robot_keyword)
+            self.assertEqual(step.name, 'step')
+            depth += 1
+        self.assertEqual(depth, DEPTH)
+        self.assertEqual(robot_keyword.name, 'teardown')
+
+    def test_suites_nested_deeper_than_recursion_limit(self):
+        nested = {'name': 'suite 0',
+                  'tests': [{'name': 'test',
+                             'keywords': [keyword('step', elapsed=1)]}]}
+        for level in range(1, DEPTH):
+            nested = {'name': f'suite {level}',
+                      'suites': [nested],
+                      'tests': [{'name': 'test',
+                                 'keywords': [keyword('step', elapsed=1)]}]}
+
+        end_time, robot_suite = self.iface.result.build_suite(1000, nested)
+
+        # child suites are built before the tests of their parent
+        self.assertEqual(end_time, 1000 + DEPTH)
+        depth = 1
+        while robot_suite.suites:
+            self.assertEqual(len(robot_suite.tests), 1)
+            robot_suite, = robot_suite.suites
+            depth += 1
+        self.assertEqual(depth, DEPTH)
+        self.assertEqual(robot_suite.name, 'suite 0')
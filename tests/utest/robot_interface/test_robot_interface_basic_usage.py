@@ -7,6 +7,7 @@ from robot.result.model import (Keyword as RobotKeyword,
                                 TestSuite as RobotSuite)
 
 from robot.running.model import TestSuite as RobotRunningSuite
+from robot.version import get_version as robot_version
 
 from oxygen.robot_interface import RobotInterface, get_keywords_from
 
@@ -203,6 +204,28 @@ class RobotInterfaceBasicTests(TestCase):
             from robot.model import BodyItem
             self.assertEqual(ret.type, BodyItem.SETUP)
 
+    def test_result_create_wrapper_keyword_keeps_times(self):
+        ret = self.iface.result.create_wrapper_keyword('My Wrapper',
+                                                       '20200507 13:42:50.001',
+                                                       '20200507 14:59:01.999',
+                                                       True,
+                                                       RobotKeyword())
+
+        # RF < 7 keeps all six digits of the fractions
+        self.assertEqual(ret.starttime[:21], '20200507 13:42:50.001')
+        self.assertEqual(ret.endtime[:21], '20200507 14:59:01.999')
+
+    def test_interface_matches_robot_framework_version(self):
+        major_version = int(robot_version().split('.')[0])
+        if major_version > 6:
+            expected = 'oxygen.robot7_interface'
+        elif major_version > 3:
+            expected = 'oxygen.robot4_interface'
+        else:
+            expected = 'oxygen.robot3_interface'
+
+        self.assertEqual(type(self.iface.result).__module__, expected)
+
     def validate_metadata(self, actual):
         self.assertEqual(actual.name, EXAMPLE_SUITES[0]['name'])
         self.assertEqual(dict(actual.metadata), EXAMPLE_SUITES[0]['metadata'])
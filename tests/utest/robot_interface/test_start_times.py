@@ -0,0 +1,90 @@
+from datetime import datetime
+from unittest import TestCase
+
+from oxygen.robot_interface import RobotInterface, get_keywords_from
+
+
+def keyword(name, elapsed, start=None):
+    keyword = {'name': name, 'pass': True, 'elapsed': elapsed}
+    if start is not None:
+        keyword['start'] = start
+    return keyword
+
+
+class TestStartTimes(TestCase):
+
+    def setUp(self):
+        self.result = RobotInterface().result
+        # 2020-05-18 12:41:01 local time
+        self.local = datetime(2020, 5, 18, 12, 41, 1)
+        self.start = self.local.timestamp() * 1000
+
+    def timestamp(self, milliseconds):
+        return self.result.ms_to_timestamp(milliseconds)
+
+    def test_from_epoch_keeps_local_time(self):
+        start_time = self.result.timestamps.from_epoch(self.start)
+
+        self.assertEqual(self.timestamp(start_time)[:21],
+                         '20200518 12:41:01.000')
+        self.assertEqual(self.timestamp(
+            self.result.timestamps.from_epoch(1589805661000))[:21],
+            self.timestamp(self.result.timestamp_to_ms(
+                datetime.fromtimestamp(1589805661).strftime(
+                    '%Y%m%d %H:%M:%S.%f')))[:21])
+
+    def test_keyword_starts_at_start(self):
+        end_time, robot_keyword = self.result.build_keyword(
+            100000, keyword('kw', 250, start=self.start))
+
+        start_time = self.result.timestamps.from_epoch(self.start)
+        self.assertEqual(end_time, start_time + 250)
+        self.assertEqual(str(robot_keyword.starttime)[:21],
+                         '20200518 12:41:01.000')
+        self.assertEqual(str(robot_keyword.endtime)[:21],
+                         '20200518 12:41:01.250')
+
+    def test_items_without_start_follow_the_previous_one(self):
+        _, robot_test = self.result.build_test(
+            100000, {'name': 'test',
+                     'start': self.start,
+                     'keywords': [keyword('first', 250),
+                                  keyword('second', 100)]})
+
+        first, second = get_keywords_from(robot_test)
+        self.assertEqual(second.starttime, first.endtime)
+        self.assertEqual(str(robot_test.starttime)[:21],
+                         '20200518 12:41:01.000')
+        self.assertEqual(str(robot_test.endtime)[:21],
+                         '20200518 12:41:01.350')
+
+    def test_timeline_does_not_move_backwards(self):
+        later = self.start + 10000
+        _, robot_test = self.result.build_test(
+            100000, {'name': 'test',
+                     'keywords': [keyword('first', 250, start=later),
+                                  keyword('earlier', 100, start=self.start),
+                                  keyword('last', 100)]})
+
+        first, earlier, last = get_keywords_from(robot_test)
+        self.assertEqual(str(earlier.starttime)[:21], '20200518 12:41:01.000')
+        self.assertEqual(last.starttime, first.endtime)
+        self.assertEqual(robot_test.endtime, last.endtime)
+
+    def test_suites_and_tests_start_at_start(self):
+        end_time, robot_suite = self.result.build_suite(100000, {
+            'name': 'suite',
+            'suites': [{'name': 'child',
+                        'start': self.start,
+                        'tests': [{'name': 'test',
+                                   'start': self.start + 1000,
+                                   'keywords': [keyword('kw', 250)]}]}]})
+
+        child, = robot_suite.suites
+        test, = child.tests
+        self.assertEqual(str(child.starttime)[:21], '20200518 12:41:01.000')
+        self.assertEqual(str(test.starttime)[:21], '20200518 12:41:02.000')
+        self.assertEqual(child.endtime, test.endtime)
+        self.assertEqual(robot_suite.endtime, test.endtime)
+        self.assertEqual(
+            end_time, self.result.timestamps.from_epoch(self.start) + 1250)
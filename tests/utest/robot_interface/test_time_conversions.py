@@ -1,9 +1,10 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from random import Random
 from unittest import TestCase
 
 from mock import patch
 
-from oxygen.robot_interface import RobotInterface
+from oxygen.robot_interface import RobotInterface, TimestampFormatter
 
 
 class TestMsToTimestamp(TestCase):
@@ -72,3 +73,69 @@ class TestTimestampToMs(TestCase):
 
         timestamp = self.iface.result.ms_to_timestamp(milliseconds)
         self.assertEqual(timestamp, '20180807 07:01:24.300000')
+
+
+class TestTimestampFormatter(TestCase):
+    def setUp(self):
+        self.iface = RobotInterface().result
+
+    def slow_ms_to_timestamp(self, milliseconds):
+        '''The conversion before timestamps were memoized, with seconds
+        before the epoch floored like the milliseconds after them'''
+        tz_delta = self.iface.get_timezone_delta()
+        time_object = datetime.fromtimestamp(milliseconds // 1000) - tz_delta
+        if time_object.year < 1970:
+            time_object = datetime.fromtimestamp(0)
+        time_object += timedelta(milliseconds=(milliseconds % 1000))
+        return time_object.strftime('%Y%m%d %H:%M:%S.%f')
+
+    def test_same_timestamps_as_before(self):
+        rand = Random(1533625284)
+        values = [0, -10, -1500, 999.9996, 1533625284999.9999, 1533625284000,
+                  1533625284012.5, 1533625284012.25]
+        values += [rand.uniform(0, 2e12) for _ in range(1000)]
+        values += [rand.randrange(1533625284000, 1533625294000)
+                   for _ in range(1000)]
+        for value in values:
+            self.assertEqual(self.iface.ms_to_timestamp(value),
+                             self.slow_ms_to_timestamp(value), value)
+
+    def test_rounding_up_to_the_next_second(self):
+        formatter = TimestampFormatter(timedelta(0))
+        second = datetime.fromtimestamp(1533625285)
+
+        self.assertEqual(formatter.format(1533625284999.9999),
+                         second.strftime('%Y%m%d %H:%M:%S.000000'))
+        self.assertEqual(formatter.to_datetime(1533625284999.9999), second)
+
+    def test_seconds_before_the_epoch_are_floored(self):
+        formatter = TimestampFormatter(timedelta(hours=-14))
+        second = datetime.fromtimestamp(-2) + timedelta(hours=14)
+
+        self.assertEqual(formatter.format(-1500),
+                         second.strftime('%Y%m%d %H:%M:%S.500000'))
+        self.assertEqual(formatter.to_datetime(-1500),
+                         second + timedelta(milliseconds=500))
+
+    def test_timezone_offset_is_looked_up_once(self):
+        with patch.object(type(self.iface), 'get_timezone_delta') as m:
+            m.return_value = timedelta(0)
+            iface = type(self.iface)()
+            for milliseconds in range(0, 10000, 7):
+                iface.ms_to_timestamp(milliseconds)
+
+        m.assert_called_once_with()
+
+    def test_timezone_offset_is_refreshed_when_building(self):
+        with patch.object(type(self.iface), 'get_timezone_delta') as m:
+            m.return_value = timedelta(hours=2)
+            iface = type(self.iface)()
+            before = iface.timestamp_to_ms(
+                iface.ms_to_timestamp(1533625284000))
+            m.return_value = timedelta(hours=3)
+            iface.build_suite(1533625284000, {})
+            after = iface.timestamp_to_ms(
+                iface.ms_to_timestamp(1533625284000))
+
+        self.assertEqual(before, after)
+        self.assertEqual(iface.timestamps.tz_delta, timedelta(hours=3))
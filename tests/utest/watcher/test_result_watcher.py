@@ -0,0 +1,126 @@
+import os
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+from unittest.mock import Mock
+
+from oxygen.watcher import ResultWatcher, _Inotify
+
+from ..helpers import suppress_stderr
+
+
+class TestResultWatcher(TestCase):
+
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+        self.convert = Mock()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _watcher(self, **kwargs):
+        return ResultWatcher(self.directory, self.convert, **kwargs)
+
+    def _write(self, name, content='results'):
+        path = self.directory / name
+        path.write_text(content)
+        return path
+
+    def test_once_converts_every_result_file(self):
+        a = self._write('a.xml')
+        b = self._write('b.xml')
+
+        self._watcher().run(once=True)
+
+        self.assertEqual([c.args for c in self.convert.call_args_list],
+                         [(str(a),), (str(b),)])
+
+    def test_restart_does_not_convert_again(self):
+        self._write('a.xml')
+        self._watcher().run(once=True)
+        self.convert.reset_mock()
+
+        self._watcher().run(once=True)
+
+        self.convert.assert_not_called()
+
+    def test_changed_file_is_converted_again(self):
+        a = self._write('a.xml')
+        self._watcher().run(once=True)
+        self.convert.reset_mock()
+        a.write_text('more results')
+
+        self._watcher().run(once=True)
+
+        self.convert.assert_called_once_with(str(a))
+
+    def test_polling_waits_for_file_to_settle(self):
+        a = self._write('a.xml')
+        watcher = self._watcher()
+
+        self.assertFalse(watcher.check(a))
+        a.write_text('still being written')
+        self.assertFalse(watcher.check(a))
+        self.assertTrue(watcher.check(a))
+        self.assertFalse(watcher.check(a))
+        self.convert.assert_called_once_with(str(a))
+
+    def test_failing_file_is_reported_and_recorded(self):
+        self.convert.side_effect = ValueError('not a result file')
+        a = self._write('a.xml')
+
+        with suppress_stderr() as stderr:
+            self._watcher().run(once=True)
+
+        self.assertIn(f'converting "{a}" failed: not a result file',
+                      stderr.getvalue())
+        self.assertIn('a.xml', self._watcher().state)
+
+    def test_state_file_and_ignored_files_are_not_converted(self):
+        a = self._write('a.xml')
+        self._write('a_robot_output.xml')
+        state_file = self.directory / 'state.json'
+
+        self._watcher(state_file=state_file,
+                      ignore=lambda path: path.stem.endswith('_output')
+                      ).run(once=True)
+
+        self.convert.assert_called_once_with(str(a))
+        self.assertTrue(state_file.exists())
+
+    def test_unreadable_state_file_is_ignored(self):
+        (self.directory / ResultWatcher.STATE_FILE).write_text('{not json')
+
+        with suppress_stderr() as stderr:
+            watcher = self._watcher()
+
+        self.assertEqual(watcher.state, {})
+        self.assertIn('ignoring unreadable watch state file',
+                      stderr.getvalue())
+
+
+def inotify_available():
+    inotify = _Inotify.create(os.getcwd())
+    if inotify is None:
+        return False
+    inotify.close()
+    return True
+
+
+@skipIf(not inotify_available(), 'inotify is not available')
+class TestInotify(TestCase):
+
+    def test_completed_files_are_reported(self):
+        with TemporaryDirectory() as tmp:
+            inotify = _Inotify(tmp)
+            try:
+                self.assertEqual(inotify.read(0), [])
+                Path(tmp, 'a.xml').write_text('results')
+                Path(tmp, 'b.tmp').write_text('results')
+                Path(tmp, 'b.tmp').rename(Path(tmp, 'b.xml'))
+
+                self.assertEqual(inotify.read(1), ['a.xml', 'b.tmp', 'b.xml'])
+            finally:
+                inotify.close()
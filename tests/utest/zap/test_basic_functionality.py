@@ -5,7 +5,7 @@ from unittest.mock import ANY, create_autospec, Mock, mock_open, patch
 from testfixtures import compare
 
 from oxygen.errors import ZAProxyHandlerException
-from oxygen.oxygen_handler_result import validate_oxygen_suite
+from oxygen.oxygen_handler_result import read_oxygen_suite, validate_oxygen_suite
 from oxygen.zap import ZAProxyHandler
 
 from ..helpers import (example_robot_output,
@@ -278,7 +278,7 @@ class ZAPBasicTests(TestCase):
         mock_validate_path.assert_called_once_with('somefile')
         f.assert_called_once_with(m.resolve())
         self.assertNotNoneOrEmpty(ret['name'])
-        self.assertEqual(ret['suites'], [])
+        self.assertEqual(list(ret['suites']), [])
         self.assertEqual(ret['tags'], ['ZAP'])
 
     def test_parsing_json(self):
@@ -294,7 +294,7 @@ class ZAPBasicTests(TestCase):
         mock_validate_path.assert_called_once_with('somefile')
         f.assert_called_once_with(m.resolve())
         self.assertNotNoneOrEmpty(ret['name'])
-        self.assertEqual(ret['suites'], [])
+        self.assertEqual(list(ret['suites']), [])
         self.assertEqual(ret['tags'], ['ZAP'])
 
     def assertNotNoneOrEmpty(self, str_):
@@ -307,11 +307,14 @@ class ZAPBasicTests(TestCase):
 
         self.handler.check_for_keyword(fake_test, expected_data)
 
-        self.assertEqual(mock_report.call_args[0][0].name,
+        keyword = mock_report.call_args[0][0]
+        # RF 7 keeps the library name apart from the keyword name
+        self.assertEqual(getattr(keyword, 'full_name', keyword.name),
                          'oxygen.OxygenLibrary.Run Zap')
         self.assertEqual(self.handler.run_time_data, 'afile.ext')
 
     def test_zap_parsing(self):
-        retval = self.handler.parse_results(RESOURCES_PATH / 'zap' / 'zap.xml')
+        retval = read_oxygen_suite(
+            self.handler.parse_results(RESOURCES_PATH / 'zap' / 'zap.xml'))
         compare(retval, ZAP_EXPECTED_OUTPUT)
         self.assertTrue(validate_oxygen_suite(retval))
@@ -41,6 +41,8 @@ class TestParseZapDict(TestCase):
 
     def test_calls_down(self):
         return_dict = self.object._parse_zap_dict(self.params)
+        self.parser_mock.assert_not_called()
+        list(return_dict['suites'])
         self.parser_mock.assert_any_call(True)
         self.parser_mock.assert_any_call(False)
         assert(self.parser_mock.call_count == 2)
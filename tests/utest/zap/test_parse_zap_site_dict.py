@@ -19,6 +19,7 @@ class TestParseZapSiteDict(TestCase):
         assert('name' in return_dict)
         assert(return_dict['name'] == 'Site: Unknown Site Name')
         assert('tests' in return_dict)
+        list(return_dict['tests'])
         self._parser.assert_any_call(True)
         self._parser.assert_any_call(False)
         assert(self._parser.call_count == 2)
@@ -29,6 +30,7 @@ class TestParseZapSiteDict(TestCase):
         assert('name' in return_dict)
         assert(return_dict['name'] == 'Site: My Site Name')
         assert('tests' in return_dict)
+        list(return_dict['tests'])
         self._parser.assert_any_call(True)
         self._parser.assert_any_call(False)
         assert(self._parser.call_count == 2)
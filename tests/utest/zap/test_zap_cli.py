@@ -1,9 +1,7 @@
 import sys
 
 from unittest import TestCase
-from unittest.mock import ANY, Mock, create_autospec, patch
-
-from robot.running.model import TestSuite
+from unittest.mock import ANY, patch
 
 from oxygen.oxygen import OxygenCLI
 from ..helpers import RESOURCES_PATH
@@ -15,15 +13,10 @@ class TestOxygenZapCLI(TestCase):
     def setUp(self):
         self.cli = OxygenCLI()
         self.handler = self.cli.handlers["oxygen.zap"]
-        self.expected_suite = create_autospec(TestSuite)
-        self.mock = Mock()
-        self.mock.running.build_suite = Mock(return_value=self.expected_suite)
 
     def tearDown(self):
         self.cli = None
         self.handler = None
-        self.expected_suite = None
-        self.mock = None
 
     def test_cli(self):
         self.assertEqual(
@@ -41,10 +34,8 @@ class TestOxygenZapCLI(TestCase):
             },
         )
 
-    @patch("oxygen.oxygen.RobotInterface")
-    def test_cli_run(self, mock_robot_iface):
-        mock_robot_iface.return_value = self.mock
-
+    @patch("oxygen.oxygen.RobotOutputWriter")
+    def test_cli_run(self, mock_writer):
         cmd_args = f"oxygen oxygen.zap {self.ZAP_XML}"
         with patch.object(sys, "argv", cmd_args.split()):
             self.cli.run()
@@ -52,19 +43,12 @@ class TestOxygenZapCLI(TestCase):
         self.assertEqual(self.handler._config["accepted_risk_level"], 2)
         self.assertEqual(self.handler._config["required_confidence_level"], 1)
 
-        self.mock.running.build_suite.assert_called_once()
-
-        self.expected_suite.run.assert_called_once_with(
-            output=str(RESOURCES_PATH / "zap" / "zap_robot_output.xml"),
-            log=None,
-            report=None,
-            stdout=ANY,
+        mock_writer.return_value.write.assert_called_once_with(
+            str(RESOURCES_PATH / "zap" / "zap_robot_output.xml"), ANY, ANY
         )
 
-    @patch("oxygen.oxygen.RobotInterface")
-    def test_cli_run_with_levels(self, mock_robot_iface):
-        mock_robot_iface.return_value = self.mock
-
+    @patch("oxygen.oxygen.RobotOutputWriter")
+    def test_cli_run_with_levels(self, _):
         cmd_args = (
             f"oxygen oxygen.zap {self.ZAP_XML} --accepted-risk-level 3"
             " --required-confidence-level 3"
@@ -75,10 +59,8 @@ class TestOxygenZapCLI(TestCase):
         self.assertEqual(self.handler._config["accepted_risk_level"], 3)
         self.assertEqual(self.handler._config["required_confidence_level"], 3)
 
-    @patch("oxygen.oxygen.RobotInterface")
-    def test_cli_run_with_accepted_risk_level(self, mock_robot_iface):
-        mock_robot_iface.return_value = self.mock
-
+    @patch("oxygen.oxygen.RobotOutputWriter")
+    def test_cli_run_with_accepted_risk_level(self, _):
         cmd_args = f"oxygen oxygen.zap {self.ZAP_XML} --accepted-risk-level 3"
         with patch.object(sys, "argv", cmd_args.split()):
             self.cli.run()
@@ -86,10 +68,8 @@ class TestOxygenZapCLI(TestCase):
         self.assertEqual(self.handler._config["accepted_risk_level"], 3)
         self.assertEqual(self.handler._config["required_confidence_level"], 1)
 
-    @patch("oxygen.oxygen.RobotInterface")
-    def test_cli_run_with_required_confidence_level(self, mock_robot_iface):
-        mock_robot_iface.return_value = self.mock
-
+    @patch("oxygen.oxygen.RobotOutputWriter")
+    def test_cli_run_with_required_confidence_level(self, _):
         cmd_args = f"oxygen oxygen.zap {self.ZAP_XML} --required-confidence-level 3"
         with patch.object(sys, "argv", cmd_args.split()):
             self.cli.run()